@@ -0,0 +1,63 @@
+"""Pytest configuration and fixtures for benchmarks."""
+
+import sys
+
+import pytest
+from imgui_bundle import imgui, implot
+from loguru import logger
+
+from champi_gen_ui.core.canvas import Canvas, CanvasManager
+from champi_gen_ui.widgets.basic import ButtonWidget, TextWidget
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_logging():
+    """Drop log sinks so benchmarks measure the code, not the terminal."""
+    logger.remove()
+    yield
+    logger.add(sys.stderr)
+
+
+@pytest.fixture
+def imgui_context():
+    """Create a windowless ImGui context for rendering frames."""
+    ctx = imgui.create_context()
+    io = imgui.get_io()
+    io.display_size = imgui.ImVec2(1280, 720)
+    io.delta_time = 1 / 60
+    io.set_ini_filename("")
+    io.backend_flags |= imgui.BackendFlags_.renderer_has_textures.value
+    yield ctx
+    imgui.destroy_context(ctx)
+
+
+@pytest.fixture
+def implot_context(imgui_context):
+    """Create an ImPlot context on top of the windowless ImGui context."""
+    ctx = implot.create_context()
+    yield ctx
+    implot.destroy_context(ctx)
+
+
+@pytest.fixture
+def canvas_manager():
+    """Create a canvas manager that never starts render threads."""
+    manager = CanvasManager()
+    manager._auto_start = False
+    return manager
+
+
+@pytest.fixture
+def make_canvas():
+    """Build stopped canvases filled with alternating text/button widgets."""
+
+    def build(count: int, clipping: bool = False) -> Canvas:
+        canvas = Canvas("bench", width=1280, height=720, clipping=clipping)
+        for i in range(count):
+            if i % 2:
+                canvas.add_widget(ButtonWidget(f"button_{i}", label=f"Button {i}"))
+            else:
+                canvas.add_widget(TextWidget(f"text_{i}", text=f"Line {i}"))
+        return canvas
+
+    return build
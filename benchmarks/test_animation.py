@@ -0,0 +1,21 @@
+"""Benchmarks for the animation manager."""
+
+import pytest
+
+from champi_gen_ui.extensions.animation import AnimationManager, EasingFunction
+
+
+@pytest.mark.benchmark(group="animation")
+@pytest.mark.parametrize("count", [1_000, 5_000, 20_000])
+def test_update(benchmark, imgui_context, count):
+    """Advance many running looped animations by one frame."""
+    manager = AnimationManager()
+    easings = list(EasingFunction)
+    for i in range(count):
+        name = f"anim_{i}"
+        manager.create(
+            name, 0.0, 1.0, duration=1.0, easing=easings[i % len(easings)], loop=True
+        )
+        manager.start(name)
+
+    benchmark(manager.update)
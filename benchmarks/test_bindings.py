@@ -0,0 +1,78 @@
+"""Benchmarks for binding fan-out."""
+
+import threading
+
+import pytest
+
+from champi_gen_ui.core.binding import BindingManager, ComputedProperty, DataStore
+from champi_gen_ui.widgets.basic import TextWidget
+
+
+@pytest.mark.benchmark(group="binding-fanout")
+@pytest.mark.parametrize("bindings", [10, 100, 1_000])
+def test_on_data_change_fanout(benchmark, canvas_manager, bindings):
+    """Propagate one change to many bound widgets on a stopped canvas."""
+    canvas = canvas_manager.create_canvas("bench_bindings")
+    for i in range(bindings):
+        canvas.add_widget(TextWidget(f"widget_{i}", text=""))
+    store = DataStore()
+    manager = BindingManager(store, canvas_manager)
+    for i in range(bindings):
+        manager.bind("metrics.cpu", f"widget_{i}", "value", transform=str)
+
+    benchmark(manager._on_data_change, store, path="metrics.cpu", value=42.0)
+
+
+@pytest.mark.benchmark(group="binding-fanout")
+@pytest.mark.parametrize("paths", [100, 1_000])
+def test_set_with_unrelated_bindings(benchmark, paths):
+    """Write one path while many other paths are bound."""
+    store = DataStore()
+    manager = BindingManager(store)
+    for i in range(paths):
+        manager.bind(f"metrics.series{i}", f"widget_{i}", "value")
+
+    benchmark(store.set, "metrics.series0", 1.0)
+
+
+@pytest.mark.benchmark(group="computed")
+@pytest.mark.parametrize("batched", [False, True], ids=["per-write", "transaction"])
+def test_computed_fan_in(benchmark, batched):
+    """Update all 50 inputs of a computed sum, with and without a transaction."""
+    store = DataStore()
+    inputs = [f"in{i}" for i in range(50)]
+    for path in inputs:
+        store.set(path, 0)
+    ComputedProperty("total", inputs, lambda **values: sum(values.values()), store)
+
+    def write_all():
+        value = store.get("total") + 1
+        if batched:
+            with store.transaction():
+                for path in inputs:
+                    store.set(path, value)
+        else:
+            for path in inputs:
+                store.set(path, value)
+
+    benchmark(write_all)
+
+
+@pytest.mark.benchmark(group="binding-rate")
+def test_high_rate_source_one_frame(benchmark, canvas_manager):
+    """Push 1k updates of a bound value into a running canvas, then drain once."""
+    canvas = canvas_manager.create_canvas("bench_rate")
+    canvas.add_widget(TextWidget("telemetry", text=""))
+    canvas._render_thread = threading.Thread(target=lambda: None)
+    canvas._running = True
+    store = DataStore()
+    manager = BindingManager(store, canvas_manager)
+    manager.bind("telemetry.value", "telemetry", "text", transform=str)
+
+    def one_frame():
+        for i in range(1_000):
+            store.set("telemetry.value", i)
+        canvas.process_commands()
+
+    benchmark(one_frame)
+    canvas._running = False
@@ -0,0 +1,46 @@
+"""Benchmarks for DataStore reads and writes."""
+
+import pytest
+
+from champi_gen_ui.core.binding import DataStore
+
+
+def deep_path(depth: int) -> str:
+    """Build a dotted path ``depth`` segments long."""
+    return ".".join(f"level{i}" for i in range(depth))
+
+
+@pytest.mark.benchmark(group="datastore-set")
+@pytest.mark.parametrize("depth", [1, 8, 32])
+def test_set(benchmark, depth):
+    """Write one value at increasing path depths."""
+    store = DataStore()
+    path = deep_path(depth)
+    store.set(path, 0)
+
+    benchmark(store.set, path, 1)
+
+
+@pytest.mark.benchmark(group="datastore-get")
+@pytest.mark.parametrize("depth", [1, 8, 32])
+def test_get(benchmark, depth):
+    """Read one value at increasing path depths."""
+    store = DataStore()
+    path = deep_path(depth)
+    store.set(path, 1)
+
+    assert benchmark(store.get, path) == 1
+
+
+@pytest.mark.benchmark(group="datastore-set")
+def test_set_many_siblings(benchmark):
+    """Write 1k sibling leaves under one deep parent."""
+    store = DataStore()
+    parent = deep_path(8)
+    paths = [f"{parent}.item{i}" for i in range(1_000)]
+
+    def write_all():
+        for i, path in enumerate(paths):
+            store.set(path, i)
+
+    benchmark(write_all)
@@ -0,0 +1,125 @@
+"""Benchmarks for plotting widgets."""
+
+import base64
+import json
+
+import numpy as np
+import pytest
+from imgui_bundle import imgui
+
+from champi_gen_ui.widgets.plotting import (
+    HeatmapWidget,
+    LineChartWidget,
+    RealtimePlotWidget,
+    ScatterPlotWidget,
+)
+
+SERIES = 48
+POINTS_PER_FRAME = 17  # ~1000 points/s per series at 60 FPS
+
+
+def render_plots(plots) -> None:
+    """Render all plots in one window for a single frame."""
+    imgui.new_frame()
+    imgui.begin("plots")
+    for plot in plots:
+        plot.render()
+    imgui.end()
+    imgui.render()
+
+
+@pytest.mark.benchmark(group="realtime-plot")
+def test_realtime_ingest(benchmark):
+    """Append one frame's worth of points to every series, point by point."""
+    plots = [RealtimePlotWidget(f"rt{i}", max_points=10_000) for i in range(SERIES)]
+    values = np.random.default_rng(0).standard_normal(POINTS_PER_FRAME).tolist()
+
+    def ingest():
+        for plot in plots:
+            for value in values:
+                plot.add_point(value)
+
+    benchmark(ingest)
+
+
+@pytest.mark.benchmark(group="realtime-plot")
+def test_realtime_ingest_bulk(benchmark):
+    """Append one frame's worth of points to every series in one call each."""
+    plots = [RealtimePlotWidget(f"rt{i}", max_points=10_000) for i in range(SERIES)]
+    values = np.random.default_rng(0).standard_normal(POINTS_PER_FRAME)
+
+    def ingest():
+        for plot in plots:
+            plot.add_points(values)
+
+    benchmark(ingest)
+
+
+@pytest.mark.benchmark(group="realtime-plot")
+def test_realtime_render(benchmark, implot_context):
+    """Render every series with a full 10k-point ring buffer."""
+    plots = [RealtimePlotWidget(f"rt{i}", max_points=10_000) for i in range(SERIES)]
+    for plot in plots:
+        plot.add_points(np.random.default_rng(0).standard_normal(12_345))
+    render_plots(plots)
+
+    benchmark.pedantic(render_plots, args=(plots,), rounds=20, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group="static-plot")
+def test_heatmap_render(benchmark, implot_context):
+    """Render a 1000x1000 heatmap, set once from nested lists."""
+    values = np.random.default_rng(0).random((1000, 1000)).tolist()
+    heatmap = HeatmapWidget("heat", values=values)
+    render_plots([heatmap])
+
+    benchmark.pedantic(render_plots, args=([heatmap],), rounds=10, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group="lod")
+@pytest.mark.parametrize("lod", [True, False], ids=["lod", "full"])
+@pytest.mark.parametrize("widget_class", [LineChartWidget, ScatterPlotWidget])
+def test_large_series_render(benchmark, implot_context, widget_class, lod):
+    """Render a 2M-point series, with and without level of detail."""
+    xs = np.arange(2_000_000, dtype=np.float64)
+    ys = np.cumsum(np.random.default_rng(0).standard_normal(xs.size))
+    plot = widget_class("big", x_data=xs, y_data=ys, lod=lod)
+    render_plots([plot])
+
+    benchmark.pedantic(render_plots, args=([plot],), rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group="append")
+@pytest.mark.parametrize("encoding", ["json", "base64"])
+def test_append_payload(benchmark, encoding):
+    """Parse and append a 100k-point payload as a JSON list or packed array."""
+    values = np.random.default_rng(0).standard_normal(100_000)
+    if encoding == "json":
+        payload = json.dumps({"y": values.tolist()})
+    else:
+        payload = json.dumps({"y": base64.b64encode(values.tobytes()).decode()})
+
+    def append():
+        y = json.loads(payload)["y"]
+        if encoding == "base64":
+            y = np.frombuffer(base64.b64decode(y), dtype="<f8")
+        plot = RealtimePlotWidget("rt", max_points=100_000)
+        plot.append_data(y=y)
+
+    benchmark(append)
+
+
+@pytest.mark.benchmark(group="append")
+def test_append_to_large_line(benchmark, implot_context):
+    """Append one frame of points to a 1M-point LOD line and render it."""
+    xs = np.arange(1_000_000, dtype=np.float64)
+    chart = LineChartWidget("line", x_data=xs, y_data=np.sin(xs / 1000))
+    render_plots([chart])
+    batch = np.arange(POINTS_PER_FRAME, dtype=np.float64)
+
+    def append_and_render():
+        start = chart.state.properties["x_data"].size
+        chart.append_data(start + batch, np.sin((start + batch) / 1000))
+        render_plots([chart])
+
+    benchmark.pedantic(append_and_render, rounds=50, warmup_rounds=1)
@@ -0,0 +1,41 @@
+"""Benchmarks for the canvas render loop."""
+
+import pytest
+from imgui_bundle import imgui
+
+
+def render_frame(canvas) -> None:
+    """Build one full ImGui frame for the canvas."""
+    imgui.new_frame()
+    canvas.render()
+    imgui.render()
+
+
+@pytest.mark.benchmark(group="render")
+@pytest.mark.parametrize("count", [1_000, 10_000, 100_000])
+def test_render(benchmark, imgui_context, make_canvas, count):
+    """Render every top-level widget each frame."""
+    canvas = make_canvas(count)
+    render_frame(canvas)
+
+    benchmark.pedantic(
+        render_frame,
+        args=(canvas,),
+        rounds=max(3, 100_000 // count),
+        warmup_rounds=1,
+    )
+
+
+@pytest.mark.benchmark(group="render-clipped")
+@pytest.mark.parametrize("count", [1_000, 10_000, 100_000])
+def test_render_clipped(benchmark, imgui_context, make_canvas, count):
+    """Render only the rows inside the visible scroll region."""
+    canvas = make_canvas(count, clipping=True)
+    render_frame(canvas)
+
+    benchmark.pedantic(
+        render_frame,
+        args=(canvas,),
+        rounds=max(3, 1_000_000 // count),
+        warmup_rounds=1,
+    )
@@ -0,0 +1,164 @@
+"""Benchmarks for canvas serialization and code generation."""
+
+import json
+
+import numpy as np
+import pytest
+
+from champi_gen_ui.core import snapshot
+from champi_gen_ui.core.canvas import Canvas
+from champi_gen_ui.core.codegen import CodeGenerator
+from champi_gen_ui.core.serialization import UISerializer
+from champi_gen_ui.widgets.plotting import LineChartWidget
+
+
+@pytest.mark.benchmark(group="serialize")
+@pytest.mark.parametrize("count", [100, 1_000, 10_000])
+def test_serialize_canvas(benchmark, make_canvas, count):
+    """Serialize a canvas to a dict."""
+    canvas = make_canvas(count)
+    benchmark(UISerializer.serialize_canvas, canvas)
+
+
+@pytest.mark.benchmark(group="deserialize")
+@pytest.mark.parametrize("count", [100, 1_000, 10_000])
+def test_deserialize_canvas(benchmark, make_canvas, canvas_manager, count):
+    """Rebuild a canvas and its widgets from a dict."""
+    source = make_canvas(count)
+    data = {
+        "type": "canvas",
+        "id": "bench",
+        "state": {"title": "Bench", "width": 1280, "height": 720, "mode": "standard"},
+        "widgets": [
+            UISerializer.serialize_widget(widget)
+            for widget in source.snapshot_widgets()
+        ],
+    }
+
+    def deserialize():
+        canvas_manager.remove_canvas("bench")
+        return UISerializer.deserialize_canvas(data, canvas_manager)
+
+    canvas = benchmark.pedantic(deserialize, rounds=max(3, 10_000 // count))
+    assert len(canvas.widget_registry) == count
+
+
+@pytest.mark.benchmark(group="codegen")
+@pytest.mark.parametrize("count", [100, 1_000, 10_000])
+def test_generate_canvas_code(benchmark, make_canvas, count):
+    """Generate Python source for a canvas."""
+    canvas = make_canvas(count)
+    benchmark(CodeGenerator.generate_canvas_code, canvas)
+
+
+def plot_charts() -> list[LineChartWidget]:
+    """10 line charts of 100k points each."""
+    rng = np.random.default_rng(0)
+    return [
+        LineChartWidget(
+            f"chart_{i}",
+            x_data=np.arange(100_000, dtype=np.float64),
+            y_data=rng.standard_normal(100_000),
+        )
+        for i in range(10)
+    ]
+
+
+def plot_canvas() -> Canvas:
+    """Stopped canvas holding the ``plot_charts``."""
+    canvas = Canvas("bench", width=1280, height=720)
+    for chart in plot_charts():
+        canvas.add_widget(chart)
+    return canvas
+
+
+def plot_canvas_data(arrays: bool) -> dict:
+    """Serialized canvas holding the ``plot_charts``."""
+    return {
+        "type": "canvas",
+        "id": "bench",
+        "state": {"title": "Bench", "width": 1280, "height": 720, "mode": "standard"},
+        "widgets": [
+            UISerializer.serialize_widget(chart, arrays) for chart in plot_charts()
+        ],
+    }
+
+
+@pytest.mark.benchmark(group="export-plots")
+@pytest.mark.parametrize("fmt", ["json", "json-stream", "snapshot"])
+def test_export_plot_canvas(benchmark, tmp_path, fmt):
+    """Write a canvas with 1M plot points as pretty JSON or a snapshot."""
+    path = tmp_path / "canvas.out"
+    if fmt == "json":
+        data = plot_canvas_data(arrays=False)
+
+        def export():
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
+
+    elif fmt == "json-stream":
+        canvas = plot_canvas()
+
+        def export():
+            with open(path, "w") as f:
+                UISerializer.dump_canvas(canvas, f, indent=2)
+
+    else:
+        data = plot_canvas_data(arrays=True)
+
+        def export():
+            snapshot.save(data, path)
+
+    benchmark.pedantic(export, rounds=3)
+
+
+@pytest.mark.benchmark(group="import-plots")
+@pytest.mark.parametrize("fmt", ["json", "json-stream", "snapshot"])
+def test_import_plot_canvas(benchmark, tmp_path, canvas_manager, fmt):
+    """Load a canvas with 1M plot points from JSON or a mapped snapshot."""
+    path = tmp_path / "canvas.out"
+    if fmt == "json":
+        path.write_text(json.dumps(plot_canvas_data(arrays=False), indent=2))
+
+        def load():
+            with open(path) as f:
+                return json.load(f)
+
+    elif fmt == "json-stream":
+        with open(path, "w") as f:
+            UISerializer.dump_canvas(plot_canvas(), f, indent=2)
+
+        def load():
+            canvas_manager.remove_canvas("bench")
+            with open(path) as f:
+                return UISerializer.load_canvas(f, canvas_manager)
+
+    else:
+        snapshot.save(plot_canvas_data(arrays=True), path)
+
+        def load():
+            return snapshot.load(path)
+
+    benchmark.pedantic(load, rounds=3)
+
+
+@pytest.mark.benchmark(group="poll")
+@pytest.mark.parametrize("mode", ["state", "changes"])
+def test_poll_canvas(benchmark, make_canvas, mode):
+    """Poll a 10k-widget canvas after ten property updates, as JSON."""
+    canvas = make_canvas(10_000)
+    widgets = canvas.snapshot_widgets()[:10]
+    revision = canvas.serialize()["revision"]
+
+    def poll():
+        nonlocal revision
+        for widget in widgets:
+            widget.update(text="changed", label="changed")
+        if mode == "state":
+            return json.dumps(canvas.serialize())
+        changes = canvas.get_changes(revision)
+        revision = changes["revision"]
+        return json.dumps(changes["patch"])
+
+    payload = benchmark(poll)
+    benchmark.extra_info["bytes"] = len(payload)
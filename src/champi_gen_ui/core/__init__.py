@@ -13,6 +13,7 @@ from champi_gen_ui.core.codegen import (
     MarkupGenerator,
     TemplateCodeGenerator,
 )
+from champi_gen_ui.core.headless import HeadlessBackend
 from champi_gen_ui.core.serialization import (
     TemplateManager,
     UIExporter,
@@ -31,6 +32,7 @@ __all__ = [
     "CodeGenerator",
     "ComputedProperty",
     "DataStore",
+    "HeadlessBackend",
     "MarkupGenerator",
     "TemplateCodeGenerator",
     "TemplateManager",
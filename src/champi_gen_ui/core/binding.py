@@ -1,12 +1,20 @@
 """Data binding system for reactive UI updates."""
 
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from blinker import Signal
 from loguru import logger
 
+from champi_gen_ui.core.state import widget_edited, widget_updated
+
+if TYPE_CHECKING:
+    from champi_gen_ui.core.canvas import CanvasManager
+
 
 @dataclass
 class BindingConfig:
@@ -19,13 +27,269 @@ class BindingConfig:
     bidirectional: bool = False  # Two-way binding
 
 
+# Most distinct paths kept compiled / indexed before older ones are dropped
+PATH_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _compile_path(path: str) -> tuple[str, ...]:
+    """Split a dotted data path into its keys (LRU-cached)."""
+    return tuple(path.split("."))
+
+
+# Marks a key that is absent from the store
+_MISSING: Any = object()
+
+
+def _values_equal(old: Any, new: Any) -> bool:
+    """Compare two stored values, treating incomparable values as changed."""
+    if old is new:
+        return True
+    try:
+        return bool(old == new)
+    except Exception:
+        return False
+
+
+def _paths_overlap(a: str, b: str) -> bool:
+    """Whether a write to one path can change the value at the other."""
+    if len(a) > len(b):
+        a, b = b, a
+    return b == a or b.startswith(a + ".")
+
+
+class _SubscriptionNode:
+    """Node of the subscription trie, keyed by path segment."""
+
+    __slots__ = ("children", "signal")
+
+    def __init__(self):
+        self.children: dict[str, _SubscriptionNode] = {}
+        self.signal: Signal | None = None
+
+
+class ReactiveGraph:
+    """Dependency graph of a data store's computed properties.
+
+    Each write that changes a value stamps the written path and its
+    ancestors with the next tick of a store-wide version clock. A computed
+    property remembers the versions of its dependencies from its last
+    evaluation. When a dependency changes the property, and everything
+    downstream of it, is marked stale; it is re-evaluated only when pulled,
+    after its upstream properties, and only if its dependency versions moved
+    (an upstream recompute that yields an equal value stops there).
+    Registering a property that would close a cycle raises ``ValueError``.
+    """
+
+    def __init__(self):
+        """Initialize graph."""
+        self.nodes: dict[str, ComputedProperty] = {}
+        self.stale: set[str] = set()
+        self._upstream: dict[str, list[str]] = {}
+        self._downstream: dict[str, list[str]] = {}
+        self._order: list[str] | None = None
+        self._versions: dict[tuple[str, ...], int] = {}
+        self._clock = 0
+        self._base_version = 0
+        self._evaluating: list[str] = []
+
+    def add(self, prop: "ComputedProperty") -> None:
+        """
+        Register a computed property (initially stale).
+
+        Raises:
+            ValueError: If the name is taken or the property would close a cycle
+        """
+        name = prop.name
+        if name in self.nodes:
+            raise ValueError(f"Computed property {name} already exists")
+        if any(_paths_overlap(dep, name) for dep in prop.dependencies):
+            raise ValueError(f"Computed property {name} depends on itself")
+
+        upstream = [
+            other
+            for other in self.nodes
+            if any(_paths_overlap(dep, other) for dep in prop.dependencies)
+        ]
+        downstream = [
+            other
+            for other, node in self.nodes.items()
+            if any(_paths_overlap(dep, name) for dep in node.dependencies)
+        ]
+        cycle = self._find_route(downstream, set(upstream))
+        if cycle:
+            raise ValueError(
+                "Computed property cycle: " + " -> ".join([name, *cycle, name])
+            )
+
+        self.nodes[name] = prop
+        self._upstream[name] = upstream
+        self._downstream[name] = downstream
+        for other in upstream:
+            self._downstream[other].append(name)
+        for other in downstream:
+            self._upstream[other].append(name)
+        self._order = None
+        self._mark_stale(name)
+
+    def remove(self, prop: "ComputedProperty") -> None:
+        """Unregister a computed property."""
+        name = prop.name
+        if self.nodes.get(name) is not prop:
+            return
+        del self.nodes[name]
+        for other in self._upstream.pop(name):
+            self._downstream[other].remove(name)
+        for other in self._downstream.pop(name):
+            self._upstream[other].remove(name)
+        self.stale.discard(name)
+        self._order = None
+
+    def order(self) -> list[str]:
+        """Property names in topological (upstream first) order."""
+        if self._order is None:
+            remaining = {name: len(up) for name, up in self._upstream.items()}
+            ready = [name for name, count in remaining.items() if count == 0]
+            order: list[str] = []
+            while ready:
+                name = ready.pop()
+                order.append(name)
+                for other in self._downstream[name]:
+                    remaining[other] -= 1
+                    if remaining[other] == 0:
+                        ready.append(other)
+            self._order = order
+        return self._order
+
+    def changed(self, path: str) -> None:
+        """Record that the value at ``path`` changed."""
+        self._clock += 1
+        keys = _compile_path(path)
+        for depth in range(1, len(keys) + 1):
+            self._versions[keys[:depth]] = self._clock
+        for name, prop in self.nodes.items():
+            if name not in self.stale and any(
+                _paths_overlap(dep, path) for dep in prop.dependencies
+            ):
+                self._mark_stale(name)
+
+    def reset(self) -> None:
+        """Treat every path as changed (after bulk replacement of the data)."""
+        self._clock += 1
+        self._base_version = self._clock
+        self._versions.clear()
+        self.stale.update(self.nodes)
+
+    def version_of(self, path: str) -> int:
+        """Version of the value at ``path`` (bumped by writes at or above it)."""
+        keys = _compile_path(path)
+        version = self._base_version
+        for depth in range(1, len(keys) + 1):
+            stamp = self._versions.get(keys[:depth], 0)
+            if stamp > version:
+                version = stamp
+        return version
+
+    def evaluate(self, name: str) -> None:
+        """Bring one stale property (and its upstream) up to date."""
+        if name not in self.stale:
+            return
+        if name in self._evaluating:
+            cycle = self._evaluating[self._evaluating.index(name) :]
+            raise RuntimeError(
+                "Computed property cycle: " + " -> ".join([*cycle, name])
+            )
+
+        self._evaluating.append(name)
+        try:
+            for other in self._upstream[name]:
+                self.evaluate(other)
+            prop = self.nodes[name]
+            versions = tuple(self.version_of(dep) for dep in prop.dependencies)
+            if versions != prop._versions:
+                prop._versions = versions
+                prop._recompute()
+            self.stale.discard(name)
+        finally:
+            self._evaluating.pop()
+
+    def pull(self, path: str | None = None) -> None:
+        """Evaluate stale properties that overlap ``path`` (all if None)."""
+        for name in self.order():
+            if name in self.stale and (path is None or _paths_overlap(name, path)):
+                self.evaluate(name)
+
+    def flush(self, observed: Callable[[str], bool]) -> None:
+        """Evaluate stale properties that something is listening to."""
+        for name in self.order():
+            if name in self.stale and observed(name):
+                self.evaluate(name)
+
+    def _mark_stale(self, name: str) -> None:
+        """Mark a property and everything downstream of it stale."""
+        todo = [name]
+        while todo:
+            current = todo.pop()
+            if current not in self.stale:
+                self.stale.add(current)
+                todo.extend(self._downstream[current])
+
+    def _find_route(self, starts: list[str], targets: set[str]) -> list[str]:
+        """Find a downstream route from any start to any target."""
+        parents: dict[str, str | None] = dict.fromkeys(starts)
+        todo = list(starts)
+        while todo:
+            current = todo.pop()
+            if current in targets:
+                route = [current]
+                parent = parents[current]
+                while parent is not None:
+                    route.append(parent)
+                    parent = parents[parent]
+                return route[::-1]
+            for other in self._downstream[current]:
+                if other not in parents:
+                    parents[other] = current
+                    todo.append(other)
+        return []
+
+
 class DataStore:
-    """Reactive data store with change notifications."""
+    """Reactive data store with change notifications.
+
+    Dotted paths are compiled once into key tuples, and a flat index maps
+    each recently used full path to the dict that holds its leaf, so
+    repeated reads and writes of the same path skip the walk. Replacing or
+    deleting a nested dict drops the index, so it never points at a detached
+    container. Nested dicts returned by ``get``/``to_dict`` are live: mutate
+    them through ``set``/``delete``.
+
+    Subscriptions live in a trie that mirrors the path hierarchy. A write
+    notifies the written path, then every subscribed path beneath it whose
+    value actually differs between the old and new subtree, then (if the
+    value changed) each subscribed ancestor once. Receivers get ``path``
+    (the subscribed path), ``value`` (its current value, None if removed)
+    and ``source`` (the first written path that affected it).
+
+    Writes made inside ``transaction()`` are applied immediately but
+    notified together at commit: computed properties whose dependencies
+    changed are re-evaluated once each, in dependency order, and then every
+    affected path is signalled once.
+
+    The store is shared by the render thread (widget edits) and MCP request
+    threads. A reentrant lock serializes writes and reads, and is held for
+    the whole of the outermost transaction, so a transaction only ever
+    contains writes from the thread that opened it.
+    """
 
     def __init__(self):
         """Initialize data store."""
         self._data: dict[str, Any] = {}
-        self._signals: dict[str, Signal] = {}
+        self._subscriptions = _SubscriptionNode()
+        self._leaf_index: dict[str, tuple[dict[str, Any], str]] = {}
+        self._pending: dict[str, Any] | None = None
+        self._graph = ReactiveGraph()
+        self._lock = threading.RLock()
         logger.debug("Initialized DataStore")
 
     def set(self, path: str, value: Any) -> None:
@@ -36,15 +300,14 @@ class DataStore:
             path: Data path (e.g., "user.name")
             value: New value
         """
-        # Set the value
-        self._set_nested(path, value)
+        with self._lock:
+            # Set the value
+            old_value = self._set_nested(path, value)
 
-        # Emit signal
-        if path not in self._signals:
-            self._signals[path] = Signal()
-        self._signals[path].send(self, path=path, value=value)
+            # Notify now, or at commit inside a transaction
+            self._changed(path, old_value, value)
 
-        logger.debug(f"DataStore set: {path} = {value}")
+        logger.debug("DataStore set: {} = {}", path, value)
 
     def get(self, path: str, default: Any = None) -> Any:
         """
@@ -57,7 +320,44 @@ class DataStore:
         Returns:
             Value at path or default
         """
-        return self._get_nested(path, default)
+        with self._lock:
+            if self._graph.stale:
+                self._pull(path)
+            return self._get_nested(path, default)
+
+    @contextmanager
+    def transaction(self) -> Iterator["DataStore"]:
+        """
+        Group writes so listeners are notified once, at commit.
+
+        Reads inside the block see the new values. If the block raises, every
+        write made in it is rolled back and nothing is notified. Nested
+        transactions join the outermost one. Other threads block on the
+        store until the outermost transaction has committed.
+
+        Yields:
+            This data store
+        """
+        with self._lock:
+            if self._pending is not None:
+                yield self
+                return
+
+            self._pending = {}
+            try:
+                yield self
+            except BaseException:
+                pending, self._pending = self._pending, None
+                self._rollback(pending)
+                raise
+
+            pending, self._pending = self._pending, None
+            self._commit(pending)
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is open."""
+        return self._pending is not None
 
     def subscribe(self, path: str, callback: Callable) -> None:
         """
@@ -67,9 +367,15 @@ class DataStore:
             path: Data path to watch
             callback: Function to call on changes
         """
-        if path not in self._signals:
-            self._signals[path] = Signal()
-        self._signals[path].connect(callback)
+        node = self._subscriptions
+        for key in _compile_path(path):
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = _SubscriptionNode()
+            node = child
+        if node.signal is None:
+            node.signal = Signal()
+        node.signal.connect(callback)
         logger.debug(f"Subscribed to {path}")
 
     def unsubscribe(self, path: str, callback: Callable) -> None:
@@ -80,9 +386,155 @@ class DataStore:
             path: Data path
             callback: Callback to remove
         """
-        if path in self._signals:
-            self._signals[path].disconnect(callback)
-            logger.debug(f"Unsubscribed from {path}")
+        trail = [self._subscriptions]
+        for key in _compile_path(path):
+            child = trail[-1].children.get(key)
+            if child is None:
+                return
+            trail.append(child)
+
+        node = trail[-1]
+        if node.signal is None:
+            return
+        node.signal.disconnect(callback)
+        if not node.signal.receivers:
+            node.signal = None
+
+        # Prune nodes left without subscribers
+        for key, parent, child in zip(
+            reversed(_compile_path(path)),
+            reversed(trail[:-1]),
+            reversed(trail[1:]),
+            strict=True,
+        ):
+            if child.signal is not None or child.children:
+                break
+            del parent.children[key]
+        logger.debug(f"Unsubscribed from {path}")
+
+    def _changed(self, path: str, old_value: Any, new_value: Any) -> None:
+        """Record a write, committing it at once outside a transaction."""
+        if self._graph.nodes and not _values_equal(old_value, new_value):
+            self._graph.changed(path)
+        if self._pending is not None:
+            # Keep the oldest value for rollback and change detection
+            self._pending.setdefault(path, old_value)
+        elif self._subscriptions.children:
+            self._commit({path: old_value})
+
+    def _commit(self, writes: dict[str, Any]) -> None:
+        """Update observed computed properties, then signal each path once."""
+        if self._graph.stale:
+            # Computed writes join this commit
+            self._pending = writes
+            try:
+                self._graph.flush(self._is_observed)
+            finally:
+                self._pending = None
+
+        changes: dict[str, tuple[Signal, str]] = {}
+        for path, old_value in writes.items():
+            self._collect_changes(path, old_value, changes)
+
+        for path, (signal, source) in changes.items():
+            signal.send(self, path=path, value=self.get(path), source=source)
+
+    def _rollback(self, writes: dict[str, Any]) -> None:
+        """Restore the values recorded by a failed transaction."""
+        for path, old_value in reversed(writes.items()):
+            if old_value is _MISSING:
+                self._delete_nested(path)
+            else:
+                self._set_nested(path, old_value)
+            if self._graph.nodes:
+                self._graph.changed(path)
+        logger.debug(f"Rolled back {len(writes)} DataStore writes")
+
+    def _pull(self, path: str | None) -> None:
+        """Evaluate stale computed properties that ``path`` reads."""
+        with self._lock:
+            if self._pending is not None:
+                self._graph.pull(path)
+                return
+            with self.transaction():
+                self._graph.pull(path)
+
+    def _is_observed(self, path: str) -> bool:
+        """Whether any subscription sees changes at ``path``."""
+        node = self._subscriptions
+        for key in _compile_path(path):
+            child = node.children.get(key)
+            if child is None:
+                return False
+            if child.signal is not None:
+                return True
+            node = child
+        return bool(node.children)
+
+    def _collect_changes(
+        self, path: str, old_value: Any, changes: dict[str, tuple[Signal, str]]
+    ) -> None:
+        """Gather the subscribed paths affected by a write at ``path``."""
+        new_value = self._get_nested(path, _MISSING)
+        keys = _compile_path(path)
+        node = self._subscriptions
+        # The node subscribed at ``path`` itself, if the tree reaches it
+        target: _SubscriptionNode | None = None
+        ancestors: list[tuple[int, Signal]] = []
+        for depth, key in enumerate(keys):
+            if node.signal is not None and depth:
+                ancestors.append((depth, node.signal))
+            child = node.children.get(key)
+            if child is None:
+                break
+            node = child
+        else:
+            target = node
+
+        changed = not _values_equal(old_value, new_value)
+        if target is not None:
+            if target.signal is not None:
+                changes.setdefault(path, (target.signal, path))
+            if target.children and changed:
+                self._collect_subtree(target, path, old_value, new_value, path, changes)
+        if not changed:
+            return
+
+        # Bubble up, nearest ancestor first
+        for depth, signal in reversed(ancestors):
+            changes.setdefault(".".join(keys[:depth]), (signal, path))
+
+    def _collect_subtree(
+        self,
+        node: _SubscriptionNode,
+        path: str,
+        old_value: Any,
+        new_value: Any,
+        source: str,
+        changes: dict[str, tuple[Signal, str]],
+    ) -> None:
+        """Gather subscribed descendants whose value changed."""
+        for key, child in node.children.items():
+            old_child = (
+                old_value.get(key, _MISSING)
+                if isinstance(old_value, dict)
+                else _MISSING
+            )
+            new_child = (
+                new_value.get(key, _MISSING)
+                if isinstance(new_value, dict)
+                else _MISSING
+            )
+            if _values_equal(old_child, new_child):
+                continue
+
+            child_path = f"{path}.{key}"
+            if child.signal is not None:
+                changes.setdefault(child_path, (child.signal, source))
+            if child.children:
+                self._collect_subtree(
+                    child, child_path, old_child, new_child, source, changes
+                )
 
     def delete(self, path: str) -> bool:
         """
@@ -94,85 +546,150 @@ class DataStore:
         Returns:
             True if deleted, False if not found
         """
-        try:
-            parts = path.split(".")
-            if len(parts) == 1:
-                if path in self._data:
-                    del self._data[path]
-                    return True
+        with self._lock:
+            try:
+                old_value = self._delete_nested(path)
+            except Exception as e:
+                logger.error(f"Error deleting {path}: {e}")
                 return False
 
-            # Navigate to parent
-            current = self._data
-            for part in parts[:-1]:
-                if part not in current:
-                    return False
-                current = current[part]
-
-            # Delete final key
-            final_key = parts[-1]
-            if final_key in current:
-                del current[final_key]
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Error deleting {path}: {e}")
-            return False
+            if old_value is _MISSING:
+                return False
+            self._changed(path, old_value, _MISSING)
+            return True
 
     def clear(self) -> None:
         """Clear all data."""
-        self._data.clear()
-        self._signals.clear()
+        with self._lock:
+            self._data.clear()
+            self._subscriptions = _SubscriptionNode()
+            self._leaf_index.clear()
+            self._graph.reset()
         logger.debug("Cleared DataStore")
 
-    def _set_nested(self, path: str, value: Any) -> None:
-        """Set nested value using dot notation."""
-        parts = path.split(".")
-        current = self._data
+    def _set_nested(self, path: str, value: Any) -> Any:
+        """Set nested value using dot notation.
 
-        # Navigate/create structure
-        for part in parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+        Returns:
+            The previous value, or ``_MISSING`` if there was none
+        """
+        entry = self._leaf_index.get(path)
+        if entry is not None:
+            container, key = entry
+        else:
+            parts = _compile_path(path)
+            container = self._data
+
+            # Navigate/create structure
+            for part in parts[:-1]:
+                if part not in container:
+                    container[part] = {}
+                container = container[part]
+            key = parts[-1]
+
+        # Replacing a dict detaches every container indexed beneath it
+        old_value = container.get(key, _MISSING)
+        if isinstance(old_value, dict):
+            self._leaf_index.clear()
+            entry = None
 
         # Set final value
-        current[parts[-1]] = value
+        container[key] = value
+        if entry is None:
+            self._index_leaf(path, container, key)
+        return old_value
+
+    def _delete_nested(self, path: str) -> Any:
+        """Remove a nested value.
+
+        Returns:
+            The removed value, or ``_MISSING`` if there was none
+        """
+        parts = _compile_path(path)
+        container = self._data
+
+        # Navigate to parent
+        for part in parts[:-1]:
+            if part not in container:
+                return _MISSING
+            container = container[part]
+
+        old_value = container.pop(parts[-1], _MISSING)
+        if old_value is not _MISSING:
+            self._leaf_index.clear()
+        return old_value
 
     def _get_nested(self, path: str, default: Any = None) -> Any:
         """Get nested value using dot notation."""
-        parts = path.split(".")
-        current = self._data
+        entry = self._leaf_index.get(path)
+        if entry is not None:
+            container, key = entry
+            return container.get(key, default)
+
+        parts = _compile_path(path)
+        container = self._data
 
         try:
-            for part in parts:
-                current = current[part]
-            return current
-        except (KeyError, TypeError):
+            for part in parts[:-1]:
+                container = container[part]
+            value = container[parts[-1]]
+        except (KeyError, TypeError, IndexError):
             return default
 
+        if isinstance(container, dict):
+            self._index_leaf(path, container, parts[-1])
+        return value
+
+    def _index_leaf(self, path: str, container: dict[str, Any], key: str) -> None:
+        """Remember which dict holds a path's leaf."""
+        if path not in self._leaf_index and len(self._leaf_index) >= PATH_CACHE_SIZE:
+            self._leaf_index.clear()
+        self._leaf_index[path] = (container, key)
+
     def to_dict(self) -> dict[str, Any]:
         """Export data as dictionary."""
-        return self._data.copy()
+        with self._lock:
+            if self._graph.stale:
+                self._pull(None)
+            return self._data.copy()
 
     def from_dict(self, data: dict[str, Any]) -> None:
         """Import data from dictionary."""
-        self._data = data.copy()
+        with self._lock:
+            self._data = data.copy()
+            self._leaf_index.clear()
+            self._graph.reset()
         logger.debug("Imported data to DataStore")
 
 
 class BindingManager:
-    """Manager for widget data bindings."""
+    """Manager for widget data bindings.
 
-    def __init__(self, data_store: DataStore):
+    Bound values are pushed to every widget with the target ID, found through
+    the canvas manager's global widget index, and applied on the owning
+    canvas's render thread at the start of its next frame (latest value
+    wins, so fast sources cost one write per property per frame).
+    Bidirectional bindings write user edits of the bound property back to the
+    data store (untransformed).
+    """
+
+    def __init__(
+        self, data_store: DataStore, canvas_manager: "CanvasManager | None" = None
+    ):
         """
         Initialize binding manager.
 
         Args:
             data_store: DataStore instance
+            canvas_manager: Resolves target widgets; without one, updates are
+                only announced through the ``widget_updated`` signal
         """
         self.data_store = data_store
+        self.canvas_manager = canvas_manager
         self.bindings: dict[str, list[BindingConfig]] = {}
+        self._edit_bindings: dict[tuple[str, str], list[BindingConfig]] = {}
+        self._local = threading.local()
+        widget_edited.connect(self._on_widget_edited)
         logger.debug("Initialized BindingManager")
 
     def bind(
@@ -186,6 +703,8 @@ class BindingManager:
         """
         Create a data binding.
 
+        If the path already holds a value it is applied to the widget at once.
+
         Args:
             source_path: Path in data store
             target_widget: Widget ID
@@ -203,10 +722,18 @@ class BindingManager:
 
         if source_path not in self.bindings:
             self.bindings[source_path] = []
+            # Subscribe to data changes
+            self.data_store.subscribe(source_path, self._on_data_change)
         self.bindings[source_path].append(binding)
 
-        # Subscribe to data changes
-        self.data_store.subscribe(source_path, self._on_data_change)
+        if bidirectional:
+            self._edit_bindings.setdefault((target_widget, target_property), []).append(
+                binding
+            )
+
+        value = self.data_store.get(source_path, _MISSING)
+        if value is not _MISSING:
+            self._apply(binding, value)
 
         logger.debug(
             f"Created binding: {source_path} -> {target_widget}.{target_property}"
@@ -223,20 +750,32 @@ class BindingManager:
         if source_path not in self.bindings:
             return
 
-        if target_widget:
-            # Remove specific widget binding
-            self.bindings[source_path] = [
-                b
-                for b in self.bindings[source_path]
-                if b.target_widget != target_widget
-            ]
-        else:
-            # Remove all bindings for path
+        removed = [
+            b
+            for b in self.bindings[source_path]
+            if target_widget is None or b.target_widget == target_widget
+        ]
+        self.bindings[source_path] = [
+            b for b in self.bindings[source_path] if b not in removed
+        ]
+        if not self.bindings[source_path]:
             del self.bindings[source_path]
             self.data_store.unsubscribe(source_path, self._on_data_change)
 
+        for binding in removed:
+            self._drop_edit_binding(binding)
+
         logger.debug(f"Removed binding for {source_path}")
 
+    def _drop_edit_binding(self, binding: BindingConfig) -> None:
+        """Remove a binding from the reverse (widget -> path) index."""
+        key = (binding.target_widget, binding.target_property)
+        edit_bindings = self._edit_bindings.get(key)
+        if edit_bindings and binding in edit_bindings:
+            edit_bindings.remove(binding)
+            if not edit_bindings:
+                del self._edit_bindings[key]
+
     def _on_data_change(self, sender, **kwargs) -> None:
         """Handle data store changes."""
         path = kwargs.get("path")
@@ -247,29 +786,63 @@ class BindingManager:
 
         # Update all bound widgets
         for binding in self.bindings[path]:
-            # Apply transform if provided
-            final_value = binding.transform(value) if binding.transform else value
+            self._apply(binding, value)
+
+    def _apply(self, binding: BindingConfig, value: Any) -> None:
+        """Push a bound value to its widget."""
+        # Skip the widget whose edit is being written back
+        if getattr(self._local, "editing", None) == (
+            binding.target_widget,
+            binding.target_property,
+        ):
+            return
 
-            # Update widget property
-            self._update_widget_property(
-                binding.target_widget, binding.target_property, final_value
-            )
+        # Apply transform if provided
+        final_value = binding.transform(value) if binding.transform else value
+
+        # Update widget property
+        self._update_widget_property(
+            binding.target_widget, binding.target_property, final_value
+        )
 
     def _update_widget_property(
         self, widget_id: str, property_name: str, value: Any
     ) -> None:
         """
-        Update a widget property.
+        Update a widget property on each owning canvas.
+
+        Running canvases apply only the latest value once per frame.
+
+        Without a canvas manager this only emits ``widget_updated``.
+        """
+        if self.canvas_manager is None:
+            widget_updated.send(
+                self, widget_id=widget_id, property=property_name, value=value
+            )
+            return
 
-        Note: This would need access to the widget registry.
-        For now, this is a placeholder that emits a signal.
+        for canvas, widget in self.canvas_manager.find_widgets(widget_id):
+            canvas.write_property(widget, property_name, value)
+
+    def _on_widget_edited(self, sender, **kwargs) -> None:
+        """Write user edits of bidirectionally bound properties to the store.
+
+        Runs on the render thread. The edit is written in its own
+        transaction, which waits for any transaction open on another thread.
         """
-        # Emit signal that can be caught by canvas/widget manager
-        from champi_gen_ui.core.state import widget_updated
+        widget = kwargs["widget"]
+        key = (widget.widget_id, kwargs["property"])
+        edit_bindings = self._edit_bindings.get(key)
+        if not edit_bindings:
+            return
 
-        widget_updated.send(
-            self, widget_id=widget_id, property=property_name, value=value
-        )
+        self._local.editing = key
+        try:
+            with self.data_store.transaction():
+                for binding in edit_bindings:
+                    self.data_store.set(binding.source_path, kwargs["value"])
+        finally:
+            self._local.editing = None
 
     def get_bindings(self, source_path: str) -> list[BindingConfig]:
         """Get all bindings for a data path."""
@@ -277,12 +850,20 @@ class BindingManager:
 
     def clear(self) -> None:
         """Clear all bindings."""
+        for source_path in self.bindings:
+            self.data_store.unsubscribe(source_path, self._on_data_change)
         self.bindings.clear()
+        self._edit_bindings.clear()
         logger.debug("Cleared all bindings")
 
 
 class ComputedProperty:
-    """Computed property that updates when dependencies change."""
+    """Computed property that updates when dependencies change.
+
+    The value is written to the data store under ``name``. It is evaluated
+    lazily: after a dependency changes it is recomputed when read, or at
+    commit if something subscribes to it, and at most once per change.
+    """
 
     def __init__(
         self,
@@ -299,20 +880,32 @@ class ComputedProperty:
             dependencies: List of data paths to watch
             compute_fn: Function to compute value
             data_store: DataStore instance
+
+        Raises:
+            ValueError: If the property would form a dependency cycle
         """
         self.name = name
         self.dependencies = dependencies
         self.compute_fn = compute_fn
         self.data_store = data_store
+        self._versions: tuple[int, ...] | None = None
 
-        # Subscribe to all dependencies
-        for dep in dependencies:
-            data_store.subscribe(dep, self._recompute)
+        # The store's graph tracks when our dependencies change
+        data_store._graph.add(self)
 
         # Initial computation
-        self._recompute()
+        data_store._pull(name)
+
+    @property
+    def value(self) -> Any:
+        """Current value, recomputed first if stale."""
+        return self.data_store.get(self.name)
+
+    def dispose(self) -> None:
+        """Stop updating this property."""
+        self.data_store._graph.remove(self)
 
-    def _recompute(self, *args, **kwargs) -> None:
+    def _recompute(self) -> None:
         """Recompute the property value."""
         # Get all dependency values
         dep_values = {dep: self.data_store.get(dep) for dep in self.dependencies}
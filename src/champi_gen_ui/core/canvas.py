@@ -1,20 +1,47 @@
 """Canvas system for rendering UI."""
 
+import asyncio
 import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import Future
+from functools import partial
 from queue import Queue
 from typing import Any
 
+import numpy as np
 from imgui_bundle import hello_imgui, imgui, immapp
 from loguru import logger
 
-from champi_gen_ui.core.state import CanvasMode, CanvasState, canvas_updated
+from champi_gen_ui.core.changes import ChangeLog
+from champi_gen_ui.core.headless import HeadlessBackend, encode_png
+from champi_gen_ui.core.profiler import FrameProfiler
+from champi_gen_ui.core.state import (
+    CanvasMode,
+    CanvasState,
+    canvas_removed,
+    canvas_updated,
+)
 from champi_gen_ui.core.widget import Widget, WidgetRegistry
 
 
 class Canvas:
-    """Canvas for rendering ImGui UI."""
+    """Canvas for rendering ImGui UI.
+
+    Consistency model: while the canvas is running, its render thread is the
+    only writer of the widget tree. ``add_widget``, ``remove_widget``,
+    ``move_widget``, ``set_widget_parent``, ``clear`` and
+    ``update_properties`` may be called from any thread; they are submitted
+    through the command queue and applied between frames, and the caller
+    blocks until the change has been applied. When the canvas is not running
+    they are applied immediately on the calling thread.
+
+    Structural changes and reads that walk the widget tree (``serialize``,
+    ``snapshot_widgets``) hold the canvas lock, so readers on other threads
+    always see a whole number of applied commands and never a dict that is
+    changing size. Rendering itself works from the retained render list and
+    does not take the lock.
+    """
 
     def __init__(
         self,
@@ -23,110 +50,637 @@ class Canvas:
         height: int = 720,
         mode: CanvasMode = CanvasMode.STANDARD,
         title: str = "ImGui Canvas",
+        clipping: bool = False,
+        headless: bool = False,
         **kwargs,
     ):
-        """Initialize canvas."""
+        """Initialize canvas.
+
+        With ``clipping`` enabled, top-level widgets are treated as uniform
+        height rows and only those inside the visible scroll region are
+        rendered. This suits log/list style canvases with many widgets.
+
+        With ``headless`` enabled, the canvas renders offscreen with no window
+        or display (see ``champi_gen_ui.core.headless``) and frames can be
+        captured with ``capture_frame``.
+        """
         self.state = CanvasState(
             canvas_id=canvas_id,
             size=(width, height),
             mode=mode,
             title=title,
+            clipping=clipping,
+            headless=headless,
         )
         self.widget_registry = WidgetRegistry()
+        self.changes = ChangeLog()
+        self.widget_registry.changes = self.changes
         self._running = False
         self._render_thread: threading.Thread | None = None
         self._command_queue: Queue = Queue()
+        self._lock = threading.RLock()
+        self._ready = threading.Event()
         self._needs_render = False
+        self._runner_params: hello_imgui.RunnerParams | None = None
+        self._headless: HeadlessBackend | None = None
+        self._wake = threading.Event()
+        self.profiler: FrameProfiler | None = None
+        # (widget_id, property) -> (widget, latest value), applied once per frame
+        self._pending_writes: dict[tuple[str, str], tuple[Widget, Any]] = {}
+        self._pending_writes_lock = threading.Lock()
 
         logger.info(
             f"Created canvas {canvas_id} ({width}x{height}) in {mode.value} mode"
         )
 
-    def add_widget(self, widget: Widget) -> None:
-        """Add a widget to the canvas."""
+    def add_widget(self, widget: Widget, parent_id: str | None = None) -> None:
+        """Add a widget to the canvas, optionally inside a container widget."""
+        self.execute_command(lambda: self._add_widget(widget, parent_id))
+
+    async def add_widget_async(
+        self, widget: Widget, parent_id: str | None = None
+    ) -> None:
+        """Async variant of ``add_widget`` that does not block the event loop."""
+        await self.execute_command_async(lambda: self._add_widget(widget, parent_id))
+
+    def _add_widget(self, widget: Widget, parent_id: str | None) -> None:
+        """Add a widget (runs on the render thread)."""
+        linked = True
+        if parent_id is not None:
+            parent = self.widget_registry.get(parent_id)
+            if not parent:
+                raise ValueError(f"Parent widget {parent_id} not found")
+            widget.state.parent = parent_id
+            linked = widget.widget_id in parent.state.children
         self.widget_registry.add(widget)
         self.state.widgets[widget.widget_id] = widget.state
+        self.changes.record("add", ("widgets", widget.widget_id), widget)
+        if parent_id is not None and not linked:
+            # Append rather than replace, so filling a container stays linear
+            self.changes.record(
+                "extend", ("widgets", parent_id, "children"), (widget.widget_id,)
+            )
         self._needs_render = True  # Signal that render is needed
         logger.debug(
             f"Added widget {widget.widget_id} to canvas {self.state.canvas_id}"
         )
 
     def remove_widget(self, widget_id: str) -> bool:
-        """Remove a widget from the canvas."""
+        """Remove a widget and all of its descendants from the canvas."""
+        return self.execute_command(lambda: self._remove_widget(widget_id))
+
+    def _remove_widget(self, widget_id: str) -> bool:
+        """Remove a widget subtree (runs on the render thread)."""
         if widget_id in self.state.widgets:
+            parent_id = self.state.widgets[widget_id].parent
+            for child_id in self.widget_registry.descendants(widget_id):
+                self.state.widgets.pop(child_id, None)
+                self.widget_registry.remove(child_id)
+                self.changes.record("remove", ("widgets", child_id))
             del self.state.widgets[widget_id]
-            return self.widget_registry.remove(widget_id)
+            self._needs_render = True
+            removed = self.widget_registry.remove(widget_id)
+            self.changes.record("remove", ("widgets", widget_id))
+            if parent_id is not None:
+                self._record_children(parent_id)
+            return removed
+        return False
+
+    def set_widget_parent(self, widget_id: str, parent_id: str | None) -> Widget:
+        """Move a widget under a container widget (or to top-level with None).
+
+        Returns:
+            The moved widget
+        """
+        widget: Widget = self.execute_command(
+            lambda: self._set_widget_parent(widget_id, parent_id)
+        )
+        self._needs_render = True
+        return widget
+
+    async def set_widget_parent_async(
+        self, widget_id: str, parent_id: str | None
+    ) -> Widget:
+        """Async variant of ``set_widget_parent``."""
+        widget: Widget = await self.execute_command_async(
+            lambda: self._set_widget_parent(widget_id, parent_id)
+        )
+        self._needs_render = True
+        return widget
+
+    def _set_widget_parent(self, widget_id: str, parent_id: str | None) -> Widget:
+        """Reparent a widget (runs on the render thread)."""
+        widget = self.widget_registry.get(widget_id)
+        if widget is None:
+            raise ValueError(f"Widget {widget_id} not found")
+        old_parent = widget.state.parent
+        self.widget_registry.set_parent(widget_id, parent_id)
+        self.changes.record("replace", ("widgets", widget_id, "parent"), parent_id)
+        for changed in {p for p in (old_parent, parent_id) if p is not None}:
+            self._record_children(changed)
+        return widget
+
+    def _record_children(self, widget_id: str) -> None:
+        """Record the current children of a widget in the change log."""
+        state = self.state.widgets.get(widget_id)
+        if state is not None:
+            self.changes.record(
+                "replace", ("widgets", widget_id, "children"), tuple(state.children)
+            )
+
+    def move_widget(self, widget_id: str, index: int) -> bool:
+        """Move a widget to a new position in render order."""
+        if self.execute_command(lambda: self.widget_registry.move(widget_id, index)):
+            self._needs_render = True
+            return True
         return False
 
     def get_widget(self, widget_id: str) -> Widget | None:
         """Get a widget by ID."""
         return self.widget_registry.get(widget_id)
 
+    def snapshot_widgets(self) -> list[Widget]:
+        """Get a consistent snapshot of all widgets in render order."""
+        with self._lock:
+            return list(self.widget_registry.get_all().values())
+
     def clear(self) -> None:
         """Clear all widgets from the canvas."""
+        self.execute_command(self._clear)
+        logger.info(f"Cleared canvas {self.state.canvas_id}")
+
+    async def clear_async(self) -> None:
+        """Async variant of ``clear``."""
+        await self.execute_command_async(self._clear)
+        logger.info(f"Cleared canvas {self.state.canvas_id}")
+
+    def _clear(self) -> None:
+        """Remove all widgets (runs on the render thread)."""
         self.widget_registry.clear()
         self.state.widgets.clear()
+        self.changes.record("replace", ("widgets",), {})
         self._needs_render = True
-        logger.info(f"Cleared canvas {self.state.canvas_id}")
 
     def queue_command(self, command: Callable[[], Any]) -> None:
         """Queue a command for execution on the render thread."""
         self._command_queue.put(command)
         self._needs_render = True
+        self._wake.set()
 
-    def process_commands(self) -> None:
-        """Process queued commands (called from render thread)."""
-        while not self._command_queue.empty():
-            try:
-                command = self._command_queue.get_nowait()
+    def post_command(self, command: Callable[[], Any]) -> None:
+        """Run a command on the render thread without waiting for it.
+
+        As with ``execute_command``, the command runs immediately if the
+        canvas is not running or this is called from the render thread.
+
+        Args:
+            command: Callable to execute
+        """
+        render_thread = self._render_thread
+        if (
+            not self._running
+            or render_thread is None
+            or threading.current_thread() is render_thread
+        ):
+            with self._lock:
                 command()
+            self._needs_render = True
+            return
+        self.queue_command(command)
+
+    def write_property(self, widget: Widget, name: str, value: Any) -> None:
+        """Set a widget property at the start of the next frame.
+
+        Writes to the same property between two frames coalesce: only the
+        latest value is applied. If the canvas is not running, or this is
+        called from the render thread, the value is applied immediately.
+
+        Args:
+            widget: Target widget on this canvas
+            name: Property name
+            value: New value
+        """
+        render_thread = self._render_thread
+        if (
+            not self._running
+            or render_thread is None
+            or threading.current_thread() is render_thread
+        ):
+            with self._lock:
+                widget.update(**{name: value})
+            self._needs_render = True
+            return
+
+        with self._pending_writes_lock:
+            first = not self._pending_writes
+            self._pending_writes[(widget.widget_id, name)] = (widget, value)
+        if first:
+            self._needs_render = True
+            self._wake.set()
+
+    def execute_command[T](self, command: Callable[[], T], timeout: float = 5.0) -> T:
+        """Run a command on the render thread and wait for its result.
+
+        If the canvas is not running, or this is called from the render thread
+        itself, the command runs immediately on the calling thread.
+
+        If the render thread has not started the command within ``timeout``,
+        the command is withdrawn and never runs.
+
+        Args:
+            command: Callable to execute
+            timeout: Seconds to wait for the render thread
+
+        Returns:
+            The command's return value
+
+        Raises:
+            TimeoutError: If the command was withdrawn
+        """
+        render_thread = self._render_thread
+        if (
+            not self._running
+            or render_thread is None
+            or threading.current_thread() is render_thread
+        ):
+            with self._lock:
+                return command()
+
+        done = threading.Event()
+        results: list[T] = []
+        errors: list[Exception] = []
+
+        def wrapper():
+            try:
+                results.append(command())
+            except Exception as e:
+                errors.append(e)
+            finally:
+                done.set()
+
+        queued = _CancellableCommand(wrapper)
+        self.queue_command(queued)
+        if not done.wait(timeout):
+            if queued.cancel():
+                raise TimeoutError(
+                    f"Canvas {self.state.canvas_id} did not process command "
+                    f"in {timeout}s"
+                )
+            # Already running: report its actual outcome
+            done.wait()
+        if errors:
+            raise errors[0]
+        return results[0]
+
+    async def execute_command_async[T](
+        self, command: Callable[[], T], timeout: float = 5.0
+    ) -> T:
+        """Async variant of ``execute_command`` that does not block the loop.
+
+        Args:
+            command: Callable to execute
+            timeout: Seconds to wait for the render thread
+
+        Returns:
+            The command's return value
+        """
+        render_thread = self._render_thread
+        if (
+            not self._running
+            or render_thread is None
+            or threading.current_thread() is render_thread
+        ):
+            with self._lock:
+                return command()
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+
+        def wrapper():
+            try:
+                result = command()
+            except Exception as e:
+                loop.call_soon_threadsafe(_settle, future, None, e)
+            else:
+                loop.call_soon_threadsafe(_settle, future, result, None)
+
+        queued = _CancellableCommand(wrapper)
+        self.queue_command(queued)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except TimeoutError:
+            if queued.cancel():
+                raise TimeoutError(
+                    f"Canvas {self.state.canvas_id} did not process command "
+                    f"in {timeout}s"
+                ) from None
+        # Already running: report its actual outcome
+        return await future
+
+    def apply_widget_batch(self, ops: list[dict[str, Any]]) -> dict[str, Any]:
+        """Apply a batch of widget create/update/delete operations.
+
+        All operations are validated (and new widgets constructed) up front. If
+        any operation is invalid nothing is applied; otherwise the whole batch
+        is applied in a single command on the render thread. Operations on a
+        widget deleted earlier in the batch, directly or as a descendant, are
+        invalid.
+
+        Each operation is a dict with an ``op`` key:
+
+        - ``create``: ``widget_type``, ``widget_id``, optional ``properties``,
+          ``parent``, ``position`` and ``visible``
+        - ``update``: ``widget_id``, optional ``properties``, ``position`` and
+          ``visible``
+        - ``delete``: ``widget_id`` (also removes the widget's descendants)
+
+        Args:
+            ops: List of operations
+
+        Returns:
+            Summary with created, updated and deleted widget IDs
+
+        Raises:
+            ValueError: If any operation is invalid
+        """
+        result = self.execute_command(self._prepare_widget_batch(ops))
+        result["widget_count"] = len(self.state.widgets)
+        return result
+
+    async def apply_widget_batch_async(
+        self, ops: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Async variant of ``apply_widget_batch``."""
+        result = await self.execute_command_async(self._prepare_widget_batch(ops))
+        result["widget_count"] = len(self.state.widgets)
+        return result
+
+    def _prepare_widget_batch(
+        self, ops: list[dict[str, Any]]
+    ) -> Callable[[], dict[str, Any]]:
+        """Validate a batch and build the command that applies it.
+
+        Everything that can fail is done here: new widgets are constructed,
+        update properties converted with ``coerce_update`` and positions
+        checked. The command re-checks which widgets exist before changing
+        anything, so a batch is applied either whole or not at all.
+        """
+        factory = self.widget_registry.factory
+        created: dict[str, Widget] = {}
+        planned: list[tuple[int, str, Widget | str, dict[str, Any]]] = []
+        errors: list[str] = []
+
+        for index, op in enumerate(ops):
+            kind = op.get("op")
+            widget_id = op.get("widget_id")
+            if not widget_id:
+                errors.append(f"op {index}: missing widget_id")
+                continue
+            if kind not in ("create", "update", "delete"):
+                errors.append(f"op {index}: unknown op {kind!r}")
+                continue
+
+            change: dict[str, Any] = {}
+            try:
+                if kind == "create":
+                    new_widget = factory.create(
+                        op.get("widget_type", ""),
+                        widget_id,
+                        **(op.get("properties") or {}),
+                    )
+                    created[widget_id] = new_widget
+                    target: Widget | str = new_widget
+                    change["parent"] = op.get("parent")
+                else:
+                    target = widget_id
+                    widget = created.get(widget_id) or self.get_widget(widget_id)
+                    if kind == "update" and op.get("properties") and widget:
+                        change["properties"] = widget.coerce_update(op["properties"])
+                if kind != "delete":
+                    if op.get("position"):
+                        x, y = op["position"]
+                        change["position"] = (float(x), float(y))
+                    if "visible" in op:
+                        change["visible"] = bool(op["visible"])
             except Exception as e:
-                logger.error(f"Error processing command: {e}", exc_info=True)
+                errors.append(f"op {index}: {e}")
+                continue
+            planned.append((index, kind, target, change))
+
+        with self._lock:
+            errors.extend(self._batch_conflicts(planned))
+        if errors:
+            raise ValueError("; ".join(errors))
+
+        def apply() -> dict[str, Any]:
+            # Widgets may have changed since the batch was validated
+            conflicts = self._batch_conflicts(planned)
+            if conflicts:
+                raise ValueError("; ".join(conflicts))
+
+            result: dict[str, list[str]] = {"created": [], "updated": [], "deleted": []}
+            for _, kind, target, change in planned:
+                widget = (
+                    target if isinstance(target, Widget) else self.get_widget(target)
+                )
+                if widget is None:
+                    continue  # Ruled out by _batch_conflicts
+                if kind == "delete":
+                    self._remove_widget(widget.widget_id)
+                    result["deleted"].append(widget.widget_id)
+                    continue
+
+                if "properties" in change:
+                    widget.update(**change["properties"])
+                if "position" in change:
+                    widget.set_position(*change["position"])
+                if "visible" in change:
+                    widget.set_visible(change["visible"])
+                if kind == "create":
+                    self._add_widget(widget, change["parent"])
+                    result["created"].append(widget.widget_id)
+                else:
+                    result["updated"].append(widget.widget_id)
+            logger.debug(
+                f"Applied batch of {len(planned)} ops to canvas {self.state.canvas_id}"
+            )
+            return result
+
+        return apply
+
+    def _batch_conflicts(
+        self, planned: list[tuple[int, str, Widget | str, dict[str, Any]]]
+    ) -> list[str]:
+        """Check which operations of a batch the current widgets would reject.
+
+        Walks the batch without changing anything, tracking the widgets it
+        creates and deletes (a delete also removes the widget's descendants).
+
+        Returns:
+            One message per rejected operation
+        """
+        registry = self.widget_registry
+        added: set[str] = set()
+        removed: set[str] = set()
+        # Children of widgets created by the batch, by parent
+        added_children: dict[str, list[str]] = {}
+        errors: list[str] = []
+
+        def exists(widget_id: str) -> bool:
+            return widget_id in added or (
+                widget_id not in removed and registry.get(widget_id) is not None
+            )
+
+        for index, kind, target, change in planned:
+            widget_id = target.widget_id if isinstance(target, Widget) else target
+            if kind == "create":
+                parent = change["parent"]
+                if exists(widget_id):
+                    errors.append(f"op {index}: widget {widget_id} already exists")
+                elif parent and not exists(parent):
+                    errors.append(f"op {index}: parent {parent} not found")
+                else:
+                    added.add(widget_id)
+                    if parent:
+                        added_children.setdefault(parent, []).append(widget_id)
+            elif not exists(widget_id):
+                errors.append(f"op {index}: widget {widget_id} not found")
+            elif kind == "delete":
+                stack = [widget_id]
+                while stack:
+                    current = stack.pop()
+                    if current in added:
+                        added.discard(current)
+                    else:
+                        widget = registry.get(current)
+                        if widget is not None:
+                            stack.extend(
+                                c for c in widget.state.children if c not in removed
+                            )
+                    removed.add(current)
+                    stack.extend(added_children.pop(current, ()))
+        return errors
+
+    def process_commands(self) -> None:
+        """Apply pending property writes, then process queued commands.
+
+        Called from the render thread at the start of each frame.
+        """
+        if self._command_queue.empty() and not self._pending_writes:
+            return
+
+        start = time.perf_counter()
+        count = 0
+        with self._lock:
+            if self._pending_writes:
+                with self._pending_writes_lock:
+                    writes, self._pending_writes = self._pending_writes, {}
+                for (_, name), (widget, value) in writes.items():
+                    count += 1
+                    try:
+                        widget.update(**{name: value})
+                    except Exception as e:
+                        logger.error(
+                            f"Error writing {name} of {widget.widget_id}: {e}",
+                            exc_info=True,
+                        )
+
+            while not self._command_queue.empty():
+                try:
+                    command = self._command_queue.get_nowait()
+                    count += 1
+                    command()
+                except Exception as e:
+                    logger.error(f"Error processing command: {e}", exc_info=True)
+
+        if self.profiler:
+            self.profiler.record_commands(count, time.perf_counter() - start)
 
     def render(self) -> None:
         """Render all widgets on the canvas."""
         if not self.state.active:
             return
 
+        start = time.perf_counter()
+
+        # Headless frames have nobody to move or resize the window, so it
+        # covers the whole display
+        if self.state.headless:
+            imgui.set_next_window_pos(imgui.ImVec2(0, 0))
+            imgui.set_next_window_size(imgui.get_io().display_size)
+
         # Render in a window
         imgui.begin(self.state.title, None, imgui.WindowFlags_.no_collapse.value)
 
-        # Render all visible widgets
-        for widget in self.widget_registry.get_all().values():
-            if widget.state.visible:
-                try:
-                    # Set position if specified
-                    if widget.state.position:
-                        imgui.set_cursor_pos(imgui.ImVec2(*widget.state.position))
+        # Render visible top-level widgets; containers render their children
+        widgets = self.widget_registry.render_list()
+        if self.state.clipping and widgets:
+            clipper = imgui.ListClipper()
+            clipper.begin(len(widgets))
+            while clipper.step():
+                for widget in widgets[clipper.display_start : clipper.display_end]:
+                    widget.draw()
+            clipper.end()
+        else:
+            for widget in widgets:
+                widget.draw()
 
-                    # Render the widget
-                    widget.render()
+        imgui.end()
 
-                except Exception as e:
-                    logger.error(
-                        f"Error rendering widget {widget.widget_id}: {e}", exc_info=True
-                    )
+        if self.profiler:
+            self.profiler.record_render(time.perf_counter() - start)
 
-        imgui.end()
+    def _frame(self) -> bool:
+        """Run one frame: process queued commands, then render.
 
-    def run(self) -> None:
-        """Run the canvas in standalone mode (blocking)."""
-        self._running = True
+        Returns:
+            True if something changed since the previous frame
+        """
+        if not self._running:
+            return False
 
-        def gui_func():
-            if self._running:
-                # Process any queued commands first
-                self.process_commands()
-                self.render()
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_frame()
+
+        # Process any queued commands first
+        self.process_commands()
+
+        needs_render = self._needs_render
+        self._needs_render = False
+        self.render()
+
+        if profiler:
+            profiler.end_frame(len(self.widget_registry))
+            if profiler.overlay:
+                profiler.draw_overlay()
+                # Keep the overlay live instead of idling
+                needs_render = True
+
+        if not self._ready.is_set():
+            self._ready.set()
+            logger.info(f"Canvas {self.state.canvas_id} is ready")
+
+        # Only idle when nothing changed since the last frame
+        if self._runner_params:
+            self._runner_params.fps_idling.enable_idling = not needs_render
+        return needs_render
+
+    def _show_gui(self) -> None:
+        """GUI callback for hello_imgui, which expects no return value."""
+        self._frame()
 
-        # Configure runner params
+    def _build_runner_params(self) -> hello_imgui.RunnerParams:
+        """Build runner params for the ImGui application loop."""
         runner_params = hello_imgui.RunnerParams()
+        runner_params.callbacks.show_gui = self._show_gui
         runner_params.app_window_params.window_title = self.state.title
         runner_params.app_window_params.window_geometry.size = (
             self.state.size[0],
             self.state.size[1],
         )
         runner_params.fps_idling.fps_idle = self.state.fps_idle
+        runner_params.fps_idling.enable_idling = True
 
         # Set docking if needed
         if self.state.mode == CanvasMode.DOCKING:
@@ -135,61 +689,84 @@ class Canvas:
                 hello_imgui.DefaultImGuiWindowType.provide_full_screen_dock_space
             )
 
-        immapp.run(
-            gui_function=gui_func,
-            window_title=self.state.title,
-            window_size=self.state.size,
-            fps_idle=self.state.fps_idle,
-        )
+        self._runner_params = runner_params
+        return runner_params
+
+    def _run_loop(self) -> None:
+        """Run the ImGui application loop until the canvas stops."""
+        if self.state.headless:
+            self._run_headless()
+        else:
+            immapp.run(
+                self._build_runner_params(), immapp.AddOnsParams(with_implot=True)
+            )
+
+    def _run_headless(self) -> None:
+        """Render frames offscreen until the canvas stops.
+
+        Paces itself like hello_imgui's idling: ``fps_active`` while something
+        changes, ``fps_idle`` otherwise, and wakes early when a command or a
+        capture request arrives.
+        """
+        backend = HeadlessBackend(self.state.size)
+        backend.start()
+        self._headless = backend
+        last = time.perf_counter()
+        try:
+            while self._running:
+                now = time.perf_counter()
+                backend.size = self.state.size
+                with backend.frame(now - last):
+                    needs_render = self._frame()
+                last = now
+
+                fps = self.state.fps_active if needs_render else self.state.fps_idle
+                if not backend.has_pending_captures():
+                    self._wake.wait(1.0 / max(fps, 1))
+                self._wake.clear()
+        finally:
+            self._headless = None
+            backend.shutdown()
+
+    def run(self) -> None:
+        """Run the canvas in standalone mode (blocking)."""
+        self._running = True
+        self._run_loop()
+
+    def run_async(self, wait: bool = True, timeout: float = 5.0) -> bool:
+        """Run the canvas in non-blocking mode (for MCP server use).
+
+        Args:
+            wait: Block until the render thread has drawn its first frame
+            timeout: Seconds to wait for the first frame
 
-    def run_async(self) -> None:
-        """Run the canvas in non-blocking mode (for MCP server use)."""
+        Returns:
+            True if the canvas is running (and ready, when waiting)
+        """
         if self._running:
             logger.warning(f"Canvas {self.state.canvas_id} is already running")
-            return
+            return True
 
         self._running = True
         self.state.active = True
+        self._ready.clear()
 
         def render_loop():
             """Background rendering loop."""
             logger.info(f"Starting async render loop for canvas {self.state.canvas_id}")
 
-            def gui_func():
-                if self._running:
-                    # Process any queued commands
-                    self.process_commands()
-                    # Render widgets
-                    self.render()
-
             try:
-                # Configure runner params
-                runner_params = hello_imgui.RunnerParams()
-                runner_params.app_window_params.window_title = self.state.title
-                runner_params.app_window_params.window_geometry.size = (
-                    self.state.size[0],
-                    self.state.size[1],
-                )
-                runner_params.fps_idling.fps_idle = self.state.fps_idle
-
-                # Set docking if needed
-                if self.state.mode == CanvasMode.DOCKING:
-                    runner_params.imgui_window_params.enable_viewports = True
-                    runner_params.imgui_window_params.default_imgui_window_type = hello_imgui.DefaultImGuiWindowType.provide_full_screen_dock_space
-
                 # Run ImGui loop (this blocks until window closed)
-                immapp.run(
-                    gui_function=gui_func,
-                    window_title=self.state.title,
-                    window_size=self.state.size,
-                    fps_idle=self.state.fps_idle,
-                )
+                self._run_loop()
 
             except Exception as e:
                 logger.error(f"Error in render loop: {e}", exc_info=True)
             finally:
                 self._running = False
                 self.state.active = False
+                # Run anything still queued so waiting callers are released
+                self.process_commands()
+                self._ready.set()
                 logger.info(f"Render loop stopped for canvas {self.state.canvas_id}")
 
         # Start render thread
@@ -199,16 +776,146 @@ class Canvas:
         self._render_thread.start()
         logger.info(f"Started async canvas {self.state.canvas_id}")
 
-        # Give the thread a moment to initialize
-        time.sleep(0.1)
+        if wait:
+            return self.wait_until_ready(timeout)
+        return True
+
+    def wait_until_ready(self, timeout: float = 5.0) -> bool:
+        """Block until the render thread has drawn its first frame.
+
+        Returns:
+            True if the canvas is running, False on timeout or startup failure
+        """
+        return self._ready.wait(timeout) and self._running
+
+    async def wait_until_ready_async(self, timeout: float = 5.0) -> bool:
+        """Wait for the first frame without blocking the event loop."""
+        ready = await asyncio.to_thread(self._ready.wait, timeout)
+        return ready and self._running
+
+    async def start_async(self, timeout: float = 5.0) -> bool:
+        """Start the render thread and await its first frame.
+
+        Returns:
+            True if the canvas is running, False on timeout or startup failure
+        """
+        if not self.run_async(wait=False):
+            return False
+        return await self.wait_until_ready_async(timeout)
 
     def stop(self) -> None:
         """Stop the canvas."""
         self._running = False
+        self._wake.set()
         logger.info(f"Stopped canvas {self.state.canvas_id}")
 
+    def capture_frame(self, fmt: str = "png", timeout: float = 5.0) -> bytes:
+        """Capture the next rendered frame of a running headless canvas.
+
+        Args:
+            fmt: ``"png"`` for a PNG file, ``"rgba"`` for raw row-major RGBA8
+                pixels at the canvas size
+            timeout: Seconds to wait for the frame
+
+        Returns:
+            Encoded frame
+        """
+        future = self._request_capture(fmt)
+        return self._encode_capture(future.result(timeout), fmt)
+
+    async def capture_frame_async(
+        self, fmt: str = "png", timeout: float = 5.0
+    ) -> bytes:
+        """Async variant of ``capture_frame`` that does not block the loop."""
+        future = self._request_capture(fmt)
+        rgba = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        return await asyncio.to_thread(self._encode_capture, rgba, fmt)
+
+    def _request_capture(self, fmt: str) -> Future:
+        """Validate a capture request and queue it on the headless backend."""
+        if fmt not in ("png", "rgba"):
+            raise ValueError(f"Unsupported capture format: {fmt}")
+        if not self.state.headless:
+            raise RuntimeError(
+                f"Canvas {self.state.canvas_id} is not headless; frame capture "
+                "is only available offscreen"
+            )
+        backend = self._headless
+        if not self._running or backend is None:
+            raise RuntimeError(f"Canvas {self.state.canvas_id} is not running")
+        if threading.current_thread() is self._render_thread:
+            raise RuntimeError("Cannot wait for a frame capture on the render thread")
+
+        future = backend.request_capture()
+        self._needs_render = True
+        self._wake.set()
+        return future
+
+    @staticmethod
+    def _encode_capture(rgba: np.ndarray, fmt: str) -> bytes:
+        """Encode a captured RGBA array."""
+        if fmt == "png":
+            return encode_png(rgba)
+        return rgba.tobytes()
+
+    def enable_profiling(self, capacity: int = 300, overlay: bool = False) -> None:
+        """Start recording frame metrics.
+
+        Args:
+            capacity: Number of frames kept in the ring buffer
+            overlay: Draw the metrics overlay on the canvas
+        """
+        profiler = FrameProfiler(capacity=capacity, overlay=overlay)
+        self.execute_command(lambda: self._install_profiler(profiler))
+        logger.info(f"Enabled profiling on canvas {self.state.canvas_id}")
+
+    async def enable_profiling_async(
+        self, capacity: int = 300, overlay: bool = False
+    ) -> None:
+        """Async variant of ``enable_profiling``."""
+        profiler = FrameProfiler(capacity=capacity, overlay=overlay)
+        await self.execute_command_async(lambda: self._install_profiler(profiler))
+        logger.info(f"Enabled profiling on canvas {self.state.canvas_id}")
+
+    def disable_profiling(self) -> None:
+        """Stop recording frame metrics and drop recorded samples."""
+        self.execute_command(lambda: self._install_profiler(None))
+        logger.info(f"Disabled profiling on canvas {self.state.canvas_id}")
+
+    async def disable_profiling_async(self) -> None:
+        """Async variant of ``disable_profiling``."""
+        await self.execute_command_async(lambda: self._install_profiler(None))
+        logger.info(f"Disabled profiling on canvas {self.state.canvas_id}")
+
+    def _install_profiler(self, profiler: FrameProfiler | None) -> None:
+        """Swap the frame profiler (runs on the render thread)."""
+        self.profiler = profiler
+        self.widget_registry.profiler = profiler
+        self._needs_render = True
+
+    def get_metrics(self, frames: int | None = None, top: int = 10) -> dict[str, Any]:
+        """Get aggregated frame metrics.
+
+        Args:
+            frames: Number of recent frames to aggregate (all if None)
+            top: Number of widget types and widgets to list by cost
+
+        Returns:
+            Metrics summary, with ``enabled`` False when profiling is off
+        """
+        profiler = self.profiler
+        if profiler is None:
+            return {"enabled": False}
+        return {"enabled": True, **profiler.summary(frames, top)}
+
     def update_properties(self, **props) -> None:
         """Update canvas properties."""
+        self.execute_command(lambda: self._update_properties(props))
+        canvas_updated.send(self, canvas=self)
+        logger.debug(f"Updated canvas {self.state.canvas_id} with {props}")
+
+    def _update_properties(self, props: dict[str, Any]) -> None:
+        """Apply canvas property changes (runs on the render thread)."""
         if "size" in props:
             self.state.size = tuple(props["size"])
         if "mode" in props:
@@ -218,23 +925,118 @@ class Canvas:
             self.state.theme = props["theme"]
         if "title" in props:
             self.state.title = props["title"]
-
-        canvas_updated.send(self, canvas=self)
-        logger.debug(f"Updated canvas {self.state.canvas_id} with {props}")
+        if "clipping" in props:
+            self.state.clipping = bool(props["clipping"])
+        for name in ("size", "mode", "theme", "title", "clipping"):
+            if name in props:
+                value = getattr(self.state, name)
+                if name == "mode":
+                    value = value.value
+                self.changes.record("replace", (name,), value)
+        self._needs_render = True
 
     def serialize(self) -> dict:
-        """Serialize canvas state to dictionary."""
-        return self.state.to_dict()
+        """Serialize canvas state to dictionary.
+
+        ``revision`` is the change log revision the state corresponds to, to
+        pass to ``get_changes`` later.
+        """
+        with self._lock:
+            data = self._state_dict()
+            data["revision"] = self.changes.revision
+            return data
+
+    def _state_dict(self) -> dict[str, Any]:
+        """Serialize canvas state, widgets as their ``serialize()`` describes.
+
+        Includes what widgets keep outside their state (realtime plot points),
+        so the state matches the change log.
+        """
+        data = self.state.to_dict()
+        for widget_id, widget in self.widget_registry.get_all().items():
+            if type(widget).serialize is not Widget.serialize:
+                data["widgets"][widget_id] = widget.serialize()
+        return data
+
+    def get_changes(self, since_revision: int) -> dict[str, Any]:
+        """Get the state changes made after a revision.
+
+        Changes are JSON Patch style operations against ``serialize()``
+        output (see ``champi_gen_ui.core.changes``). If the change log no
+        longer reaches back to ``since_revision``, or the revision is
+        unknown (for example from before the canvas was recreated), the full
+        state is returned instead.
+
+        Args:
+            since_revision: Revision of the state the caller has
+
+        Returns:
+            ``{"revision", "full": False, "patch"}`` or
+            ``{"revision", "full": True, "state"}``
+        """
+        with self._lock:
+            revision, patch = self.changes.since(since_revision)
+            if patch is None:
+                state = self._state_dict()
+                state["revision"] = revision
+                return {"revision": revision, "full": True, "state": state}
+            return {"revision": revision, "full": False, "patch": patch}
+
+
+def _settle(future: asyncio.Future, result: Any, error: Exception | None) -> None:
+    """Resolve a future from the event loop thread, unless it was cancelled."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class _CancellableCommand:
+    """A queued command its caller can withdraw before the render thread runs it.
+
+    Whichever comes first wins: the render thread starting the command, or
+    the caller cancelling it after a timeout.
+    """
+
+    __slots__ = ("_claim", "_command")
+
+    def __init__(self, command: Callable[[], Any]):
+        """Initialize with the command to run."""
+        self._command = command
+        self._claim = threading.Lock()
+
+    def cancel(self) -> bool:
+        """Withdraw the command; False if it has already started."""
+        return self._claim.acquire(blocking=False)
+
+    def __call__(self) -> None:
+        """Run the command unless it was cancelled."""
+        if self._claim.acquire(blocking=False):
+            self._command()
 
 
 class CanvasManager:
-    """Manager for multiple canvases."""
+    """Manager for multiple canvases.
 
-    def __init__(self):
-        """Initialize canvas manager."""
+    The canvas table is guarded by a lock so canvases can be created and
+    removed concurrently from MCP request handlers.
+    """
+
+    def __init__(self, headless: bool = False):
+        """Initialize canvas manager.
+
+        Args:
+            headless: Create canvases that render offscreen by default
+        """
         self.canvases: dict[str, Canvas] = {}
         self.active_canvas: str | None = None
         self._auto_start = True  # Auto-start canvases for MCP use
+        self._headless = headless
+        self._lock = threading.RLock()
+        # widget_id -> {canvas_id: (canvas, widget)} across all canvases
+        self._widget_index: dict[str, dict[str, tuple[Canvas, Widget]]] = {}
         logger.info("Initialized CanvasManager")
 
     def create_canvas(
@@ -247,23 +1049,81 @@ class CanvasManager:
             auto_start: Whether to auto-start the canvas (defaults to self._auto_start)
             **props: Canvas properties (width, height, mode, title, etc.)
         """
-        if canvas_id in self.canvases:
-            raise ValueError(f"Canvas {canvas_id} already exists")
+        with self._lock:
+            if canvas_id in self.canvases:
+                raise ValueError(f"Canvas {canvas_id} already exists")
 
-        canvas = Canvas(canvas_id, **props)
-        self.canvases[canvas_id] = canvas
+            props.setdefault("headless", self._headless)
+            canvas = Canvas(canvas_id, **props)
+            canvas.widget_registry.listener = partial(self._index_widget, canvas)
+            self.canvases[canvas_id] = canvas
 
-        # Set as active if first canvas
-        if self.active_canvas is None:
-            self.active_canvas = canvas_id
+            # Set as active if first canvas
+            if self.active_canvas is None:
+                self.active_canvas = canvas_id
 
         # Auto-start canvas if enabled
+        started = self.start_canvas(canvas, auto_start)
+
+        logger.info(f"Created canvas {canvas_id} (auto_start={started})")
+        return canvas
+
+    async def create_canvas_async(
+        self, canvas_id: str, auto_start: bool | None = None, **props
+    ) -> Canvas:
+        """Create a new canvas and await its first frame if auto-started.
+
+        Args:
+            canvas_id: Unique canvas identifier
+            auto_start: Whether to auto-start the canvas (defaults to self._auto_start)
+            **props: Canvas properties (width, height, mode, title, etc.)
+
+        Raises:
+            RuntimeError: If the canvas was to be started but did not render
+                its first frame; it is removed again
+        """
+        canvas = self.create_canvas(canvas_id, auto_start=False, **props)
+        await self.start_canvas_async(canvas, auto_start)
+        return canvas
+
+    def start_canvas(self, canvas: Canvas, auto_start: bool | None = None) -> bool:
+        """Start a canvas created with ``auto_start=False`` if it should run.
+
+        Lets a canvas be filled in before its render thread starts.
+
+        Args:
+            canvas: Canvas created by this manager
+            auto_start: Whether to start the canvas (defaults to self._auto_start)
+
+        Returns:
+            True if the canvas was started
+        """
         should_auto_start = auto_start if auto_start is not None else self._auto_start
         if should_auto_start:
             canvas.run_async()
+        return should_auto_start
 
-        logger.info(f"Created canvas {canvas_id} (auto_start={should_auto_start})")
-        return canvas
+    async def start_canvas_async(
+        self, canvas: Canvas, auto_start: bool | None = None
+    ) -> bool:
+        """Async variant of ``start_canvas`` that awaits the first frame.
+
+        Args:
+            canvas: Canvas created by this manager
+            auto_start: Whether to start the canvas (defaults to self._auto_start)
+
+        Returns:
+            True if the canvas was started
+
+        Raises:
+            RuntimeError: If the canvas did not render its first frame; it is
+                removed again
+        """
+        should_auto_start = auto_start if auto_start is not None else self._auto_start
+        if should_auto_start and not await canvas.start_async():
+            self.remove_canvas(canvas.state.canvas_id)
+            raise RuntimeError(f"Canvas {canvas.state.canvas_id} failed to start")
+        return should_auto_start
 
     def get_canvas(self, canvas_id: str) -> Canvas | None:
         """Get a canvas by ID."""
@@ -271,10 +1131,10 @@ class CanvasManager:
 
     def remove_canvas(self, canvas_id: str) -> bool:
         """Remove a canvas."""
-        if canvas_id in self.canvases:
-            canvas = self.canvases[canvas_id]
-            canvas.stop()
-            del self.canvases[canvas_id]
+        with self._lock:
+            canvas = self.canvases.pop(canvas_id, None)
+            if canvas is None:
+                return False
 
             # Update active canvas
             if self.active_canvas == canvas_id:
@@ -282,13 +1142,50 @@ class CanvasManager:
                     next(iter(self.canvases.keys())) if self.canvases else None
                 )
 
-            logger.info(f"Removed canvas {canvas_id}")
-            return True
-        return False
+            canvas.widget_registry.listener = None
+            for widget_id in canvas.widget_registry.list():
+                self._index_widget(canvas, widget_id, None)
+
+        canvas.stop()
+        canvas_removed.send(self, canvas=canvas)
+        logger.info(f"Removed canvas {canvas_id}")
+        return True
+
+    def find_widgets(self, widget_id: str) -> list[tuple[Canvas, Widget]]:
+        """Find widgets with an ID on any canvas (one dict lookup).
+
+        Args:
+            widget_id: Widget identifier
+
+        Returns:
+            ``(canvas, widget)`` pairs, one per canvas holding the ID
+        """
+        with self._lock:
+            entries = self._widget_index.get(widget_id)
+            return list(entries.values()) if entries else []
+
+    def _index_widget(
+        self, canvas: Canvas, widget_id: str, widget: Widget | None
+    ) -> None:
+        """Keep the global widget index in step with a canvas registry."""
+        canvas_id = canvas.state.canvas_id
+        with self._lock:
+            if widget is not None:
+                self._widget_index.setdefault(widget_id, {})[canvas_id] = (
+                    canvas,
+                    widget,
+                )
+                return
+            entries = self._widget_index.get(widget_id)
+            if entries is not None:
+                entries.pop(canvas_id, None)
+                if not entries:
+                    del self._widget_index[widget_id]
 
     def list_canvases(self) -> list[str]:
         """List all canvas IDs."""
-        return list(self.canvases.keys())
+        with self._lock:
+            return list(self.canvases.keys())
 
     def set_active_canvas(self, canvas_id: str) -> bool:
         """Set the active canvas."""
@@ -306,7 +1203,9 @@ class CanvasManager:
 
     def render_all(self) -> None:
         """Render all active canvases."""
-        for canvas in self.canvases.values():
+        with self._lock:
+            canvases = list(self.canvases.values())
+        for canvas in canvases:
             if canvas.state.active:
                 canvas.render()
 
@@ -329,9 +1228,30 @@ class CanvasManager:
 
         return True
 
+    async def ensure_canvas_running_async(self, canvas_id: str) -> bool:
+        """Async variant of ``ensure_canvas_running`` that awaits readiness.
+
+        Args:
+            canvas_id: Canvas identifier
+
+        Returns:
+            True if canvas is running, False if canvas doesn't exist
+        """
+        canvas = self.get_canvas(canvas_id)
+        if not canvas:
+            return False
+
+        if not canvas._running:
+            logger.info(f"Auto-starting canvas {canvas_id}")
+            await canvas.start_async()
+
+        return True
+
     def stop_all(self) -> None:
         """Stop all running canvases."""
-        for canvas in self.canvases.values():
+        with self._lock:
+            canvases = list(self.canvases.values())
+        for canvas in canvases:
             if canvas._running:
                 canvas.stop()
         logger.info("Stopped all canvases")
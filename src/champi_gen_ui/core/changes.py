@@ -0,0 +1,223 @@
+"""Revisioned change log for canvas state.
+
+Every recorded mutation of a canvas bumps its revision and is kept, up to a
+fixed number of entries, as a JSON Patch (RFC 6902) style operation against
+the canvas's serialized state (``Canvas.serialize()``):
+
+* ``add``: set an object member (a new widget, or a widget property)
+* ``replace``: set an existing field (``visible``, ``children``, ``title``...)
+* ``remove``: delete a widget
+* ``extend``: append ``value`` (a list) to the array at ``path``. This is the
+  one operation RFC 6902 does not define; it keeps plot appends small.
+
+Clients that know the state at some revision fetch the operations since then
+instead of the whole state. When the log no longer reaches back that far,
+they have to fall back to a full snapshot.
+
+Values are stored by reference and converted to plain JSON types only when
+changes are read, so recording costs one entry per mutation. A write that
+overwrites a path releases the values of earlier entries at that path:
+any client that would need them receives the newer write instead. The log
+is bounded by the number of entries and by the bytes of array and sequence
+values it keeps alive; dropping old entries only moves the revision below
+which clients fall back to a full snapshot.
+"""
+
+import threading
+from collections import deque
+from collections.abc import Mapping
+from itertools import islice
+from typing import Any
+
+import numpy as np
+
+from champi_gen_ui.core.widget import Widget
+
+# Operations that overwrite everything at and below their path
+_OVERWRITING = frozenset({"add", "replace", "remove"})
+
+# Fields of a log entry (a list, so superseded values can be released)
+_REVISION, _OP, _PATH, _VALUE, _SIZE = range(5)
+
+
+def pointer(path: tuple[str, ...]) -> str:
+    """Build a JSON Pointer (RFC 6901) from path segments."""
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in path
+    )
+
+
+def _plain(value: Any) -> Any:
+    """Convert a recorded value to plain JSON types."""
+    if isinstance(value, Widget):
+        return value.serialize()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    return value
+
+
+def _retained_size(value: Any) -> int:
+    """Estimate the bytes a recorded value keeps alive."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, str | bytes):
+        return len(value)
+    if isinstance(value, list | tuple):
+        return 8 * len(value)
+    return 0
+
+
+def coalesce(
+    entries: list[tuple[int, str, tuple[str, ...], Any]],
+) -> list[tuple[int, str, tuple[str, ...], Any]]:
+    """Drop operations that later ones in the same list make redundant.
+
+    An operation is dropped when a later ``add``/``replace``/``remove``
+    writes its path or one of its ancestors. A widget both added and removed
+    within the list is dropped entirely. Added widgets are read in their
+    current state, so later operations on them are dropped too.
+
+    Args:
+        entries: (revision, op, path, value) tuples, oldest first
+
+    Returns:
+        The remaining entries, oldest first
+    """
+    first_op: dict[tuple[str, ...], str] = {}
+    for _, op, path, _ in entries:
+        first_op.setdefault(path, op)
+
+    written: set[tuple[str, ...]] = set()
+    kept = []
+    for entry in reversed(entries):
+        _, op, path, _ = entry
+        if any(path[:depth] in written for depth in range(len(path) + 1)):
+            continue
+        if op in _OVERWRITING:
+            written.add(path)
+        if op == "remove" and first_op[path] == "add":
+            # Created after the client's revision: it never saw it
+            continue
+        kept.append(entry)
+    kept.reverse()
+
+    live: set[tuple[str, ...]] = set()
+    result = []
+    for entry in kept:
+        _, _, path, value = entry
+        if any(path[:depth] in live for depth in range(1, len(path))):
+            continue
+        if isinstance(value, Widget):
+            live.add(path)
+        result.append(entry)
+    return result
+
+
+class ChangeLog:
+    """Bounded log of revisioned state changes for one canvas.
+
+    Recording is thread-safe. Paths are tuples of segments; they are turned
+    into JSON Pointers when changes are read.
+    """
+
+    def __init__(self, capacity: int = 10_000, max_bytes: int = 64 << 20):
+        """Initialize change log.
+
+        Args:
+            capacity: Number of operations to keep
+            max_bytes: Approximate bytes of values to keep alive (NumPy
+                arrays, strings and sequences); the oldest operations are
+                dropped beyond it
+        """
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self._entries: deque[list[Any]] = deque()
+        # Live entries per path, oldest first, whose values a later write
+        # to the path would supersede
+        self._by_path: dict[tuple[str, ...], deque[list[Any]]] = {}
+        self._bytes = 0
+        self._revision = 0
+        self._lock = threading.Lock()
+
+    @property
+    def revision(self) -> int:
+        """Revision of the latest recorded change (0 before any change)."""
+        return self._revision
+
+    @property
+    def retained_bytes(self) -> int:
+        """Approximate bytes of values currently kept by the log."""
+        return self._bytes
+
+    def record(self, op: str, path: tuple[str, ...], value: Any = None) -> int:
+        """Record one operation.
+
+        Args:
+            op: ``add``, ``replace``, ``remove`` or ``extend``
+            path: Path segments below the serialized canvas state
+            value: New value (ignored for ``remove``)
+
+        Returns:
+            The new revision
+        """
+        size = _retained_size(value)
+        with self._lock:
+            self._revision += 1
+            entry = [self._revision, op, path, value, size]
+            if op in _OVERWRITING:
+                # Clients that would read the old values get this write too
+                for old in self._by_path.pop(path, ()):
+                    self._bytes -= old[_SIZE]
+                    old[_VALUE] = None
+                    old[_SIZE] = 0
+            if op != "remove":
+                self._by_path.setdefault(path, deque()).append(entry)
+            self._entries.append(entry)
+            self._bytes += size
+
+            entries = self._entries
+            while len(entries) > self.capacity or (
+                self._bytes > self.max_bytes and len(entries) > 1
+            ):
+                old = entries.popleft()
+                self._bytes -= old[_SIZE]
+                live = self._by_path.get(old[_PATH])
+                if live and live[0] is old:
+                    live.popleft()
+                    if not live:
+                        del self._by_path[old[_PATH]]
+            return self._revision
+
+    def since(self, revision: int) -> tuple[int, list[dict[str, Any]] | None]:
+        """Get the operations recorded after a revision, coalesced.
+
+        Args:
+            revision: Revision the client has applied
+
+        Returns:
+            (current revision, patch). The patch is None if the log does not
+            reach back to ``revision`` or the revision is unknown.
+        """
+        with self._lock:
+            current = self._revision
+            if revision == current:
+                return current, []
+            oldest = self._entries[0][0] if self._entries else current + 1
+            if revision < oldest - 1 or revision > current:
+                return current, None
+            entries = [
+                (entry[_REVISION], entry[_OP], entry[_PATH], entry[_VALUE])
+                for entry in islice(self._entries, revision - oldest + 1, None)
+            ]
+
+        patch = []
+        for _, op, path, value in coalesce(entries):
+            operation = {"op": op, "path": pointer(path)}
+            if op != "remove":
+                operation["value"] = _plain(value)
+            patch.append(operation)
+        return current, patch
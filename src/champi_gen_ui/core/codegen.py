@@ -1,5 +1,73 @@
 """Code generation for creating UI from specifications."""
 
+import re
+from keyword import iskeyword
+from typing import Any
+
+import numpy as np
+
+from champi_gen_ui.core.schema import (
+    WIDGET_FIELDS,
+    describe_canvas,
+    describe_widget,
+    plain,
+    widget_schema,
+)
+from champi_gen_ui.core.state import CanvasMode
+
+# Types that repr() as Python literals
+_LITERAL_TYPES = (str, int, float, bool, type(None))
+
+
+def _literals(values: Any) -> list[str] | None:
+    """Format each of several values as a literal (None if one has no form)."""
+    literals = []
+    for value in values:
+        literal = _literal(value)
+        if literal is None:
+            return None
+        literals.append(literal)
+    return literals
+
+
+def _literal(value: Any) -> str | None:
+    """Format a value as a Python literal (None if it has no literal form)."""
+    if isinstance(value, np.ndarray | np.generic):
+        value = value.tolist()
+    if isinstance(value, list | tuple):
+        items = _literals(value)
+        if items is None:
+            return None
+        if isinstance(value, list):
+            return f"[{', '.join(items)}]"
+        return f"({items[0]},)" if len(items) == 1 else f"({', '.join(items)})"
+    if isinstance(value, dict):
+        keys = _literals(value.keys())
+        values = _literals(value.values())
+        if keys is None or values is None:
+            return None
+        pairs = (f"{key}: {item}" for key, item in zip(keys, values, strict=True))
+        return "{" + ", ".join(pairs) + "}"
+    if isinstance(value, _LITERAL_TYPES):
+        text = repr(value)
+        # nan and inf have no literal
+        return f"float({text!r})" if text in ("nan", "inf", "-inf") else text
+    return None
+
+
+def _variable_name(widget_id: str, used: set[str]) -> str:
+    """Make a unique Python identifier for a widget variable."""
+    name = re.sub(r"\W", "_", widget_id)
+    if not name or name[0].isdigit() or iskeyword(name):
+        name = f"widget_{name}"
+    candidate = name
+    suffix = 2
+    while candidate in used:
+        candidate = f"{name}_{suffix}"
+        suffix += 1
+    used.add(candidate)
+    return candidate
+
 
 class CodeGenerator:
     """Generator for Python code from UI components."""
@@ -15,6 +83,8 @@ class CodeGenerator:
         Returns:
             Python code as string
         """
+        description = describe_canvas(canvas)
+        mode = CanvasMode(description["mode"])
         code_lines = [
             '"""Generated UI code."""',
             "",
@@ -29,25 +99,38 @@ class CodeGenerator:
             "    # Create canvas manager",
             "    canvas_manager = CanvasManager()",
             "",
-            f"    # Create canvas: {canvas.canvas_id}",
+            f"    # Create canvas: {description['id']}",
             "    canvas = canvas_manager.create_canvas(",
-            f'        canvas_id="{canvas.canvas_id}",',
-            f"        width={canvas.state.width},",
-            f"        height={canvas.state.height},",
-            f"        mode=CanvasMode.{canvas.state.mode.name},",
-            f'        title="{canvas.state.title}",',
+            f"        canvas_id={description['id']!r},",
+            f"        width={description['width']},",
+            f"        height={description['height']},",
+            f"        mode=CanvasMode.{mode.name},",
+            f"        title={description['title']!r},",
             "    )",
             "",
         ]
 
         # Generate widget creation code
-        widgets = canvas.widget_registry.get_all().values()
+        widgets = canvas.snapshot_widgets()
         if widgets:
             code_lines.append("    # Create widgets")
 
+        names: set[str] = set()
+        parents = []
         for widget in widgets:
-            widget_code = CodeGenerator._generate_widget_code(widget, indent=1)
+            widget_code = CodeGenerator._generate_widget_code(widget, 0, names)
             code_lines.extend(widget_code)
+            if widget.state.parent is not None:
+                parents.append((widget.widget_id, widget.state.parent))
+
+        # Parents may be created after their children, so nest at the end
+        if parents:
+            code_lines.append("    # Nest widgets in their containers")
+            for widget_id, parent_id in parents:
+                code_lines.append(
+                    f"    canvas.set_widget_parent({widget_id!r}, {parent_id!r})"
+                )
+            code_lines.append("")
 
         code_lines.extend(
             [
@@ -64,49 +147,63 @@ class CodeGenerator:
         return "\n".join(code_lines)
 
     @staticmethod
-    def _generate_widget_code(widget, indent: int = 0) -> list[str]:
-        """Generate code for a widget."""
+    def _generate_widget_code(
+        widget, indent: int = 0, names: set[str] | None = None
+    ) -> list[str]:
+        """Generate code for a widget.
+
+        Args:
+            widget: Widget instance
+            indent: Extra indentation levels within the function body
+            names: Variable names already used in the generated code; the
+                widget's variable name is added to it
+
+        Returns:
+            Code lines
+        """
         indent_str = "    " * indent
-        widget_type = widget.__class__.__name__
-        widget_id = widget.widget_id
+        schema = widget_schema(type(widget))
+        description = describe_widget(widget)
+        widget_type = description["widget_type"]
+        widget_id = description["id"]
+        name = _variable_name(widget_id, names if names is not None else set())
 
         lines = [f"{indent_str}    # Create {widget_type}: {widget_id}"]
 
-        # Build constructor arguments
-        args = [f'"{widget_id}"']
-
-        # Add common properties
-        props = widget.state.properties
-        for key, value in props.items():
-            if value is not None:
-                if isinstance(value, str):
-                    args.append(f'{key}="{value}"')
-                elif isinstance(value, list | tuple):
-                    args.append(f"{key}={list(value)}")
-                elif isinstance(value, bool | int | float):
-                    args.append(f"{key}={value}")
+        # Build constructor arguments, leaving out constructor defaults and
+        # properties the constructor does not take
+        args = [repr(widget_id)]
+        for key, value in description["properties"].items():
+            if value is None or schema.is_default(key, value):
+                continue
+            if not schema.open_properties and key not in schema.parameters:
+                continue
+            literal = _literal(value)
+            if literal is not None and key.isidentifier() and not iskeyword(key):
+                args.append(f"{key}={literal}")
 
         # Generate widget creation
         if len(args) <= 3:
-            widget_line = f"{indent_str}    {widget_id.replace('.', '_')} = {widget_type}({', '.join(args)})"
+            lines.append(f"{indent_str}    {name} = {widget_type}({', '.join(args)})")
         else:
-            widget_line = (
-                f"{indent_str}    {widget_id.replace('.', '_')} = {widget_type}("
-            )
-            lines.append(widget_line)
-            for i, arg in enumerate(args):
-                comma = "," if i < len(args) - 1 else ""
-                lines.append(f"{indent_str}        {arg}{comma}")
+            lines.append(f"{indent_str}    {name} = {widget_type}(")
+            for arg in args:
+                lines.append(f"{indent_str}        {arg},")
             lines.append(f"{indent_str}    )")
-            widget_line = None
 
-        if widget_line:
-            lines.append(widget_line)
+        # Restore state that differs from a new widget's
+        for field, default in WIDGET_FIELDS:
+            value = description[field]
+            if field == "parent" or value == default:
+                continue
+            items = value if isinstance(value, tuple | list) else (value,)
+            literals = _literals(items)
+            if literals is not None:
+                value_args = ", ".join(literals)
+                lines.append(f"{indent_str}    {name}.set_{field}({value_args})")
 
         # Add to canvas
-        lines.append(
-            f"{indent_str}    canvas.add_widget({widget_id.replace('.', '_')})"
-        )
+        lines.append(f"{indent_str}    canvas.add_widget({name})")
         lines.append("")
 
         return lines
@@ -193,6 +290,18 @@ theme = Theme(
 class MarkupGenerator:
     """Generator for markup-based UI specifications."""
 
+    @staticmethod
+    def _widget_spec(widget) -> dict[str, Any]:
+        """Describe a widget with plain values, leaving out default state."""
+        description = describe_widget(widget)
+        spec = {"type": description["widget_type"], "id": description["id"]}
+        for field, default in WIDGET_FIELDS:
+            if description[field] != default:
+                spec[field] = description[field]
+        spec["properties"] = description["properties"]
+        result: dict[str, Any] = plain(spec)
+        return result
+
     @staticmethod
     def generate_yaml(canvas) -> str:
         """
@@ -207,20 +316,10 @@ class MarkupGenerator:
         import yaml
 
         data = {
-            "canvas": {
-                "id": canvas.canvas_id,
-                "title": canvas.state.title,
-                "width": canvas.state.width,
-                "height": canvas.state.height,
-                "mode": canvas.state.mode.value,
-            },
+            "canvas": describe_canvas(canvas),
             "widgets": [
-                {
-                    "type": widget.__class__.__name__,
-                    "id": widget.widget_id,
-                    "properties": dict(widget.state.properties),
-                }
-                for widget in canvas.widget_registry.get_all().values()
+                MarkupGenerator._widget_spec(widget)
+                for widget in canvas.snapshot_widgets()
             ],
         }
 
@@ -239,22 +338,12 @@ class MarkupGenerator:
         """
         import toml
 
-        data = {
-            "canvas": {
-                "id": canvas.canvas_id,
-                "title": canvas.state.title,
-                "width": canvas.state.width,
-                "height": canvas.state.height,
-                "mode": canvas.state.mode.value,
-            },
-            "widgets": {
-                widget.widget_id: {
-                    "type": widget.__class__.__name__,
-                    "properties": dict(widget.state.properties),
-                }
-                for widget in canvas.widget_registry.get_all().values()
-            },
-        }
+        widgets = {}
+        for widget in canvas.snapshot_widgets():
+            spec = MarkupGenerator._widget_spec(widget)
+            widgets[spec.pop("id")] = spec
+
+        data = {"canvas": describe_canvas(canvas), "widgets": widgets}
 
         return toml.dumps(data)
 
@@ -291,7 +380,8 @@ class {component_name}Component:
 
         for i, widget_type in enumerate(widgets):
             widget_id = f"{{self.component_id}}.widget_{i}"
-            code += f"        self.widgets['{widget_type.lower()}_{i}'] = {widget_type}('{widget_id}')\n"
+            key = f"{widget_type.lower()}_{i}"
+            code += f"        self.widgets['{key}'] = {widget_type}('{widget_id}')\n"
 
         code += """
     def render(self, canvas):
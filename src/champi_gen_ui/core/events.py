@@ -0,0 +1,293 @@
+"""Subscriptions to widget interaction events.
+
+Widgets announce interactions through blinker signals on the render thread:
+``widget_event`` for triggered callbacks (``on_click``...) and
+``widget_edited`` for values changed by user input. An ``EventHub`` turns
+those into per-subscription event queues that other threads (MCP request
+handlers) drain.
+
+Queues are coalesced and bounded, so a slow consumer costs a fixed amount
+of memory:
+
+* ``click`` events of a widget collapse into one event with a ``count``
+* ``change`` events of a widget property collapse into one event holding
+  the latest ``value``
+* Once ``max_pending`` distinct events are queued, new ones are dropped and
+  counted until the queue is drained
+
+A subscription's ``notify`` callback runs only when its queue goes from empty
+to non-empty, so a consumer gets at most one wake-up per drain.
+
+Subscriptions to a canvas are dropped when the canvas is removed from its
+manager.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from champi_gen_ui.core.state import canvas_removed, widget_edited, widget_event
+
+if TYPE_CHECKING:
+    from champi_gen_ui.core.canvas import Canvas
+    from champi_gen_ui.core.widget import Widget
+
+# Event types a subscription receives unless it asks for others
+EVENT_TYPES = frozenset({"click", "change"})
+
+# Callback events reported as event types
+_CALLBACK_EVENTS = {"on_click": "click"}
+
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve a waiter from its event loop thread, unless it was cancelled."""
+    if not future.done():
+        future.set_result(None)
+
+
+class EventSubscription:
+    """Coalesced, bounded queue of interaction events for one consumer."""
+
+    def __init__(
+        self,
+        subscription_id: str,
+        canvas: "Canvas",
+        widget_ids: Iterable[str] | None = None,
+        event_types: Iterable[str] | None = None,
+        max_pending: int = 256,
+        notify: Callable[[], None] | None = None,
+    ):
+        """Initialize subscription.
+
+        Args:
+            subscription_id: Unique subscription identifier
+            canvas: Canvas whose widgets are watched
+            widget_ids: Only report these widgets (all if None)
+            event_types: Only report these event types (``EVENT_TYPES`` if None)
+            max_pending: Maximum number of queued (coalesced) events
+            notify: Called when the queue goes from empty to non-empty
+        """
+        self.subscription_id = subscription_id
+        self.canvas = canvas
+        self.widget_ids = frozenset(widget_ids) if widget_ids is not None else None
+        self.event_types = (
+            frozenset(event_types) if event_types is not None else EVENT_TYPES
+        )
+        self.max_pending = max_pending
+        self.notify = notify
+        self._pending: dict[tuple[str, ...], dict[str, Any]] = {}
+        self._dropped = 0
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._lock = threading.Lock()
+
+    def matches(self, widget: "Widget", event_type: str) -> bool:
+        """Whether an event of a widget passes this subscription's filters."""
+        return (
+            widget._registry is self.canvas.widget_registry
+            and event_type in self.event_types
+            and (self.widget_ids is None or widget.widget_id in self.widget_ids)
+        )
+
+    def push(
+        self,
+        event_type: str,
+        widget_id: str,
+        property_name: str | None = None,
+        value: Any = None,
+    ) -> None:
+        """Queue an event, coalescing it with a pending one of the same key."""
+        key = (event_type, widget_id, property_name or "")
+        now = time.time()
+        with self._lock:
+            was_empty = not self._pending and not self._dropped
+            event = self._pending.get(key)
+            if event is not None:
+                event["count"] += 1
+                event["timestamp"] = now
+                if property_name is not None:
+                    event["value"] = value
+            elif len(self._pending) >= self.max_pending:
+                self._dropped += 1
+            else:
+                event = {"type": event_type, "widget_id": widget_id}
+                if property_name is not None:
+                    event["property"] = property_name
+                    event["value"] = value
+                event["count"] = 1
+                event["timestamp"] = now
+                self._pending[key] = event
+            waiters = self._waiters if was_empty else []
+            if was_empty:
+                self._waiters = []
+
+        if was_empty:
+            for loop, future in waiters:
+                loop.call_soon_threadsafe(_wake, future)
+            if self.notify is not None:
+                try:
+                    self.notify()
+                except Exception as e:
+                    logger.error(
+                        f"Error notifying subscription {self.subscription_id}: {e}"
+                    )
+
+    def drain(self, max_events: int | None = None) -> dict[str, Any]:
+        """Take queued events, oldest first.
+
+        Args:
+            max_events: Maximum number of events to take (all if None)
+
+        Returns:
+            ``events``, the number of events ``dropped`` since the last drain
+            because the queue was full, and the number still ``pending``
+        """
+        with self._lock:
+            keys = list(itertools.islice(self._pending, max_events))
+            events = [self._pending.pop(key) for key in keys]
+            dropped, self._dropped = self._dropped, 0
+            pending = len(self._pending)
+        return {"events": events, "dropped": dropped, "pending": pending}
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait until events are queued.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Whether events are queued
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._pending or self._dropped:
+                return True
+            self._waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            with self._lock:
+                if (loop, future) in self._waiters:
+                    self._waiters.remove((loop, future))
+        return bool(self._pending or self._dropped)
+
+
+class EventHub:
+    """Routes widget interaction signals to event subscriptions."""
+
+    def __init__(self):
+        """Initialize hub and connect to the widget and canvas signals."""
+        self._subscriptions: dict[str, EventSubscription] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        widget_event.connect(self._on_widget_event)
+        widget_edited.connect(self._on_widget_edited)
+        canvas_removed.connect(self._on_canvas_removed)
+
+    def subscribe(
+        self,
+        canvas: "Canvas",
+        widget_ids: Iterable[str] | None = None,
+        event_types: Iterable[str] | None = None,
+        max_pending: int = 256,
+        notify: Callable[[], None] | None = None,
+        notify_factory: Callable[[str], Callable[[], None]] | None = None,
+    ) -> EventSubscription:
+        """Create a subscription to a canvas's widget events.
+
+        Args:
+            canvas: Canvas whose widgets are watched
+            widget_ids: Only report these widgets (all if None)
+            event_types: Only report these event types (``EVENT_TYPES`` if None)
+            max_pending: Maximum number of queued (coalesced) events
+            notify: Called when the queue goes from empty to non-empty
+            notify_factory: Builds ``notify`` from the new subscription's ID,
+                for callbacks that need it; called before the subscription
+                is registered, so no event can arrive without a callback
+
+        Returns:
+            The new subscription
+
+        Raises:
+            ValueError: If an event type is unknown or max_pending is not positive
+        """
+        if event_types is not None:
+            unknown = set(event_types) - EVENT_TYPES
+            if unknown:
+                raise ValueError(f"Unknown event types: {sorted(unknown)}")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        subscription_id = f"sub_{next(self._ids)}"
+        if notify_factory is not None:
+            notify = notify_factory(subscription_id)
+        subscription = EventSubscription(
+            subscription_id, canvas, widget_ids, event_types, max_pending, notify
+        )
+        with self._lock:
+            self._subscriptions[subscription_id] = subscription
+        logger.info(
+            f"Created event subscription {subscription_id} "
+            f"for canvas {canvas.state.canvas_id}"
+        )
+        return subscription
+
+    def unsubscribe(self, subscription_id: str) -> bool:
+        """Remove a subscription."""
+        with self._lock:
+            removed = self._subscriptions.pop(subscription_id, None)
+        if removed is not None:
+            logger.info(f"Removed event subscription {subscription_id}")
+        return removed is not None
+
+    def get(self, subscription_id: str) -> EventSubscription | None:
+        """Get a subscription by ID."""
+        return self._subscriptions.get(subscription_id)
+
+    def list(self) -> list[str]:
+        """List subscription IDs."""
+        with self._lock:
+            return list(self._subscriptions)
+
+    def publish(
+        self,
+        widget: "Widget",
+        event_type: str,
+        property_name: str | None = None,
+        value: Any = None,
+    ) -> None:
+        """Queue an event on every subscription it passes the filters of."""
+        if not self._subscriptions:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions.values())
+        for subscription in subscriptions:
+            if subscription.matches(widget, event_type):
+                subscription.push(event_type, widget.widget_id, property_name, value)
+
+    def _on_widget_event(self, sender, **kwargs) -> None:
+        """Publish triggered callbacks that map to event types."""
+        event_type = _CALLBACK_EVENTS.get(kwargs["event"])
+        if event_type is not None:
+            self.publish(kwargs["widget"], event_type)
+
+    def _on_widget_edited(self, sender, **kwargs) -> None:
+        """Publish values changed by user input."""
+        self.publish(kwargs["widget"], "change", kwargs["property"], kwargs["value"])
+
+    def _on_canvas_removed(self, sender, **kwargs) -> None:
+        """Drop the subscriptions to a removed canvas."""
+        canvas = kwargs["canvas"]
+        with self._lock:
+            removed = [
+                subscription_id
+                for subscription_id, subscription in self._subscriptions.items()
+                if subscription.canvas is canvas
+            ]
+        for subscription_id in removed:
+            self.unsubscribe(subscription_id)
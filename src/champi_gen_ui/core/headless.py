@@ -0,0 +1,323 @@
+"""Headless offscreen rendering backend.
+
+Drives an ImGui context without a window or GPU so canvases can run on
+display-less hosts and in CI. Frames are built exactly as in windowed mode;
+draw data is only rasterized (in software, with numpy) when a capture is
+requested, so an idle headless canvas costs little more than its widget code.
+"""
+
+import ctypes
+import struct
+import threading
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+import numpy as np
+from imgui_bundle import imgui, implot
+from loguru import logger
+
+# ImGui keeps its current context in a process-wide global, so frames of
+# different headless canvases must not interleave.
+_context_lock = threading.RLock()
+
+_VERTEX_DTYPE = np.dtype([("pos", "<f4", 2), ("uv", "<f4", 2), ("col", "<u4")])
+_INDEX_DTYPE = np.dtype("<u4")
+
+
+def _read_vector(vector, dtype: np.dtype) -> np.ndarray:
+    """Copy an ImVector's contents into a numpy array."""
+    count = vector.size()
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    raw = (ctypes.c_char * (count * dtype.itemsize)).from_address(vector.data_address())
+    return np.frombuffer(raw, dtype=dtype).copy()
+
+
+def _unpack_colors(packed: np.ndarray) -> np.ndarray:
+    """Unpack ImU32 (ABGR) colors into float RGBA in [0, 1]."""
+    channels = (packed[..., None] >> np.array([0, 8, 16, 24], dtype=np.uint32)) & 0xFF
+    return channels.astype(np.float32) / 255.0
+
+
+class SoftwareRenderer:
+    """Rasterize ImGui draw data into an RGBA framebuffer.
+
+    Implements the renderer side of ImGui's texture protocol (create, update
+    and destroy requests) and blends triangles the way the OpenGL backend
+    does: ``SRC_ALPHA, ONE_MINUS_SRC_ALPHA`` with nearest texture sampling.
+    """
+
+    def __init__(self):
+        """Initialize renderer."""
+        self._textures: dict[int, np.ndarray] = {}
+        self._next_texture_id = 1
+
+    def update_textures(self, draw_data: imgui.ImDrawData) -> None:
+        """Handle pending texture requests (call after ``imgui.render``)."""
+        for i in range(draw_data.textures.size()):
+            texture = draw_data.textures[i]
+            status = texture.status
+            if status in (
+                imgui.ImTextureStatus.want_create,
+                imgui.ImTextureStatus.want_updates,
+            ):
+                texture_id = texture.tex_id or self._next_texture_id
+                if texture_id == self._next_texture_id:
+                    self._next_texture_id += 1
+                self._textures[texture_id] = self._convert_texture(texture)
+                texture.set_tex_id(texture_id)
+                texture.set_status(imgui.ImTextureStatus.ok)
+            elif status == imgui.ImTextureStatus.want_destroy:
+                self._textures.pop(texture.tex_id, None)
+                texture.set_tex_id(0)
+                texture.set_status(imgui.ImTextureStatus.destroyed)
+
+    @staticmethod
+    def _convert_texture(texture: imgui.ImTextureData) -> np.ndarray:
+        """Convert texture pixels to float RGBA."""
+        pixels = texture.get_pixels_array().reshape(
+            texture.height, texture.width, texture.bytes_per_pixel
+        )
+        if texture.format == imgui.ImTextureFormat.alpha8:
+            rgba = np.ones((texture.height, texture.width, 4), dtype=np.float32)
+            rgba[..., 3] = pixels[..., 0] / 255.0
+            return rgba
+        return pixels.astype(np.float32) / 255.0
+
+    def render(self, draw_data: imgui.ImDrawData) -> np.ndarray:
+        """Rasterize draw data.
+
+        Args:
+            draw_data: Draw data from ``imgui.get_draw_data()``
+
+        Returns:
+            ``(height, width, 4)`` uint8 RGBA array
+        """
+        width = int(draw_data.display_size.x)
+        height = int(draw_data.display_size.y)
+        target = np.zeros((height, width, 4), dtype=np.float32)
+        target[..., 3] = 1.0
+        origin = np.array(
+            [draw_data.display_pos.x, draw_data.display_pos.y], dtype=np.float32
+        )
+
+        for n in range(draw_data.cmd_lists.size()):
+            draw_list = draw_data.cmd_lists[n]
+            vertices = _read_vector(draw_list.vtx_buffer, _VERTEX_DTYPE)
+            indices = _read_vector(draw_list.idx_buffer, _INDEX_DTYPE)
+            positions = vertices["pos"] - origin
+            uvs = vertices["uv"]
+            colors = _unpack_colors(vertices["col"])
+
+            for c in range(draw_list.cmd_buffer.size()):
+                cmd = draw_list.cmd_buffer[c]
+                if cmd.user_callback_data is not None or cmd.elem_count == 0:
+                    continue
+                clip = cmd.clip_rect
+                x0 = max(int(clip.x - origin[0]), 0)
+                y0 = max(int(clip.y - origin[1]), 0)
+                x1 = min(int(np.ceil(clip.z - origin[0])), width)
+                y1 = min(int(np.ceil(clip.w - origin[1])), height)
+                if x1 <= x0 or y1 <= y0:
+                    continue
+
+                texture = self._textures.get(cmd.get_tex_id())
+                triangles = (
+                    indices[cmd.idx_offset : cmd.idx_offset + cmd.elem_count].reshape(
+                        -1, 3
+                    )
+                    + cmd.vtx_offset
+                )
+                for tri in triangles:
+                    self._draw_triangle(
+                        target,
+                        (x0, y0, x1, y1),
+                        positions[tri],
+                        uvs[tri],
+                        colors[tri],
+                        texture,
+                    )
+
+        return (np.clip(target, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+    @staticmethod
+    def _draw_triangle(
+        target: np.ndarray,
+        clip: tuple[int, int, int, int],
+        pos: np.ndarray,
+        uv: np.ndarray,
+        col: np.ndarray,
+        texture: np.ndarray | None,
+    ) -> None:
+        """Rasterize and blend one triangle into the target."""
+        x0 = max(int(np.floor(pos[:, 0].min())), clip[0])
+        y0 = max(int(np.floor(pos[:, 1].min())), clip[1])
+        x1 = min(int(np.ceil(pos[:, 0].max())), clip[2])
+        y1 = min(int(np.ceil(pos[:, 1].max())), clip[3])
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        (ax, ay), (bx, by), (cx, cy) = pos
+        area = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        if area == 0:
+            return
+
+        px = np.arange(x0, x1, dtype=np.float32) + 0.5
+        py = np.arange(y0, y1, dtype=np.float32)[:, None] + 0.5
+        w0 = ((bx - px) * (cy - py) - (by - py) * (cx - px)) / area
+        w1 = ((cx - px) * (ay - py) - (cy - py) * (ax - px)) / area
+        w2 = 1.0 - w0 - w1
+        inside = (w0 >= 0) & (w1 >= 0) & (w2 >= 0)
+        if not inside.any():
+            return
+
+        weights = np.stack([w0, w1, w2], axis=-1)[inside]
+        src = weights @ col
+        if texture is not None:
+            tex_uv = weights @ uv
+            tex_h, tex_w = texture.shape[:2]
+            tx = np.clip((tex_uv[:, 0] * tex_w).astype(np.int32), 0, tex_w - 1)
+            ty = np.clip((tex_uv[:, 1] * tex_h).astype(np.int32), 0, tex_h - 1)
+            src = src * texture[ty, tx]
+
+        region = target[y0:y1, x0:x1]
+        dst = region[inside]
+        alpha = src[:, 3:4]
+        dst[:, :3] = src[:, :3] * alpha + dst[:, :3] * (1.0 - alpha)
+        dst[:, 3:4] = alpha + dst[:, 3:4] * (1.0 - alpha)
+        region[inside] = dst
+
+
+def encode_png(rgba: np.ndarray) -> bytes:
+    """Encode an RGBA array as PNG.
+
+    Args:
+        rgba: ``(height, width, 4)`` uint8 array
+
+    Returns:
+        PNG file contents
+    """
+    height, width = rgba.shape[:2]
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    # Filter type 0 (None) in front of every scanline
+    rows = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    rows[:, 1:] = rgba.reshape(height, width * 4)
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+class HeadlessBackend:
+    """Run ImGui frames with no window, GPU or display.
+
+    Owns an ImGui (and ImPlot) context and a software renderer. Captures are
+    requested from any thread and fulfilled at the end of the next frame.
+    """
+
+    def __init__(self, size: tuple[int, int]):
+        """Initialize backend.
+
+        Args:
+            size: Display size (width, height) in pixels
+        """
+        self.size = size
+        self.renderer = SoftwareRenderer()
+        self._context: imgui.internal.Context | None = None
+        self._implot_context: implot.internal.Context | None = None
+        self._captures: list[Future] = []
+        self._captures_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Create the ImGui and ImPlot contexts."""
+        with _context_lock:
+            self._context = imgui.create_context()
+            self._implot_context = implot.create_context()
+            io = imgui.get_io()
+            io.set_ini_filename("")
+            io.backend_flags |= imgui.BackendFlags_.renderer_has_textures.value
+        logger.info(f"Started headless backend ({self.size[0]}x{self.size[1]})")
+
+    def shutdown(self) -> None:
+        """Destroy the contexts and fail any pending captures."""
+        with self._captures_lock:
+            pending, self._captures = self._captures, []
+        for future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Headless backend stopped"))
+
+        with _context_lock:
+            if self._implot_context is not None:
+                implot.destroy_context(self._implot_context)
+                self._implot_context = None
+            if self._context is not None:
+                imgui.destroy_context(self._context)
+                self._context = None
+
+    @contextmanager
+    def frame(self, delta_time: float) -> Iterator[None]:
+        """Build one frame; the body submits widgets between new_frame and render.
+
+        Args:
+            delta_time: Seconds since the previous frame
+
+        Raises:
+            RuntimeError: If the backend has no ImGui context (stopped)
+        """
+        if self._context is None:
+            raise RuntimeError("Headless backend is not started")
+        with _context_lock:
+            imgui.set_current_context(self._context)
+            implot.set_current_context(self._implot_context)
+            io = imgui.get_io()
+            io.display_size = imgui.ImVec2(float(self.size[0]), float(self.size[1]))
+            io.delta_time = max(delta_time, 1e-6)
+            imgui.new_frame()
+            try:
+                yield
+            finally:
+                imgui.render()
+                draw_data = imgui.get_draw_data()
+                self.renderer.update_textures(draw_data)
+                self._fulfill_captures(draw_data)
+
+    def request_capture(self) -> Future:
+        """Request the framebuffer of the next completed frame.
+
+        Returns:
+            Future resolving to a ``(height, width, 4)`` uint8 RGBA array
+        """
+        future: Future = Future()
+        with self._captures_lock:
+            self._captures.append(future)
+        return future
+
+    def has_pending_captures(self) -> bool:
+        """Whether a capture is waiting for the next frame."""
+        return bool(self._captures)
+
+    def _fulfill_captures(self, draw_data: imgui.ImDrawData) -> None:
+        """Rasterize the frame once for all pending captures."""
+        with self._captures_lock:
+            pending, self._captures = self._captures, []
+        if not pending:
+            return
+
+        try:
+            rgba = self.renderer.render(draw_data)
+        except Exception as e:
+            logger.error(f"Error capturing headless frame: {e}", exc_info=True)
+            for future in pending:
+                future.set_exception(e)
+            return
+        for future in pending:
+            future.set_result(rgba)
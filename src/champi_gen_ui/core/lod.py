@@ -0,0 +1,200 @@
+"""Level-of-detail decimation for large plot series.
+
+A plot can only show one value per pixel column, so series much longer than
+the plot is wide are reduced before they reach ImPlot:
+
+* Line series with sorted x use a min/max pyramid. Each level keeps the
+  minimum and maximum point of every block of samples, in sample order,
+  with blocks doubling in size from level to level. The pyramid is built
+  once per data set. Picking a level and a slice for the visible range is
+  then O(log n). The chosen blocks are at most half a pixel column wide, so
+  the result holds about eight points per column and its envelope matches
+  the full series to within a pixel.
+* Scatter series keep one point per occupied pixel cell of the visible area.
+"""
+
+import math
+
+import numpy as np
+
+# Series at or below this many points are always plotted as is
+LOD_MIN_POINTS = 4096
+
+# Coarsest pyramid level still worth keeping (blocks per level)
+_MIN_LEVEL_BLOCKS = 256
+
+
+def is_sorted(values: np.ndarray) -> bool:
+    """Whether a 1D array is non-decreasing."""
+    return bool(values.size < 2 or (values[1:] >= values[:-1]).all())
+
+
+def data_bounds(xs: np.ndarray, ys: np.ndarray) -> tuple[float, float, float, float]:
+    """Get (x_min, x_max, y_min, y_max) of a series, ignoring NaNs."""
+    return (
+        float(np.nanmin(xs)),
+        float(np.nanmax(xs)),
+        float(np.nanmin(ys)),
+        float(np.nanmax(ys)),
+    )
+
+
+class _Level:
+    """One pyramid level: min and max points of fixed-size sample blocks."""
+
+    __slots__ = ("block", "count", "xs", "ys")
+
+    def __init__(self, block: int, dtype: np.dtype):
+        """Initialize an empty level."""
+        self.block = block
+        self.count = 0
+        self.xs = np.empty(0, dtype=dtype)
+        self.ys = np.empty(0, dtype=dtype)
+
+    def update(self, xs: np.ndarray, ys: np.ndarray, first: int) -> None:
+        """Recompute the blocks from index ``first`` to the end of the data."""
+        block = self.block
+        start = first * block
+        tail = ys[start:]
+        blocks = math.ceil(tail.size / block)
+        if blocks * block != tail.size:
+            # Pad the partial last block with its own last sample
+            tail = np.concatenate(
+                [tail, np.full(blocks * block - tail.size, tail[-1], dtype=tail.dtype)]
+            )
+        rows = tail.reshape(blocks, block)
+        base = start + np.arange(blocks) * block
+        index_min = base + rows.argmin(axis=1)
+        index_max = base + rows.argmax(axis=1)
+
+        order = np.empty(2 * blocks, dtype=np.intp)
+        order[0::2] = np.minimum(index_min, index_max)
+        order[1::2] = np.maximum(index_min, index_max)
+
+        count = 2 * (first + blocks)
+        if count > self.xs.size:
+            capacity = max(count, 2 * self.xs.size)
+            self.xs = np.resize(self.xs, capacity)
+            self.ys = np.resize(self.ys, capacity)
+        self.xs[2 * first : count] = xs[order]
+        self.ys[2 * first : count] = ys[order]
+        self.count = count
+
+
+class MinMaxPyramid:
+    """Multi-resolution min/max summary of a line series with sorted x.
+
+    Level ``k`` stores two points per block of ``2**(k + 2)`` samples: the
+    block's minimum and maximum, in sample order. The points are interleaved
+    in one array per axis, so a range of blocks is a zero-copy slice.
+    Appending samples only recomputes the last block of each level.
+    """
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray):
+        """Build the pyramid.
+
+        Args:
+            xs: Sorted x values
+            ys: Y values (same length and dtype as ``xs``)
+        """
+        self.xs = xs[:0]
+        self.ys = ys[:0]
+        self.levels: list[_Level] = []
+        self.extend(xs, ys)
+
+    def extend(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Update the pyramid for samples appended to the series.
+
+        Args:
+            xs: All x values; the already summarized ones must be unchanged
+            ys: All y values, likewise
+        """
+        previous = self.xs.size
+        self.xs, self.ys = xs, ys
+        block = 4
+        depth = 0
+        while xs.size >= block * _MIN_LEVEL_BLOCKS:
+            if depth == len(self.levels):
+                self.levels.append(_Level(block, ys.dtype))
+                first = 0
+            else:
+                # Only the block that held the previous last sample changes
+                first = previous // block
+            self.levels[depth].update(xs, ys, first)
+            block *= 2
+            depth += 1
+
+    def select(
+        self, x_min: float, x_max: float, pixels: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the points to draw for a visible x range.
+
+        One sample (or block) beyond each edge is included so lines enter
+        and leave the plot at the right slope.
+
+        Args:
+            x_min: Left edge of the visible range
+            x_max: Right edge of the visible range
+            pixels: Plot width in pixels
+
+        Returns:
+            (xs, ys) views into the raw data or one pyramid level
+        """
+        count = self.xs.size
+        start = max(int(np.searchsorted(self.xs, x_min, "left")) - 1, 0)
+        stop = min(int(np.searchsorted(self.xs, x_max, "right")) + 1, count)
+        # Blocks of at most half a pixel column keep the drawn envelope within
+        # a pixel of the full series
+        per_block = (stop - start) / (2 * max(pixels, 1))
+
+        level = None
+        for candidate in self.levels:
+            if candidate.block > per_block:
+                break
+            level = candidate
+        if level is None:
+            return self.xs[start:stop], self.ys[start:stop]
+
+        first = 2 * (start // level.block)
+        last = 2 * math.ceil(stop / level.block)
+        return level.xs[first:last], level.ys[first:last]
+
+
+def decimate_scatter(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    bounds: tuple[float, float, float, float],
+    size: tuple[int, int],
+    sorted_x: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Keep one point per occupied pixel cell of the visible area.
+
+    Args:
+        xs: X values
+        ys: Y values
+        bounds: Visible (x_min, x_max, y_min, y_max)
+        size: Plot size in pixels (width, height)
+        sorted_x: Whether ``xs`` is sorted, to narrow the scan by x first
+
+    Returns:
+        (xs, ys) of the first point in every occupied cell, in input order
+    """
+    x_min, x_max, y_min, y_max = bounds
+    width, height = max(size[0], 1), max(size[1], 1)
+    if sorted_x:
+        start = int(np.searchsorted(xs, x_min, "left"))
+        stop = int(np.searchsorted(xs, x_max, "right"))
+        xs, ys = xs[start:stop], ys[start:stop]
+
+    x_span = (x_max - x_min) or 1.0
+    y_span = (y_max - y_min) or 1.0
+    column = np.floor((xs - x_min) * (width / x_span))
+    row = np.floor((ys - y_min) * (height / y_span))
+    visible = (column >= 0) & (column <= width) & (row >= 0) & (row <= height)
+    indices = np.flatnonzero(visible)
+    cells = column[indices].astype(np.int64) * (height + 1) + row[indices].astype(
+        np.int64
+    )
+    _, first = np.unique(cells, return_index=True)
+    keep = indices[np.sort(first)]
+    return xs[keep], ys[keep]
@@ -0,0 +1,249 @@
+"""Opt-in frame profiler for canvases."""
+
+import heapq
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from imgui_bundle import imgui
+
+if TYPE_CHECKING:
+    from champi_gen_ui.core.widget import Widget
+
+# 60 FPS frame budget in milliseconds
+FRAME_BUDGET_MS = 1000.0 / 60.0
+
+# Per-widget times kept for each frame (the slowest ones)
+WIDGETS_PER_SAMPLE = 20
+
+
+@dataclass
+class FrameSample:
+    """Timings recorded for one frame (all times in milliseconds)."""
+
+    timestamp: float
+    frame_ms: float = 0.0
+    interval_ms: float = 0.0
+    commands_ms: float = 0.0
+    commands: int = 0
+    render_ms: float = 0.0
+    widgets_rendered: int = 0
+    widget_count: int = 0
+    type_ms: dict[str, float] = field(default_factory=dict)
+    widget_ms: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "timestamp": self.timestamp,
+            "frame_ms": self.frame_ms,
+            "interval_ms": self.interval_ms,
+            "commands_ms": self.commands_ms,
+            "commands": self.commands,
+            "render_ms": self.render_ms,
+            "widgets_rendered": self.widgets_rendered,
+            "widget_count": self.widget_count,
+        }
+
+
+class FrameProfiler:
+    """Records frame, command-drain and per-widget render timings.
+
+    Samples are kept in a ring buffer of the last ``capacity`` frames.
+    Widget times are exclusive: a container's time does not include the
+    children it renders, so the cost lands on the widget that spends it.
+    Every frame keeps its totals per widget type, but only its slowest
+    individual widgets.
+    Recording happens on the render thread; ``summary`` may be called from
+    any thread.
+    """
+
+    def __init__(self, capacity: int = 300, overlay: bool = False):
+        """Initialize profiler.
+
+        Args:
+            capacity: Number of frames to keep
+            overlay: Draw the built-in metrics overlay each frame
+        """
+        self.capacity = capacity
+        self.overlay = overlay
+        self._samples: deque[FrameSample] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._current: FrameSample | None = None
+        self._frame_start = 0.0
+        self._last_frame_start = 0.0
+        self._child_time: list[float] = []
+
+    def begin_frame(self) -> None:
+        """Start timing a frame."""
+        now = time.perf_counter()
+        interval = (now - self._last_frame_start) * 1000.0
+        if not self._last_frame_start:
+            interval = 0.0
+        self._last_frame_start = now
+        self._frame_start = now
+        self._current = FrameSample(timestamp=time.time(), interval_ms=interval)
+
+    def end_frame(self, widget_count: int) -> None:
+        """Finish the current frame and store its sample."""
+        sample = self._current
+        if sample is None:
+            return
+        sample.frame_ms = (time.perf_counter() - self._frame_start) * 1000.0
+        sample.widget_count = widget_count
+        if len(sample.widget_ms) > WIDGETS_PER_SAMPLE:
+            sample.widget_ms = dict(
+                heapq.nlargest(
+                    WIDGETS_PER_SAMPLE,
+                    sample.widget_ms.items(),
+                    key=lambda item: item[1],
+                )
+            )
+        self._current = None
+        with self._lock:
+            self._samples.append(sample)
+
+    def record_commands(self, count: int, elapsed: float) -> None:
+        """Record a command-queue drain of ``count`` commands."""
+        if self._current is not None:
+            self._current.commands += count
+            self._current.commands_ms += elapsed * 1000.0
+
+    def record_render(self, elapsed: float) -> None:
+        """Record the wall time of ``Canvas.render``."""
+        if self._current is not None:
+            self._current.render_ms += elapsed * 1000.0
+
+    def measure(self, widget: "Widget") -> None:
+        """Call ``widget.render()`` and record its exclusive time."""
+        self._child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            widget.render()
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._child_time.pop()
+            if self._child_time:
+                self._child_time[-1] += elapsed
+            sample = self._current
+            if sample is not None:
+                ms = (elapsed - children) * 1000.0
+                widget_type = widget.state.widget_type
+                sample.type_ms[widget_type] = sample.type_ms.get(widget_type, 0.0) + ms
+                sample.widget_ms[widget.widget_id] = (
+                    sample.widget_ms.get(widget.widget_id, 0.0) + ms
+                )
+                sample.widgets_rendered += 1
+
+    def samples(self, frames: int | None = None) -> list[FrameSample]:
+        """Get the most recent samples, oldest first."""
+        with self._lock:
+            samples = list(self._samples)
+        if frames is not None:
+            samples = samples[-frames:] if frames > 0 else []
+        return samples
+
+    def summary(self, frames: int | None = None, top: int = 10) -> dict[str, Any]:
+        """Aggregate recent samples.
+
+        Args:
+            frames: Number of recent frames to aggregate (all if None)
+            top: Number of widget types and widgets to list by cost
+
+        Returns:
+            Frame time statistics, budget overruns and the costliest widget
+            types and widgets (mean exclusive milliseconds per frame)
+        """
+        samples = self.samples(frames)
+        if not samples:
+            return {"frames": 0, "capacity": self.capacity}
+
+        frame_ms = np.array([s.frame_ms for s in samples])
+        intervals = np.array([s.interval_ms for s in samples if s.interval_ms > 0])
+
+        type_totals: dict[str, float] = {}
+        widget_totals: dict[str, float] = {}
+        for sample in samples:
+            for name, ms in sample.type_ms.items():
+                type_totals[name] = type_totals.get(name, 0.0) + ms
+            for name, ms in sample.widget_ms.items():
+                widget_totals[name] = widget_totals.get(name, 0.0) + ms
+
+        def ranked(totals: dict[str, float]) -> list[dict[str, Any]]:
+            items = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+            return [
+                {"name": name, "mean_ms": total / len(samples)}
+                for name, total in items[:top]
+            ]
+
+        last = samples[-1]
+        return {
+            "frames": len(samples),
+            "capacity": self.capacity,
+            "frame_ms": {
+                "mean": float(frame_ms.mean()),
+                "p50": float(np.percentile(frame_ms, 50)),
+                "p95": float(np.percentile(frame_ms, 95)),
+                "max": float(frame_ms.max()),
+            },
+            "fps": float(1000.0 / intervals.mean()) if intervals.size else None,
+            "over_budget": int((frame_ms > FRAME_BUDGET_MS).sum()),
+            "commands_ms": float(np.mean([s.commands_ms for s in samples])),
+            "commands": sum(s.commands for s in samples),
+            "render_ms": float(np.mean([s.render_ms for s in samples])),
+            "widgets_rendered": last.widgets_rendered,
+            "widget_count": last.widget_count,
+            "widget_types": ranked(type_totals),
+            "widgets": ranked(widget_totals),
+            "last_frame": last.to_dict(),
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        with self._lock:
+            self._samples.clear()
+
+    def draw_overlay(self) -> None:
+        """Draw the metrics overlay window (call inside a frame)."""
+        samples = self.samples()
+        if not samples:
+            return
+
+        flags = (
+            imgui.WindowFlags_.no_decoration.value
+            | imgui.WindowFlags_.always_auto_resize.value
+            | imgui.WindowFlags_.no_focus_on_appearing.value
+            | imgui.WindowFlags_.no_nav.value
+        )
+        display = imgui.get_io().display_size
+        imgui.set_next_window_pos(
+            imgui.ImVec2(display.x - 10, 10), imgui.Cond_.always.value, (1.0, 0.0)
+        )
+        imgui.set_next_window_bg_alpha(0.75)
+        if imgui.begin("Frame Profiler##overlay", None, flags):
+            summary = self.summary(top=5)
+            frame = summary["frame_ms"]
+            imgui.text(
+                f"frame {frame['mean']:.2f} ms  p95 {frame['p95']:.2f}  "
+                f"max {frame['max']:.2f}"
+            )
+            if summary["fps"]:
+                imgui.text(f"{summary['fps']:.0f} FPS")
+            imgui.text(
+                f"widgets {summary['widgets_rendered']}/{summary['widget_count']}  "
+                f"commands {summary['commands_ms']:.2f} ms"
+            )
+            imgui.plot_lines(
+                "##frame_ms",
+                np.array([s.frame_ms for s in samples], dtype=np.float32),
+                scale_min=0.0,
+                scale_max=max(FRAME_BUDGET_MS, frame["max"]),
+                graph_size=imgui.ImVec2(240, 40),
+            )
+            imgui.separator()
+            for entry in summary["widget_types"]:
+                imgui.text(f"{entry['mean_ms']:7.3f} ms  {entry['name']}")
+        imgui.end()
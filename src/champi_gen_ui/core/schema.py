@@ -0,0 +1,201 @@
+"""Shared canvas and widget descriptions for the exporters.
+
+Every export format (JSON and binary snapshots, generated Python, YAML and
+TOML) is laid out from the same two descriptions:
+
+* ``describe_canvas``: id, title, size and mode, read from ``CanvasState``
+* ``describe_widget``: widget type and id, the ``WIDGET_FIELDS`` of its
+  state, its properties and the names of its callbacks
+
+What the exporters need to know about a widget class is worked out once,
+from the class and its constructor signature, and cached as a
+``WidgetSchema``. Describing a widget is then a table lookup plus reading
+its state.
+"""
+
+import inspect
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from champi_gen_ui.core.widget import Widget
+
+# Widget state fields and their defaults, in export order
+WIDGET_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("visible", True),
+    ("enabled", True),
+    ("position", None),
+    ("size", None),
+    ("parent", None),
+)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class WidgetSchema:
+    """How a widget class is described, precompiled per class."""
+
+    widget_class: type
+    # Name the class is exported under from champi_gen_ui.widgets
+    widget_type: str
+    # Keyword parameters of the constructor with their defaults (_MISSING
+    # if required)
+    parameters: dict[str, Any]
+    # Whether the constructor accepts arbitrary properties (**props)
+    open_properties: bool
+    # Properties the class keeps as NumPy arrays
+    array_properties: frozenset[str]
+    # Whether the class overrides Widget.serialize to add properties it
+    # keeps outside its state
+    custom_serialize: bool
+
+    def properties(self, widget: "Widget", arrays: bool = False) -> dict[str, Any]:
+        """Get a widget's properties for export.
+
+        Args:
+            widget: Widget of this schema's class
+            arrays: Keep array properties as NumPy arrays instead of lists
+        """
+        if self.custom_serialize:
+            serialized: dict[str, Any] = widget.serialize(arrays)["properties"]
+            return serialized
+        properties = widget.state.properties
+        if arrays:
+            return dict(properties)
+        return {
+            key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in properties.items()
+        }
+
+    def is_default(self, name: str, value: Any) -> bool:
+        """Whether a property holds the constructor's default scalar value."""
+        default = self.parameters.get(name, _MISSING)
+        return (
+            default is not _MISSING
+            and type(value) is type(default)
+            and isinstance(value, str | int | float | bool | None)
+            and value == default
+        )
+
+
+_SCHEMAS: dict[type, WidgetSchema] = {}
+_CLASSES: dict[str, type] = {}
+_EXPORT_NAMES: dict[type, str] = {}
+
+
+def _load_classes() -> None:
+    """Index the classes exported from champi_gen_ui.widgets."""
+    from champi_gen_ui import widgets
+
+    for name in widgets.__all__:
+        cls = getattr(widgets, name)
+        _CLASSES[name] = cls
+        _EXPORT_NAMES.setdefault(cls, name)
+    # Accept class names too where a class is exported under an alias
+    for cls in list(_CLASSES.values()):
+        _CLASSES.setdefault(cls.__name__, cls)
+
+
+def widget_schema(widget_class: type["Widget"]) -> WidgetSchema:
+    """Get the (cached) schema of a widget class."""
+    schema = _SCHEMAS.get(widget_class)
+    if schema is not None:
+        return schema
+
+    from champi_gen_ui.core.widget import Widget
+
+    if not _CLASSES:
+        _load_classes()
+    signature = inspect.signature(widget_class.__init__)
+    parameters = {}
+    open_properties = False
+    for name, parameter in list(signature.parameters.items())[2:]:
+        if parameter.kind is parameter.VAR_KEYWORD:
+            open_properties = True
+        elif parameter.kind is not parameter.VAR_POSITIONAL:
+            default = parameter.default
+            parameters[name] = _MISSING if default is parameter.empty else default
+
+    schema = WidgetSchema(
+        widget_class=widget_class,
+        widget_type=_EXPORT_NAMES.get(widget_class, widget_class.__name__),
+        parameters=parameters,
+        open_properties=open_properties,
+        array_properties=frozenset(getattr(widget_class, "_array_properties", ())),
+        custom_serialize=widget_class.serialize is not Widget.serialize,
+    )
+    _SCHEMAS[widget_class] = schema
+    return schema
+
+
+def widget_class(widget_type: str) -> type:
+    """Look up an exported widget class by its type name.
+
+    Raises:
+        ValueError: If no widget class has that name
+    """
+    if not _CLASSES:
+        _load_classes()
+    cls = _CLASSES.get(widget_type)
+    if cls is None:
+        raise ValueError(f"Unknown widget type: {widget_type}")
+    return cls
+
+
+def describe_canvas(canvas) -> dict[str, Any]:
+    """Describe a canvas: ``id``, ``title``, ``width``, ``height`` and ``mode``."""
+    state = canvas.state
+    return {
+        "id": state.canvas_id,
+        "title": state.title,
+        "width": state.size[0],
+        "height": state.size[1],
+        "mode": state.mode.value,
+    }
+
+
+def describe_widget(widget: "Widget", arrays: bool = False) -> dict[str, Any]:
+    """Describe a widget.
+
+    Args:
+        widget: Widget instance
+        arrays: Keep array properties as NumPy arrays instead of lists
+
+    Returns:
+        ``widget_type``, ``id``, the ``WIDGET_FIELDS``, ``properties`` and
+        ``callbacks`` (event names)
+    """
+    schema = _SCHEMAS.get(type(widget)) or widget_schema(type(widget))
+    state = widget.state
+    # Spelled out rather than looped over WIDGET_FIELDS: this runs once per
+    # widget on every export
+    return {
+        "widget_type": schema.widget_type,
+        "id": widget.widget_id,
+        "visible": state.visible,
+        "enabled": state.enabled,
+        "position": state.position,
+        "size": state.size,
+        "parent": state.parent,
+        "properties": schema.properties(widget, arrays),
+        "callbacks": list(state.callbacks),
+    }
+
+
+def plain(value: Any) -> Any:
+    """Convert a described value to lists, dicts and scalars only.
+
+    For formats without tuples or arrays (YAML, TOML).
+    """
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [plain(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
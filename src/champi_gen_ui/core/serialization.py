@@ -1,69 +1,294 @@
-"""JSON serialization for UI export/import."""
+"""JSON and binary snapshot serialization for UI export/import."""
 
 import json
+import re
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from loguru import logger
 
+from champi_gen_ui.core import snapshot
+from champi_gen_ui.core.schema import describe_canvas, describe_widget, widget_class
+
+# Metadata written at the end of every exported canvas
+_METADATA = {"version": "1.0.0", "created_with": "champi-gen-ui"}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters read or written at a time when streaming
+_CHUNK_SIZE = 1 << 16
+
+
+class _JsonStream:
+    """Incremental reader for one JSON document from a text stream.
+
+    Only the parts currently being parsed are buffered: structural tokens of
+    the enclosing objects and arrays are consumed one at a time, and values
+    are decoded whole once enough input has been read to hold them.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = _CHUNK_SIZE):
+        """Initialize reader.
+
+        Args:
+            fp: Text stream positioned at the document
+            chunk_size: Minimum number of characters to read at a time
+        """
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read more input, dropping consumed text; False at end of stream."""
+        if self.eof:
+            return False
+        # Read at least as much as is pending so a large value that needs
+        # many reads is re-scanned only O(log n) times
+        pending = len(self.buffer) - self.pos
+        chunk = self.fp.read(max(self.chunk_size, pending))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str | None:
+        """Skip whitespace and return the next character (None at the end)."""
+        while True:
+            # The pattern matches the empty string, so a match always exists
+            match = _WHITESPACE.match(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return None
+
+    def expect(self, char: str) -> None:
+        """Consume an expected structural character."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next read
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def object_keys(self) -> Iterator[str]:
+        """Iterate over the keys of an object; consume each value before next."""
+        self.expect("{")
+        first = True
+        while self.peek() != "}":
+            if not first:
+                self.expect(",")
+            first = False
+            key = self.value()
+            self.expect(":")
+            yield key
+        self.pos += 1
+
+    def array_items(self) -> Iterator[Any]:
+        """Iterate over the decoded items of an array."""
+        self.expect("[")
+        first = True
+        while self.peek() != "]":
+            if not first:
+                self.expect(",")
+            first = False
+            yield self.value()
+        self.pos += 1
+
+
+def _reindent(text: str, depth: int, indent: int | None) -> str:
+    """Indent the continuation lines of pretty JSON nested ``depth`` deep."""
+    if indent is None:
+        return text
+    return text.replace("\n", "\n" + " " * (indent * depth))
+
 
 class UISerializer:
     """Serializer for UI components."""
 
     @staticmethod
-    def serialize_canvas(canvas) -> dict[str, Any]:
+    def serialize_canvas(canvas, arrays: bool = False) -> dict[str, Any]:
         """
         Serialize a canvas to dictionary.
 
         Args:
             canvas: Canvas instance
+            arrays: Keep array properties as NumPy arrays instead of lists
 
         Returns:
             Dictionary representation
         """
         return {
-            "type": "canvas",
-            "id": canvas.canvas_id,
-            "state": {
-                "title": canvas.state.title,
-                "width": canvas.state.width,
-                "height": canvas.state.height,
-                "mode": canvas.state.mode.value,
-                "background_color": canvas.state.background_color,
-            },
+            **UISerializer._canvas_header(canvas),
             "widgets": [
-                UISerializer.serialize_widget(widget)
-                for widget in canvas.widget_registry.get_all().values()
+                UISerializer.serialize_widget(widget, arrays)
+                for widget in canvas.snapshot_widgets()
             ],
-            "metadata": {
-                "version": "1.0.0",
-                "created_with": "champi-gen-ui",
-            },
+            "metadata": dict(_METADATA),
         }
 
     @staticmethod
-    def serialize_widget(widget) -> dict[str, Any]:
+    def iter_canvas_json(canvas, indent: int | None = None) -> Iterator[str]:
+        """
+        Serialize a canvas to JSON text in chunks, one widget at a time.
+
+        Only one widget's dictionary exists at a time, so memory use is
+        bounded by the largest widget rather than the whole canvas.
+
+        Args:
+            canvas: Canvas instance
+            indent: Indentation as for ``json.dumps`` (None for compact)
+
+        Yields:
+            Consecutive pieces of the JSON document
+        """
+        header = UISerializer._canvas_header(canvas)
+        newline = "\n" if indent is not None else ""
+        pad = " " * indent if indent is not None else ""
+
+        yield "{" + newline
+        for key, value in header.items():
+            text = _reindent(json.dumps(value, indent=indent), 1, indent)
+            yield f"{pad}{json.dumps(key)}: {text},{newline or ' '}"
+
+        yield f'{pad}"widgets": ['
+        separator = newline
+        # Pretty printing is done in Python either way, so encode large
+        # widgets piecewise instead of building their whole text
+        encoder = json.JSONEncoder(indent=indent)
+        for widget in canvas.snapshot_widgets():
+            data = UISerializer.serialize_widget(widget)
+            yield separator + pad * 2
+            if indent is None:
+                yield encoder.encode(data)
+            else:
+                pending: list[str] = []
+                size = 0
+                for chunk in encoder.iterencode(data):
+                    pending.append(chunk)
+                    size += len(chunk)
+                    if size >= _CHUNK_SIZE:
+                        yield _reindent("".join(pending), 2, indent)
+                        pending.clear()
+                        size = 0
+                yield _reindent("".join(pending), 2, indent)
+            separator = "," + (newline or " ")
+        if separator != newline:
+            yield newline + pad
+        metadata = _reindent(json.dumps(_METADATA, indent=indent), 1, indent)
+        yield f'],{newline or " "}{pad}"metadata": {metadata}{newline}}}'
+
+    @staticmethod
+    def _canvas_header(canvas) -> dict[str, Any]:
+        """Serialize everything about a canvas except its widgets."""
+        description = describe_canvas(canvas)
+        canvas_id = description.pop("id")
+        return {"type": "canvas", "id": canvas_id, "state": description}
+
+    @staticmethod
+    def dump_canvas(canvas, fp: TextIO, indent: int | None = None) -> None:
+        """
+        Write a canvas as JSON to a text stream, one widget at a time.
+
+        Args:
+            canvas: Canvas instance
+            fp: Writable text stream (file, socket file, ...)
+            indent: Indentation as for ``json.dumps`` (None for compact)
+        """
+        for chunk in UISerializer.iter_canvas_json(canvas, indent):
+            fp.write(chunk)
+
+    @staticmethod
+    def load_canvas(fp: TextIO, canvas_manager, auto_start: bool | None = None) -> Any:
+        """
+        Create a canvas from a JSON text stream while parsing it.
+
+        The canvas is created as soon as its header has been read, and each
+        widget is added as soon as it has been parsed, so memory use is
+        bounded by the largest widget rather than the whole document. The
+        canvas is started only once all widgets are in place.
+
+        Args:
+            fp: Readable text stream
+            canvas_manager: CanvasManager instance
+            auto_start: Whether to start the canvas (defaults to the manager's
+                setting)
+
+        Returns:
+            Canvas instance
+
+        Raises:
+            ValueError: If the document is malformed or lists widgets before
+                the canvas id and state
+        """
+        stream = _JsonStream(fp)
+        header: dict[str, Any] = {}
+        canvas = None
+        for key in stream.object_keys():
+            if key != "widgets":
+                header[key] = stream.value()
+                continue
+            if "id" not in header or "state" not in header:
+                raise ValueError("Canvas id and state must precede its widgets")
+            canvas = UISerializer._create_canvas(header, canvas_manager)
+            try:
+                for widget_data in stream.array_items():
+                    widget = UISerializer.deserialize_widget(widget_data)
+                    if widget:
+                        canvas.add_widget(widget)
+            except Exception:
+                # Do not leave a half-loaded canvas behind
+                canvas_manager.remove_canvas(header["id"])
+                raise
+
+        if canvas is None:
+            canvas = UISerializer._create_canvas(header, canvas_manager)
+        canvas_manager.start_canvas(canvas, auto_start)
+        return canvas
+
+    @staticmethod
+    def serialize_widget(widget, arrays: bool = False) -> dict[str, Any]:
         """
         Serialize a widget to dictionary.
 
         Args:
             widget: Widget instance
+            arrays: Keep array properties as NumPy arrays instead of lists
 
         Returns:
             Dictionary representation
         """
+        description = describe_widget(widget, arrays)
+        widget_type = description.pop("widget_type")
+        widget_id = description.pop("id")
+        callbacks = description.pop("callbacks")
         return {
             "type": "widget",
-            "widget_type": widget.__class__.__name__,
-            "id": widget.widget_id,
-            "state": {
-                "visible": widget.state.visible,
-                "enabled": widget.state.enabled,
-                "position": widget.state.position,
-                "size": widget.state.size,
-                "properties": dict(widget.state.properties),
-            },
-            "callbacks": list(widget.state.callbacks.keys()),
+            "widget_type": widget_type,
+            "id": widget_id,
+            "state": description,
+            "callbacks": callbacks,
         }
 
     @staticmethod
@@ -99,36 +324,53 @@ class UISerializer:
         }
 
     @staticmethod
-    def deserialize_canvas(data: dict[str, Any], canvas_manager) -> Any:
+    def deserialize_canvas(
+        data: dict[str, Any], canvas_manager, auto_start: bool | None = None
+    ) -> Any:
         """
         Deserialize a canvas from dictionary.
 
+        The widgets are added before the canvas is started, so none of them
+        waits for the render thread.
+
         Args:
             data: Dictionary representation
             canvas_manager: CanvasManager instance
+            auto_start: Whether to start the canvas (defaults to the manager's
+                setting)
 
         Returns:
             Canvas instance
         """
+        canvas = UISerializer._create_canvas(data, canvas_manager)
+
+        # Deserialize widgets
+        try:
+            for widget_data in data.get("widgets", []):
+                widget = UISerializer.deserialize_widget(widget_data)
+                if widget:
+                    canvas.add_widget(widget)
+        except Exception:
+            canvas_manager.remove_canvas(data["id"])
+            raise
+
+        canvas_manager.start_canvas(canvas, auto_start)
+        return canvas
+
+    @staticmethod
+    def _create_canvas(data: dict[str, Any], canvas_manager) -> Any:
+        """Create the (empty, not yet started) canvas for serialized data."""
         from champi_gen_ui.core.state import CanvasMode
 
-        # Create canvas
-        canvas = canvas_manager.create_canvas(
+        return canvas_manager.create_canvas(
             canvas_id=data["id"],
+            auto_start=False,
             width=data["state"]["width"],
             height=data["state"]["height"],
             mode=CanvasMode(data["state"]["mode"]),
             title=data["state"]["title"],
         )
 
-        # Deserialize widgets
-        for widget_data in data.get("widgets", []):
-            widget = UISerializer.deserialize_widget(widget_data)
-            if widget:
-                canvas.add_widget(widget)
-
-        return canvas
-
     @staticmethod
     def deserialize_widget(data: dict[str, Any]) -> Any:
         """
@@ -145,12 +387,8 @@ class UISerializer:
         widget_id = data["id"]
         properties = data["state"]["properties"]
 
-        # Import widget classes dynamically
         try:
-            from champi_gen_ui import widgets
-
-            widget_class = getattr(widgets, widget_type)
-            widget = widget_class(widget_id, **properties)
+            widget = widget_class(widget_type)(widget_id, **properties)
 
             # Restore state
             widget.state.visible = data["state"]["visible"]
@@ -159,6 +397,7 @@ class UISerializer:
                 widget.state.position = tuple(data["state"]["position"])
             if data["state"]["size"]:
                 widget.state.size = tuple(data["state"]["size"])
+            widget.state.parent = data["state"].get("parent")
 
             return widget
         except Exception as e:
@@ -183,13 +422,8 @@ class UIExporter:
             True if successful
         """
         try:
-            data = UISerializer.serialize_canvas(canvas)
-
             with open(filepath, "w") as f:
-                if pretty:
-                    json.dump(data, f, indent=2)
-                else:
-                    json.dump(data, f)
+                UISerializer.dump_canvas(canvas, f, indent=2 if pretty else None)
 
             logger.info(f"Exported UI to {filepath}")
             return True
@@ -197,6 +431,30 @@ class UIExporter:
             logger.error(f"Error exporting to JSON: {e}")
             return False
 
+    @staticmethod
+    def export_to_snapshot(canvas, filepath: str) -> bool:
+        """
+        Export canvas to a binary snapshot file.
+
+        Array properties are written as raw blocks instead of number lists.
+
+        Args:
+            canvas: Canvas instance
+            filepath: Output file path
+
+        Returns:
+            True if successful
+        """
+        try:
+            data = UISerializer.serialize_canvas(canvas, arrays=True)
+            snapshot.save(data, filepath)
+
+            logger.info(f"Exported UI snapshot to {filepath}")
+            return True
+        except Exception as e:
+            logger.error(f"Error exporting snapshot: {e}")
+            return False
+
     @staticmethod
     def export_to_python(canvas, filepath: str) -> bool:
         """
@@ -234,36 +492,69 @@ class UIExporter:
         Returns:
             JSON string
         """
-        data = UISerializer.serialize_canvas(canvas)
-        return json.dumps(data, indent=2)
+        return "".join(UISerializer.iter_canvas_json(canvas, indent=2))
 
 
 class UIImporter:
     """Import UI from various formats."""
 
     @staticmethod
-    def import_from_json(filepath: str, canvas_manager) -> Any:
+    def import_from_json(
+        filepath: str, canvas_manager, auto_start: bool | None = None
+    ) -> Any:
         """
         Import canvas from JSON file.
 
         Args:
             filepath: Input file path
             canvas_manager: CanvasManager instance
+            auto_start: Whether to start the canvas (defaults to the manager's
+                setting)
 
         Returns:
             Canvas instance
         """
         try:
             with open(filepath) as f:
-                data = json.load(f)
+                canvas = UISerializer.load_canvas(f, canvas_manager, auto_start)
 
-            canvas = UISerializer.deserialize_canvas(data, canvas_manager)
             logger.info(f"Imported UI from {filepath}")
             return canvas
         except Exception as e:
             logger.error(f"Error importing from JSON: {e}")
             return None
 
+    @staticmethod
+    def import_from_snapshot(
+        filepath: str,
+        canvas_manager,
+        memory_map: bool = True,
+        auto_start: bool | None = None,
+    ) -> Any:
+        """
+        Import canvas from a binary snapshot file.
+
+        Args:
+            filepath: Input file path
+            canvas_manager: CanvasManager instance
+            memory_map: Map the file so array properties are read-only views
+                of it rather than copies
+            auto_start: Whether to start the canvas (defaults to the manager's
+                setting)
+
+        Returns:
+            Canvas instance
+        """
+        try:
+            data = snapshot.load(filepath, memory_map)
+
+            canvas = UISerializer.deserialize_canvas(data, canvas_manager, auto_start)
+            logger.info(f"Imported UI snapshot from {filepath}")
+            return canvas
+        except Exception as e:
+            logger.error(f"Error importing snapshot: {e}")
+            return None
+
     @staticmethod
     def import_from_dict(data: dict[str, Any], canvas_manager) -> Any:
         """
@@ -333,13 +624,17 @@ class TemplateManager:
             logger.error(f"Error saving template: {e}")
             return False
 
-    def load_template(self, name: str, canvas_manager) -> Any:
+    def load_template(
+        self, name: str, canvas_manager, auto_start: bool | None = None
+    ) -> Any:
         """
         Load a template.
 
         Args:
             name: Template name
             canvas_manager: CanvasManager instance
+            auto_start: Whether to start the canvas (defaults to the manager's
+                setting)
 
         Returns:
             Canvas instance
@@ -348,7 +643,7 @@ class TemplateManager:
             # Try in-memory first
             if name in self.templates:
                 return UISerializer.deserialize_canvas(
-                    self.templates[name], canvas_manager
+                    self.templates[name], canvas_manager, auto_start
                 )
 
             # Load from file
@@ -358,7 +653,9 @@ class TemplateManager:
                     template_data = json.load(f)
 
                 self.templates[name] = template_data
-                return UISerializer.deserialize_canvas(template_data, canvas_manager)
+                return UISerializer.deserialize_canvas(
+                    template_data, canvas_manager, auto_start
+                )
 
             logger.warning(f"Template not found: {name}")
             return None
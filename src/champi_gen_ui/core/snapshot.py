@@ -0,0 +1,380 @@
+"""Binary snapshot format for canvas export/import.
+
+A snapshot holds the same structure as the JSON export, but encoded
+compactly, with numeric arrays stored as raw blocks:
+
+* 8-byte magic ``CGUISNAP`` and the header length (uint64, little-endian)
+* The header: a MessagePack map ``{"version", "blocks", "root"}``. ``root``
+  is the serialized canvas. Arrays inside it are MessagePack extension
+  values that index into ``blocks``, a list of ``[dtype, shape, offset]``.
+  Tuples are an extension type as well, so they survive the round trip.
+* The array blocks: raw little-endian data, each block 64-byte aligned.
+  Offsets are relative to the first block.
+
+Loading can memory-map the file, so array properties are read-only views of
+the file that are paged in only when touched.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+MAGIC = b"CGUISNAP"
+VERSION = 1
+
+# Alignment of array blocks, in bytes
+_ALIGNMENT = 64
+
+# MessagePack extension type codes
+_EXT_ARRAY = 1
+_EXT_TUPLE = 2
+
+_PREFIX = struct.Struct("<8sQ")
+
+# Decoder tables: tag -> value, tag -> number format, tag -> (kind, length format)
+_CONSTANTS = {0xC0: None, 0xC2: False, 0xC3: True}
+_NUMBERS = {
+    0xCA: ">f",
+    0xCB: ">d",
+    0xCC: ">B",
+    0xCD: ">H",
+    0xCE: ">I",
+    0xCF: ">Q",
+    0xD0: ">b",
+    0xD1: ">h",
+    0xD2: ">i",
+    0xD3: ">q",
+}
+_SIZED = {
+    0xC4: ("bin", ">B"),
+    0xC5: ("bin", ">H"),
+    0xC6: ("bin", ">I"),
+    0xC7: ("ext", ">B"),
+    0xC8: ("ext", ">H"),
+    0xC9: ("ext", ">I"),
+    0xD9: ("str", ">B"),
+    0xDA: ("str", ">H"),
+    0xDB: ("str", ">I"),
+    0xDC: ("list", ">H"),
+    0xDD: ("list", ">I"),
+    0xDE: ("map", ">H"),
+    0xDF: ("map", ">I"),
+}
+
+
+def _aligned(offset: int) -> int:
+    """Round an offset up to the block alignment."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+class _Encoder:
+    """MessagePack encoder that moves NumPy arrays out to blocks."""
+
+    def __init__(self):
+        """Initialize encoder."""
+        self.out = bytearray()
+        self.arrays: list[np.ndarray] = []
+
+    def encode(self, value: Any) -> None:
+        """Append the encoding of a value."""
+        out = self.out
+        # bool before int: bool is an int subclass
+        if value is None:
+            out.append(0xC0)
+        elif value is True or value is False or isinstance(value, np.bool_):
+            out.append(0xC3 if value else 0xC2)
+        elif isinstance(value, int | np.integer):
+            self._encode_int(int(value))
+        elif isinstance(value, float | np.floating):
+            out += struct.pack(">Bd", 0xCB, float(value))
+        elif isinstance(value, str):
+            data = value.encode("utf-8")
+            self._header(len(data), 0xA0, 32, (0xD9, 0xDA, 0xDB))
+            out += data
+        elif isinstance(value, bytes | bytearray | memoryview):
+            data = bytes(value)
+            self._header(len(data), None, 0, (0xC4, 0xC5, 0xC6))
+            out += data
+        elif isinstance(value, list):
+            self._header(len(value), 0x90, 16, (None, 0xDC, 0xDD))
+            for item in value:
+                self.encode(item)
+        elif isinstance(value, tuple):
+            nested = _Encoder()
+            nested.arrays = self.arrays
+            nested.encode(list(value))
+            self._ext(_EXT_TUPLE, nested.out)
+        elif isinstance(value, dict):
+            self._header(len(value), 0x80, 16, (None, 0xDE, 0xDF))
+            for key, item in value.items():
+                self.encode(key)
+                self.encode(item)
+        elif isinstance(value, np.ndarray):
+            if value.dtype.kind not in "biufc":
+                raise TypeError(f"Cannot snapshot arrays of dtype {value.dtype}")
+            self.arrays.append(value)
+            self._ext(_EXT_ARRAY, struct.pack("<I", len(self.arrays) - 1))
+        else:
+            raise TypeError(f"Cannot snapshot {type(value).__name__} values")
+
+    def _encode_int(self, value: int) -> None:
+        """Append an integer in the smallest fitting MessagePack form."""
+        if 0 <= value < 0x80 or -32 <= value < 0:
+            self.out += struct.pack(">b" if value < 0 else ">B", value)
+        elif -(2**63) <= value < 2**63:
+            self.out += struct.pack(">Bq", 0xD3, value)
+        elif 0 <= value < 2**64:
+            self.out += struct.pack(">BQ", 0xCF, value)
+        else:
+            raise ValueError(f"Integer out of range for a snapshot: {value}")
+
+    def _header(
+        self,
+        length: int,
+        fixed: int | None,
+        fixed_limit: int,
+        tags: tuple[int | None, int, int],
+    ) -> None:
+        """Append a length header: fixed form, then 8-, 16- or 32-bit length."""
+        if fixed is not None and length < fixed_limit:
+            self.out.append(fixed | length)
+        elif tags[0] is not None and length < 2**8:
+            self.out += struct.pack(">BB", tags[0], length)
+        elif length < 2**16:
+            self.out += struct.pack(">BH", tags[1], length)
+        else:
+            self.out += struct.pack(">BI", tags[2], length)
+
+    def _ext(self, code: int, data: bytes | bytearray) -> None:
+        """Append an extension value."""
+        if len(data) < 2**8:
+            self.out += struct.pack(">BBb", 0xC7, len(data), code)
+        elif len(data) < 2**16:
+            self.out += struct.pack(">BHb", 0xC8, len(data), code)
+        else:
+            self.out += struct.pack(">BIb", 0xC9, len(data), code)
+        self.out += data
+
+
+class _Decoder:
+    """MessagePack decoder that resolves array extensions to blocks."""
+
+    def __init__(self, data: memoryview, arrays: list[np.ndarray] | None = None):
+        """Initialize decoder."""
+        self.data = data
+        self.pos = 0
+        self.arrays = arrays or []
+
+    def _take(self, count: int) -> memoryview:
+        """Consume ``count`` bytes."""
+        if self.pos + count > len(self.data):
+            raise ValueError("Truncated snapshot")
+        chunk = self.data[self.pos : self.pos + count]
+        self.pos += count
+        return chunk
+
+    def _unpack(self, fmt: str) -> int | float:
+        """Consume one big-endian number."""
+        (value,) = struct.unpack(fmt, self._take(struct.calcsize(fmt)))
+        return value if isinstance(value, float) else int(value)
+
+    def decode(self) -> Any:
+        """Decode the next value."""
+        tag = self._take(1)[0]
+        if tag < 0x80:
+            return tag
+        if tag >= 0xE0:
+            return tag - 0x100
+        if tag <= 0x8F:
+            return self._map(tag & 0x0F)
+        if tag <= 0x9F:
+            return self._list(tag & 0x0F)
+        if tag <= 0xBF:
+            return self._str(tag & 0x1F)
+
+        if tag in _CONSTANTS:
+            return _CONSTANTS[tag]
+        if tag in _NUMBERS:
+            return self._unpack(_NUMBERS[tag])
+        if tag in _SIZED:
+            kind, fmt = _SIZED[tag]
+            length = int(self._unpack(fmt))
+            if kind == "str":
+                return self._str(length)
+            if kind == "bin":
+                return bytes(self._take(length))
+            if kind == "list":
+                return self._list(length)
+            if kind == "map":
+                return self._map(length)
+            return self._ext(length)
+        raise ValueError(f"Unsupported snapshot tag 0x{tag:02x}")
+
+    def _str(self, length: int) -> str:
+        return str(self._take(length), "utf-8")
+
+    def _list(self, length: int) -> list[Any]:
+        return [self.decode() for _ in range(length)]
+
+    def _map(self, length: int) -> dict[Any, Any]:
+        result = {}
+        for _ in range(length):
+            key = self.decode()
+            result[key] = self.decode()
+        return result
+
+    def _ext(self, length: int) -> Any:
+        code = struct.unpack(">b", self._take(1))[0]
+        payload = self._take(length)
+        if code == _EXT_ARRAY:
+            return self.arrays[struct.unpack("<I", payload)[0]]
+        if code == _EXT_TUPLE:
+            return tuple(_Decoder(payload, self.arrays).decode())
+        raise ValueError(f"Unknown snapshot extension type {code}")
+
+
+def dumps(data: Any) -> bytes:
+    """Encode a serialized canvas (or any plain structure) as a snapshot.
+
+    Args:
+        data: Structure of dicts, lists, tuples, scalars and NumPy arrays
+
+    Returns:
+        Snapshot bytes
+
+    Raises:
+        TypeError: If the structure holds a value that cannot be stored
+    """
+    root = _Encoder()
+    root.encode(data)
+
+    # [dtype, shape, offset] per array, offsets relative to the data start
+    blocks: list[list[Any]] = []
+    offset = 0
+    arrays = [
+        array.astype(array.dtype.newbyteorder("<"), order="C", copy=False)
+        for array in root.arrays
+    ]
+    for array in arrays:
+        blocks.append([array.dtype.str, list(array.shape), offset])
+        offset = _aligned(offset + array.nbytes)
+
+    header = _Encoder()
+    header.out.append(0x83)
+    for key, value in (("version", VERSION), ("blocks", blocks)):
+        header.encode(key)
+        header.encode(value)
+    header.encode("root")
+    header.out += root.out
+
+    out = bytearray(_PREFIX.pack(MAGIC, len(header.out)))
+    out += header.out
+    data_start = _aligned(len(out))
+    for array, (_, _, block_offset) in zip(arrays, blocks, strict=True):
+        out += bytes(data_start + block_offset - len(out))
+        out += array.data.cast("B") if array.size else b""
+    return bytes(out)
+
+
+def loads(buffer: bytes | bytearray | memoryview | mmap.mmap) -> Any:
+    """Decode a snapshot.
+
+    Arrays are read-only views of ``buffer``, so the buffer is kept alive
+    by them.
+
+    Args:
+        buffer: Snapshot bytes (or a memory map of a snapshot file)
+
+    Returns:
+        The encoded structure
+
+    Raises:
+        ValueError: If the buffer is not a valid snapshot
+    """
+    view = memoryview(buffer)
+    if len(view) < _PREFIX.size:
+        raise ValueError("Not a snapshot: too short")
+    magic, header_length = _PREFIX.unpack(view[: _PREFIX.size])
+    if magic != MAGIC:
+        raise ValueError("Not a snapshot: bad magic")
+    header_end = _PREFIX.size + header_length
+    if header_end > len(view):
+        raise ValueError("Truncated snapshot")
+
+    header = view[_PREFIX.size : header_end]
+    decoder = _Decoder(header)
+    if decoder._take(1)[0] != 0x83:
+        raise ValueError("Malformed snapshot header")
+    fields: dict[str, Any] = {}
+    while len(fields) < 2:
+        key = decoder.decode()
+        fields[key] = decoder.decode()
+    if fields.get("version") != VERSION:
+        raise ValueError(f"Unsupported snapshot version {fields.get('version')}")
+
+    data_start = _aligned(header_end)
+    for dtype, shape, offset in fields["blocks"]:
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        start = data_start + offset
+        if start + count * dtype.itemsize > len(view):
+            raise ValueError("Truncated snapshot")
+        array = np.frombuffer(view, dtype=dtype, count=count, offset=start)
+        decoder.arrays.append(array.reshape(shape))
+
+    if decoder.decode() != "root":
+        raise ValueError("Malformed snapshot header")
+    return decoder.decode()
+
+
+def save(data: Any, filepath: str | Path) -> None:
+    """Write a snapshot file.
+
+    The snapshot is written to a temporary file that then replaces
+    ``filepath``, so snapshots already loaded from ``filepath`` with
+    ``memory_map`` keep their (now unlinked) file rather than seeing it
+    truncated.
+
+    Args:
+        data: Structure to store (see ``dumps``)
+        filepath: Output file path
+    """
+    path = Path(filepath)
+    encoded = dumps(data)
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def load(filepath: str | Path, memory_map: bool = True) -> Any:
+    """Read a snapshot file.
+
+    Args:
+        filepath: Input file path
+        memory_map: Map the file instead of reading it, so array data is
+            paged in on first access. The file must not be modified in place
+            while the returned arrays are in use (``save`` replaces it
+            instead); accessing a mapping of a truncated file crashes the
+            process.
+
+    Returns:
+        The stored structure
+    """
+    with open(filepath, "rb") as f:
+        if not memory_map:
+            return loads(f.read())
+        if not Path(filepath).stat().st_size:
+            raise ValueError("Not a snapshot: too short")
+        return loads(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
@@ -1,10 +1,13 @@
 """State management for canvas and widgets."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 import blinker
+import numpy as np
 
 
 class CanvasMode(Enum):
@@ -31,6 +34,8 @@ class CanvasState:
     active: bool = True
     fps_idle: int = 10
     fps_active: int = 60
+    clipping: bool = False
+    headless: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -45,12 +50,26 @@ class CanvasState:
             "active": self.active,
             "fps_idle": self.fps_idle,
             "fps_active": self.fps_active,
+            "clipping": self.clipping,
+            "headless": self.headless,
         }
 
 
-@dataclass
+# Shared read-only default for containers a widget has never written to
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class WidgetState:
-    """State for a widget."""
+    """State for a widget.
+
+    Kept compact for canvases with very many widgets: the class is slotted,
+    and ``children``, ``callbacks`` and ``data_bindings`` share a read-only
+    empty mapping until the first write, so use the ``add_child``/
+    ``remove_child``, ``set_callback`` and ``set_binding`` helpers.
+    ``children`` maps child IDs to ``None`` in insertion order, so adding or
+    removing a child is constant time.
+    """
 
     widget_id: str
     widget_type: str
@@ -60,30 +79,88 @@ class WidgetState:
     visible: bool = True
     enabled: bool = True
     parent: str | None = None
-    children: list[str] = field(default_factory=list)
-    callbacks: dict[str, str] = field(default_factory=dict)
-    data_bindings: dict[str, Any] = field(default_factory=dict)
+    children: Mapping[str, None] = _EMPTY_MAPPING
+    callbacks: Mapping[str, str] = _EMPTY_MAPPING
+    data_bindings: Mapping[str, Any] = _EMPTY_MAPPING
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+    def __post_init__(self) -> None:
+        """Normalize containers passed in by callers."""
+        self.children = (
+            dict.fromkeys(self.children) if self.children else _EMPTY_MAPPING
+        )
+        if not self.callbacks:
+            self.callbacks = _EMPTY_MAPPING
+        if not self.data_bindings:
+            self.data_bindings = _EMPTY_MAPPING
+
+    def add_child(self, child_id: str) -> None:
+        """Append a child widget ID if not already present."""
+        if isinstance(self.children, dict):
+            self.children.setdefault(child_id)
+        else:
+            self.children = {child_id: None}
+
+    def remove_child(self, child_id: str) -> None:
+        """Remove a child widget ID if present."""
+        if isinstance(self.children, dict) and child_id in self.children:
+            del self.children[child_id]
+            if not self.children:
+                self.children = _EMPTY_MAPPING
+
+    def set_callback(self, event: str, name: str) -> None:
+        """Record the name of the callback registered for an event."""
+        self.callbacks = {**self.callbacks, event: name}
+
+    def set_binding(self, property_name: str, source: Any) -> None:
+        """Record the data source bound to a property."""
+        self.data_bindings = {**self.data_bindings, property_name: source}
+
+    def remove_binding(self, property_name: str) -> None:
+        """Forget the data source bound to a property."""
+        if property_name in self.data_bindings:
+            remaining = {
+                k: v for k, v in self.data_bindings.items() if k != property_name
+            }
+            self.data_bindings = remaining or _EMPTY_MAPPING
+
+    def to_dict(self, arrays: bool = False) -> dict[str, Any]:
+        """Convert to dictionary.
+
+        Containers are shallow-copied only when non-empty; ``children`` is
+        returned as a list of child IDs, and NumPy array properties
+        (plot data) as nested lists unless ``arrays`` is set.
+
+        Args:
+            arrays: Keep array properties as NumPy arrays (for binary formats)
+        """
+        if arrays:
+            properties = dict(self.properties)
+        else:
+            properties = {
+                key: value.tolist() if isinstance(value, np.ndarray) else value
+                for key, value in self.properties.items()
+            }
         return {
             "widget_id": self.widget_id,
             "widget_type": self.widget_type,
-            "properties": self.properties.copy(),
+            "properties": properties,
             "position": list(self.position) if self.position else None,
             "size": list(self.size) if self.size else None,
             "visible": self.visible,
             "enabled": self.enabled,
             "parent": self.parent,
-            "children": self.children.copy(),
-            "callbacks": self.callbacks.copy(),
-            "data_bindings": self.data_bindings.copy(),
+            "children": list(self.children),
+            "callbacks": dict(self.callbacks) if self.callbacks else {},
+            "data_bindings": dict(self.data_bindings) if self.data_bindings else {},
         }
 
 
 # Signals for state changes
 widget_created = blinker.signal("widget-created")
 widget_updated = blinker.signal("widget-updated")
+widget_edited = blinker.signal("widget-edited")
+widget_event = blinker.signal("widget-event")
 widget_deleted = blinker.signal("widget-deleted")
 canvas_updated = blinker.signal("canvas-updated")
+canvas_removed = blinker.signal("canvas-removed")
 state_changed = blinker.signal("state-changed")
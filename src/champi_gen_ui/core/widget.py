@@ -2,65 +2,160 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from imgui_bundle import imgui
 from loguru import logger
 
-from champi_gen_ui.core.state import WidgetState, widget_created, widget_updated
+from champi_gen_ui.core.state import (
+    WidgetState,
+    widget_created,
+    widget_edited,
+    widget_event,
+    widget_updated,
+)
+
+if TYPE_CHECKING:
+    from champi_gen_ui.core.changes import ChangeLog
+    from champi_gen_ui.core.profiler import FrameProfiler
 
 
 class Widget(ABC):
     """Base class for all widgets."""
 
+    # Properties also kept in an attribute that render() edits in place
+    _mirrored_properties: ClassVar[dict[str, str]] = {}
+
     def __init__(self, widget_id: str, **props):
         """Initialize widget."""
         self.widget_id = widget_id
         self.state = WidgetState(
             widget_id=widget_id, widget_type=self.__class__.__name__, properties=props
         )
-        self._callbacks: dict[str, Callable] = {}
+        self._callbacks: dict[str, Callable] | None = None
+        self._registry: WidgetRegistry | None = None
 
     @abstractmethod
     def render(self) -> Any:
         """Render the widget using ImGui calls."""
         pass
 
+    def draw(self) -> None:
+        """Position and render the widget, logging any render error."""
+        try:
+            # Set position if specified
+            if self.state.position:
+                imgui.set_cursor_pos(imgui.ImVec2(*self.state.position))
+
+            registry = self._registry
+            if registry is not None and registry.profiler is not None:
+                registry.profiler.measure(self)
+            else:
+                self.render()
+        except Exception as e:
+            logger.error(f"Error rendering widget {self.widget_id}: {e}", exc_info=True)
+
+    def render_children(self) -> None:
+        """Render visible child widgets (called by open containers)."""
+        if self._registry:
+            for child in self._registry.children(self.widget_id):
+                child.draw()
+
     def update(self, **props) -> None:
         """Update widget properties."""
-        self.state.properties.update(props)
+        props = self.coerce_update(props)
+        properties = self.state.properties
+        properties.update(props)
+        for name, attribute in self._mirrored_properties.items():
+            if name in props:
+                setattr(self, attribute, props[name])
+        for name in props:
+            self._record_change("add", ("properties", name), properties[name])
         widget_updated.send(self, widget=self)
-        logger.debug(f"Updated widget {self.widget_id} with {props}")
+        logger.debug("Updated widget {} with {}", self.widget_id, props)
+
+    def coerce_update(self, props: dict[str, Any]) -> dict[str, Any]:
+        """Validate and convert properties for ``update``.
+
+        Widgets that convert or check property values override this, so that
+        bad values can be rejected before anything is changed.
+
+        Args:
+            props: Properties to set (not modified)
+
+        Returns:
+            The properties as ``update`` would store them
+
+        Raises:
+            ValueError: If a value is invalid
+        """
+        return props
+
+    def _set_edited(self, name: str, value: Any) -> None:
+        """Store a property changed by user input and announce the edit."""
+        self.state.properties[name] = value
+        self._record_change("add", ("properties", name), value)
+        if widget_edited.receivers:
+            widget_edited.send(self, widget=self, property=name, value=value)
 
     def set_visible(self, visible: bool) -> None:
         """Set widget visibility."""
-        self.state.visible = visible
+        if visible != self.state.visible:
+            self.state.visible = visible
+            if self._registry:
+                self._registry.invalidate()
+            self._record_change("replace", ("visible",), visible)
 
     def set_enabled(self, enabled: bool) -> None:
         """Set widget enabled state."""
         self.state.enabled = enabled
+        self._record_change("replace", ("enabled",), enabled)
 
     def set_position(self, x: float, y: float) -> None:
         """Set widget position."""
         self.state.position = (x, y)
+        self._record_change("replace", ("position",), self.state.position)
 
     def set_size(self, width: float, height: float) -> None:
         """Set widget size."""
         self.state.size = (width, height)
+        self._record_change("replace", ("size",), self.state.size)
+
+    def _record_change(self, op: str, path: tuple[str, ...], value: Any) -> None:
+        """Record a state change in the change log of the widget's canvas.
+
+        Args:
+            op: Change log operation (see ``champi_gen_ui.core.changes``)
+            path: Path below this widget's serialized state
+            value: New value
+        """
+        registry = self._registry
+        if registry is not None and registry.changes is not None:
+            registry.changes.record(op, ("widgets", self.widget_id, *path), value)
 
     def register_callback(self, event: str, callback: Callable) -> None:
         """Register a callback function."""
+        if self._callbacks is None:
+            self._callbacks = {}
         self._callbacks[event] = callback
-        self.state.callbacks[event] = callback.__name__
+        self.state.set_callback(event, callback.__name__)
+        self._record_change("replace", ("callbacks",), self.state.callbacks)
 
     def trigger_callback(self, event: str, *args, **kwargs) -> Any:
-        """Trigger a registered callback."""
-        if event in self._callbacks:
+        """Trigger a registered callback and announce the event."""
+        if widget_event.receivers:
+            widget_event.send(self, widget=self, event=event, args=args)
+        if self._callbacks and event in self._callbacks:
             return self._callbacks[event](*args, **kwargs)
         return None
 
-    def serialize(self) -> dict[str, Any]:
-        """Serialize widget state to dictionary."""
-        return self.state.to_dict()
+    def serialize(self, arrays: bool = False) -> dict[str, Any]:
+        """Serialize widget state to dictionary.
+
+        Args:
+            arrays: Keep array properties as NumPy arrays instead of lists
+        """
+        return self.state.to_dict(arrays)
 
 
 class WidgetFactory:
@@ -98,6 +193,14 @@ class WidgetRegistry:
         """Initialize registry."""
         self._widgets: dict[str, Widget] = {}
         self._factory = WidgetFactory()
+        self._render_list: list[Widget] = []
+        self._child_lists: dict[str, list[Widget]] = {}
+        self._render_list_dirty = True
+        self.profiler: FrameProfiler | None = None
+        # Change log of the owning canvas; widgets record their edits in it
+        self.changes: ChangeLog | None = None
+        # Called with (widget_id, widget) on add and (widget_id, None) on removal
+        self.listener: Callable[[str, Widget | None], None] | None = None
 
     @property
     def factory(self) -> WidgetFactory:
@@ -107,6 +210,11 @@ class WidgetRegistry:
     def add(self, widget: Widget) -> None:
         """Add a widget to the registry."""
         self._widgets[widget.widget_id] = widget
+        widget._registry = self
+        self._link_child(widget)
+        self.invalidate()
+        if self.listener is not None:
+            self.listener(widget.widget_id, widget)
         logger.debug(f"Added widget {widget.widget_id} to registry")
 
     def get(self, widget_id: str) -> Widget | None:
@@ -114,13 +222,144 @@ class WidgetRegistry:
         return self._widgets.get(widget_id)
 
     def remove(self, widget_id: str) -> bool:
-        """Remove a widget from the registry."""
+        """Remove a widget from the registry.
+
+        Children of the removed widget stay registered and become top-level.
+        """
         if widget_id in self._widgets:
-            del self._widgets[widget_id]
+            widget = self._widgets.pop(widget_id)
+            widget._registry = None
+            self._unlink_child(widget)
+            for child_id in widget.state.children:
+                child = self._widgets.get(child_id)
+                if child and child.state.parent == widget_id:
+                    child.state.parent = None
+            self.invalidate()
+            if self.listener is not None:
+                self.listener(widget_id, None)
             logger.debug(f"Removed widget {widget_id} from registry")
             return True
         return False
 
+    def move(self, widget_id: str, index: int) -> bool:
+        """Move a widget to a new position in render order."""
+        if widget_id not in self._widgets:
+            return False
+
+        order = [wid for wid in self._widgets if wid != widget_id]
+        order.insert(index, widget_id)
+        self._widgets = {wid: self._widgets[wid] for wid in order}
+        self.invalidate()
+        return True
+
+    def set_parent(self, widget_id: str, parent_id: str | None) -> None:
+        """
+        Move a widget under a new parent container.
+
+        Args:
+            widget_id: Widget to move
+            parent_id: New parent widget ID, or None for top-level
+
+        Raises:
+            ValueError: If a widget is missing or the move would create a cycle
+        """
+        widget = self._widgets.get(widget_id)
+        if not widget:
+            raise ValueError(f"Widget {widget_id} not found")
+        if parent_id is not None:
+            if parent_id not in self._widgets:
+                raise ValueError(f"Parent widget {parent_id} not found")
+            if parent_id == widget_id or widget_id in self.ancestors(parent_id):
+                raise ValueError(f"Cannot parent {widget_id} under its own subtree")
+
+        self._unlink_child(widget)
+        widget.state.parent = parent_id
+        self._link_child(widget)
+        self.invalidate()
+
+    def ancestors(self, widget_id: str) -> list[str]:
+        """Get the IDs of a widget's ancestors, nearest first."""
+        result: list[str] = []
+        widget = self._widgets.get(widget_id)
+        while widget and widget.state.parent in self._widgets:
+            if widget.state.parent in result:
+                break
+            result.append(widget.state.parent)
+            widget = self._widgets[widget.state.parent]
+        return result
+
+    def descendants(self, widget_id: str) -> list[str]:
+        """Get the IDs of all widgets below a widget, depth first.
+
+        Walks the ``children`` of the subtree, so the cost depends on its size
+        rather than on the number of widgets in the registry.
+        """
+        result: list[str] = []
+        widget = self._widgets.get(widget_id)
+        stack: list[str] = [*widget.state.children][::-1] if widget else []
+        while stack:
+            current = stack.pop()
+            child = self._widgets.get(current)
+            if child is None:
+                continue
+            result.append(current)
+            stack.extend([*child.state.children][::-1])
+        return result
+
+    def _link_child(self, widget: Widget) -> None:
+        """Record a widget in its parent's children list."""
+        parent = self._widgets.get(widget.state.parent or "")
+        if parent:
+            parent.state.add_child(widget.widget_id)
+
+    def _unlink_child(self, widget: Widget) -> None:
+        """Drop a widget from its parent's children list."""
+        parent = self._widgets.get(widget.state.parent or "")
+        if parent:
+            parent.state.remove_child(widget.widget_id)
+
+    def invalidate(self) -> None:
+        """Mark the render list as stale."""
+        self._render_list_dirty = True
+
+    def _rebuild_render_lists(self) -> None:
+        """Rebuild the top-level render list and parent-indexed child lists."""
+        roots: list[Widget] = []
+        children: dict[str, list[Widget]] = {}
+        widgets = self._widgets
+        for widget in widgets.values():
+            if not widget.state.visible:
+                continue
+            parent = widget.state.parent
+            if parent is not None and parent in widgets:
+                children.setdefault(parent, []).append(widget)
+            else:
+                roots.append(widget)
+
+        self._render_list = roots
+        self._child_lists = children
+        self._render_list_dirty = False
+
+    def render_list(self) -> list[Widget]:
+        """Get visible top-level widgets in render order.
+
+        The list is retained between frames and only rebuilt after widgets
+        are added, removed, reordered, reparented or change visibility.
+        """
+        if self._render_list_dirty:
+            self._rebuild_render_lists()
+        return self._render_list
+
+    def children(self, widget_id: str) -> list[Widget]:
+        """Get visible children of a widget in render order."""
+        if self._render_list_dirty:
+            self._rebuild_render_lists()
+        return self._child_lists.get(widget_id, [])
+
+    def __len__(self) -> int:
+        """Get the number of registered widgets."""
+        return len(self._widgets)
+
     def list(self) -> list[str]:
         """List all widget IDs."""
         return list(self._widgets.keys())
@@ -131,5 +370,10 @@ class WidgetRegistry:
 
     def clear(self) -> None:
         """Clear all widgets."""
+        for widget in self._widgets.values():
+            widget._registry = None
+            if self.listener is not None:
+                self.listener(widget.widget_id, None)
         self._widgets.clear()
+        self.invalidate()
         logger.debug("Cleared widget registry")
@@ -1,16 +1,26 @@
 """Main FastMCP server implementation."""
 
+import asyncio
+import base64
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from functools import partial
 from typing import Any
 
-from fastmcp import FastMCP
+import numpy as np
+from fastmcp import Context, FastMCP
 from loguru import logger
+from mcp.server.session import ServerSession
+from pydantic import AnyUrl
 
 from champi_gen_ui.core.binding import BindingManager, DataStore, ValidationManager
-from champi_gen_ui.core.canvas import CanvasManager
+from champi_gen_ui.core.canvas import Canvas, CanvasManager
 from champi_gen_ui.core.codegen import (
     CodeGenerator,
     TemplateCodeGenerator,
 )
+from champi_gen_ui.core.events import EventHub
 from champi_gen_ui.core.serialization import (
     TemplateManager,
     UIExporter,
@@ -41,6 +51,7 @@ from champi_gen_ui.widgets.basic import (
     ListBoxWidget,
     RadioButtonWidget,
     TextWidget,
+    VirtualListWidget,
 )
 from champi_gen_ui.widgets.container import (
     CollapsingHeaderWidget,
@@ -68,7 +79,9 @@ from champi_gen_ui.widgets.plotting import (
     HeatmapWidget,
     LineChartWidget,
     PieChartWidget,
+    PlotWidget,
     ScatterPlotWidget,
+    as_plot_array,
 )
 from champi_gen_ui.widgets.slider import (
     DragFloatWidget,
@@ -82,15 +95,19 @@ from champi_gen_ui.widgets.slider import (
 mcp = FastMCP("champi-gen-ui", dependencies=["imgui-bundle", "pyglm"])
 
 # Global managers
-canvas_manager = CanvasManager()
+# CHAMPI_GEN_UI_HEADLESS=1 renders canvases offscreen (display-less hosts, CI)
+canvas_manager = CanvasManager(
+    headless=os.environ.get("CHAMPI_GEN_UI_HEADLESS", "").lower() in ("1", "true")
+)
 theme_manager = ThemeManager()
 layout_manager = LayoutManager()
 notification_manager = NotificationManager()
 animation_manager = AnimationManager()
 data_store = DataStore()
-binding_manager = BindingManager(data_store)
+binding_manager = BindingManager(data_store, canvas_manager)
 validation_manager = ValidationManager()
 template_manager = TemplateManager()
+event_hub = EventHub()
 
 # Initialize theme presets
 for _name, theme in THEME_PRESETS.items():
@@ -98,15 +115,18 @@ for _name, theme in THEME_PRESETS.items():
 
 
 # Helper function to ensure canvas is active
-def _ensure_canvas_active(canvas_id: str) -> bool:
-    """Ensure canvas exists and is running."""
-    return canvas_manager.ensure_canvas_running(canvas_id)
+async def _ensure_canvas_active(canvas_id: str) -> bool:
+    """Ensure canvas exists and is running, awaiting its first frame."""
+    return await canvas_manager.ensure_canvas_running_async(canvas_id)
 
 
 # Register widget types
 def register_widgets():
     """Register all widget types with factories."""
-    for canvas in canvas_manager.canvases.values():
+    for canvas_id in canvas_manager.list_canvases():
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            continue
         registry = canvas.widget_registry
         registry.factory.register("button", ButtonWidget)
         registry.factory.register("text", TextWidget)
@@ -115,24 +135,44 @@ def register_widgets():
         registry.factory.register("radio_button", RadioButtonWidget)
         registry.factory.register("combo", ComboWidget)
         registry.factory.register("list_box", ListBoxWidget)
+        registry.factory.register("virtual_list", VirtualListWidget)
         registry.factory.register("color_picker", ColorPickerWidget)
         registry.factory.register("slider_int", SliderIntWidget)
         registry.factory.register("slider_float", SliderFloatWidget)
         registry.factory.register("drag_int", DragIntWidget)
         registry.factory.register("drag_float", DragFloatWidget)
         registry.factory.register("progress_bar", ProgressBarWidget)
+        registry.factory.register("window", WindowWidget)
+        registry.factory.register("separator", SeparatorWidget)
+        registry.factory.register("collapsing_header", CollapsingHeaderWidget)
+        registry.factory.register("menu_bar", MenuBarWidget)
+        registry.factory.register("menu", MenuWidget)
+        registry.factory.register("menu_item", MenuItemWidget)
+        registry.factory.register("tree_node", TreeNodeWidget)
+        registry.factory.register("selectable", SelectableWidget)
+        registry.factory.register("colored_text", TextColoredWidget)
+        registry.factory.register("bullet_text", BulletTextWidget)
+        registry.factory.register("help_marker", HelpMarkerWidget)
+        registry.factory.register("plot_lines", PlotLinesWidget)
+        registry.factory.register("line_chart", LineChartWidget)
+        registry.factory.register("bar_chart", BarChartWidget)
+        registry.factory.register("scatter_plot", ScatterPlotWidget)
+        registry.factory.register("pie_chart", PieChartWidget)
+        registry.factory.register("heatmap", HeatmapWidget)
 
 
 # Canvas Management Tools
 
 
 @mcp.tool()
-def create_canvas(
+async def create_canvas(
     canvas_id: str,
     width: int = 1280,
     height: int = 720,
     mode: str = "standard",
     title: str = "ImGui Canvas",
+    clipping: bool = False,
+    headless: bool | None = None,
 ) -> dict[str, Any]:
     """
     Create a new canvas for rendering ImGui UI.
@@ -143,18 +183,27 @@ def create_canvas(
         height: Canvas height in pixels
         mode: Rendering mode (standard, docking, multi_viewport, fullscreen, overlay)
         title: Window title
+        clipping: Only render top-level widgets inside the visible scroll
+            region (for canvases made of many uniform rows)
+        headless: Render offscreen without a window (defaults to the
+            server's CHAMPI_GEN_UI_HEADLESS setting)
 
     Returns:
         Canvas state dictionary
     """
     try:
         canvas_mode = CanvasMode(mode)
-        canvas = canvas_manager.create_canvas(
+        props: dict[str, Any] = {}
+        if headless is not None:
+            props["headless"] = headless
+        canvas = await canvas_manager.create_canvas_async(
             canvas_id=canvas_id,
             width=width,
             height=height,
             mode=canvas_mode,
             title=title,
+            clipping=clipping,
+            **props,
         )
         register_widgets()
         logger.info(f"Created canvas: {canvas_id}")
@@ -186,7 +235,37 @@ def get_canvas_state(canvas_id: str) -> dict[str, Any]:
 
 
 @mcp.tool()
-def clear_canvas(canvas_id: str) -> dict[str, Any]:
+def get_canvas_changes(canvas_id: str, since_revision: int = 0) -> dict[str, Any]:
+    """
+    Get the changes to a canvas's state since a revision.
+
+    ``get_canvas_state`` returns the state with its ``revision``. Pass that
+    revision here to get only what changed since then, as JSON Patch style
+    operations (``add``, ``replace``, ``remove``, plus ``extend`` for values
+    appended to an array) against the state. Apply them and keep the
+    returned ``revision`` for the next call. When the change log no longer
+    reaches back to ``since_revision``, ``full`` is true and the full
+    ``state`` is returned instead.
+
+    Args:
+        canvas_id: Canvas identifier
+        since_revision: Revision of the state the caller has
+
+    Returns:
+        Current revision and either a patch or the full state
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+        return {"success": True, "data": canvas.get_changes(since_revision)}
+    except Exception as e:
+        logger.error(f"Error getting canvas changes: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+async def clear_canvas(canvas_id: str) -> dict[str, Any]:
     """
     Clear all widgets from a canvas.
 
@@ -200,7 +279,7 @@ def clear_canvas(canvas_id: str) -> dict[str, Any]:
         canvas = canvas_manager.get_canvas(canvas_id)
         if not canvas:
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
-        canvas.clear()
+        await canvas.clear_async()
         return {"success": True, "data": {"message": f"Canvas {canvas_id} cleared"}}
     except Exception as e:
         logger.error(f"Error clearing canvas: {e}")
@@ -223,11 +302,101 @@ def list_canvases() -> dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+@mcp.tool()
+async def capture_canvas(canvas_id: str, format: str = "png") -> dict[str, Any]:
+    """
+    Capture the next rendered frame of a headless canvas.
+
+    Args:
+        canvas_id: Canvas identifier
+        format: "png" for a PNG image, "rgba" for raw RGBA8 pixels
+
+    Returns:
+        Base64-encoded frame with its format and size
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        await _ensure_canvas_active(canvas_id)
+        frame = await canvas.capture_frame_async(format)
+        width, height = canvas.state.size
+        return {
+            "success": True,
+            "data": {
+                "format": format,
+                "width": width,
+                "height": height,
+                "data": base64.b64encode(frame).decode("ascii"),
+            },
+        }
+    except Exception as e:
+        logger.error(f"Error capturing canvas: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+async def set_canvas_profiling(
+    canvas_id: str, enabled: bool = True, overlay: bool = False, capacity: int = 300
+) -> dict[str, Any]:
+    """
+    Turn frame profiling on or off for a canvas.
+
+    Args:
+        canvas_id: Canvas identifier
+        enabled: Record frame, command and per-widget render timings
+        overlay: Show the metrics overlay on the canvas
+        capacity: Number of frames kept for metrics
+
+    Returns:
+        Success status
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+        if enabled:
+            await canvas.enable_profiling_async(capacity=capacity, overlay=overlay)
+        else:
+            await canvas.disable_profiling_async()
+        return {"success": True, "data": {"canvas_id": canvas_id, "enabled": enabled}}
+    except Exception as e:
+        logger.error(f"Error setting canvas profiling: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+def get_canvas_metrics(
+    canvas_id: str, frames: int | None = None, top: int = 10
+) -> dict[str, Any]:
+    """
+    Get frame-time metrics for a profiled canvas.
+
+    Args:
+        canvas_id: Canvas identifier
+        frames: Number of recent frames to aggregate (all recorded if omitted)
+        top: Number of costliest widget types and widgets to list
+
+    Returns:
+        Frame time statistics (ms), frames over the 16.7 ms budget, command
+        drain time, widget counts and the costliest widget types and widgets
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+        return {"success": True, "data": canvas.get_metrics(frames, top)}
+    except Exception as e:
+        logger.error(f"Error getting canvas metrics: {e}")
+        return {"success": False, "error": str(e)}
+
+
 # Widget Management Tools
 
 
 @mcp.tool()
-def add_button(
+async def add_button(
     canvas_id: str,
     widget_id: str,
     label: str = "Button",
@@ -253,14 +422,14 @@ def add_button(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         # Ensure canvas is running
-        canvas_manager.ensure_canvas_running(canvas_id)
+        await _ensure_canvas_active(canvas_id)
 
         widget = canvas.widget_registry.factory.create(
             "button", widget_id, label=label, size=size
         )
         if position:
             widget.set_position(*position)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -269,7 +438,7 @@ def add_button(
 
 
 @mcp.tool()
-def add_text(
+async def add_text(
     canvas_id: str,
     widget_id: str,
     text: str = "",
@@ -297,14 +466,14 @@ def add_text(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         # Ensure canvas is running
-        _ensure_canvas_active(canvas_id)
+        await _ensure_canvas_active(canvas_id)
 
         widget = canvas.widget_registry.factory.create(
             "text", widget_id, text=text, color=color, wrapped=wrapped
         )
         if position:
             widget.set_position(*position)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -313,7 +482,7 @@ def add_text(
 
 
 @mcp.tool()
-def add_input_text(
+async def add_input_text(
     canvas_id: str,
     widget_id: str,
     label: str = "Input",
@@ -343,7 +512,7 @@ def add_input_text(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         # Ensure canvas is running
-        _ensure_canvas_active(canvas_id)
+        await _ensure_canvas_active(canvas_id)
 
         widget = canvas.widget_registry.factory.create(
             "input_text",
@@ -355,7 +524,7 @@ def add_input_text(
         )
         if position:
             widget.set_position(*position)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -364,7 +533,7 @@ def add_input_text(
 
 
 @mcp.tool()
-def add_checkbox(
+async def add_checkbox(
     canvas_id: str,
     widget_id: str,
     label: str = "Checkbox",
@@ -394,7 +563,7 @@ def add_checkbox(
         )
         if position:
             widget.set_position(*position)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -403,7 +572,7 @@ def add_checkbox(
 
 
 @mcp.tool()
-def add_slider_float(
+async def add_slider_float(
     canvas_id: str,
     widget_id: str,
     label: str = "Slider",
@@ -442,7 +611,7 @@ def add_slider_float(
         )
         if position:
             widget.set_position(*position)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -451,7 +620,7 @@ def add_slider_float(
 
 
 @mcp.tool()
-def add_slider_int(
+async def add_slider_int(
     canvas_id: str,
     widget_id: str,
     label: str = "Slider",
@@ -490,7 +659,7 @@ def add_slider_int(
         )
         if position:
             widget.set_position(*position)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -499,7 +668,7 @@ def add_slider_int(
 
 
 @mcp.tool()
-def add_color_picker(
+async def add_color_picker(
     canvas_id: str,
     widget_id: str,
     label: str = "Color",
@@ -530,7 +699,7 @@ def add_color_picker(
         )
         if position:
             widget.set_position(*position)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -538,6 +707,72 @@ def add_color_picker(
         return {"success": False, "error": str(e)}
 
 
+@mcp.tool()
+async def apply_widget_batch(
+    canvas_id: str, ops: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Create, update and delete many widgets in a single call.
+
+    Each op is a dict with an "op" key:
+        {"op": "create", "widget_type": "button", "widget_id": "b1",
+         "properties": {"label": "OK"}, "position": [x, y]}
+        {"op": "update", "widget_id": "b1", "properties": {"label": "Done"}}
+        {"op": "delete", "widget_id": "b1"}
+
+    The batch is validated as a whole; if any op is invalid nothing is applied.
+
+    Args:
+        canvas_id: Canvas identifier
+        ops: List of widget operations, applied in order
+
+    Returns:
+        Created, updated and deleted widget IDs and the new widget count
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        # Ensure canvas is running
+        await _ensure_canvas_active(canvas_id)
+
+        result = await canvas.apply_widget_batch_async(ops)
+        return {"success": True, "data": result}
+    except Exception as e:
+        logger.error(f"Error applying widget batch: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+async def set_widget_parent(
+    canvas_id: str, widget_id: str, parent_id: str | None = None
+) -> dict[str, Any]:
+    """
+    Move a widget inside a container widget (window, header, tree node, ...).
+
+    Children are only rendered while their container is open.
+
+    Args:
+        canvas_id: Canvas identifier
+        widget_id: Widget to move
+        parent_id: Container widget ID, or None to make the widget top-level
+
+    Returns:
+        Widget state dictionary
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        widget = await canvas.set_widget_parent_async(widget_id, parent_id)
+        return {"success": True, "data": widget.serialize()}
+    except Exception as e:
+        logger.error(f"Error setting widget parent: {e}")
+        return {"success": False, "error": str(e)}
+
+
 # Theme Management Tools
 
 
@@ -547,7 +782,8 @@ def apply_theme(theme_name: str) -> dict[str, Any]:
     Apply a theme to ImGui.
 
     Args:
-        theme_name: Theme name (dark, light, cherry, nord, dracula, gruvbox, solarized_dark, monokai, material)
+        theme_name: Theme name (dark, light, cherry, nord, dracula, gruvbox,
+            solarized_dark, monokai, material)
 
     Returns:
         Success status
@@ -622,7 +858,7 @@ def set_layout_spacing(spacing: float) -> dict[str, Any]:
 
 
 @mcp.tool()
-def add_window(
+async def add_window(
     canvas_id: str,
     widget_id: str,
     title: str = "Window",
@@ -650,7 +886,7 @@ def add_window(
         widget = WindowWidget(widget_id, title=title, closable=closable)
         if position:
             widget.set_position(*position)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -659,7 +895,7 @@ def add_window(
 
 
 @mcp.tool()
-def add_menu_bar(
+async def add_menu_bar(
     canvas_id: str,
     widget_id: str,
 ) -> dict[str, Any]:
@@ -679,7 +915,7 @@ def add_menu_bar(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = MenuBarWidget(widget_id)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -688,7 +924,7 @@ def add_menu_bar(
 
 
 @mcp.tool()
-def add_menu(
+async def add_menu(
     canvas_id: str,
     widget_id: str,
     label: str = "Menu",
@@ -712,7 +948,7 @@ def add_menu(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = MenuWidget(widget_id, label=label, enabled=enabled)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -721,7 +957,7 @@ def add_menu(
 
 
 @mcp.tool()
-def add_menu_item(
+async def add_menu_item(
     canvas_id: str,
     widget_id: str,
     label: str = "Item",
@@ -749,7 +985,7 @@ def add_menu_item(
         widget = MenuItemWidget(
             widget_id, label=label, shortcut=shortcut, selected=selected
         )
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -758,7 +994,7 @@ def add_menu_item(
 
 
 @mcp.tool()
-def add_separator(
+async def add_separator(
     canvas_id: str,
     widget_id: str,
     vertical: bool = False,
@@ -780,7 +1016,7 @@ def add_separator(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = SeparatorWidget(widget_id, vertical=vertical)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -789,7 +1025,7 @@ def add_separator(
 
 
 @mcp.tool()
-def add_collapsing_header(
+async def add_collapsing_header(
     canvas_id: str,
     widget_id: str,
     label: str = "Header",
@@ -815,7 +1051,7 @@ def add_collapsing_header(
         widget = CollapsingHeaderWidget(
             widget_id, label=label, default_open=default_open
         )
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -824,7 +1060,7 @@ def add_collapsing_header(
 
 
 @mcp.tool()
-def add_tree_node(
+async def add_tree_node(
     canvas_id: str,
     widget_id: str,
     label: str = "Node",
@@ -848,7 +1084,7 @@ def add_tree_node(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = TreeNodeWidget(widget_id, label=label, default_open=default_open)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -857,7 +1093,7 @@ def add_tree_node(
 
 
 @mcp.tool()
-def add_selectable(
+async def add_selectable(
     canvas_id: str,
     widget_id: str,
     label: str = "Selectable",
@@ -881,7 +1117,7 @@ def add_selectable(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = SelectableWidget(widget_id, label=label, selected=selected)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -890,7 +1126,7 @@ def add_selectable(
 
 
 @mcp.tool()
-def add_progress_bar(
+async def add_progress_bar(
     canvas_id: str,
     widget_id: str,
     fraction: float = 0.0,
@@ -914,7 +1150,7 @@ def add_progress_bar(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = DisplayProgressBarWidget(widget_id, fraction=fraction, overlay=overlay)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -923,7 +1159,7 @@ def add_progress_bar(
 
 
 @mcp.tool()
-def add_plot_lines(
+async def add_plot_lines(
     canvas_id: str,
     widget_id: str,
     label: str = "Plot",
@@ -947,7 +1183,7 @@ def add_plot_lines(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = PlotLinesWidget(widget_id, label=label, values=values or [])
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -956,7 +1192,7 @@ def add_plot_lines(
 
 
 @mcp.tool()
-def add_colored_text(
+async def add_colored_text(
     canvas_id: str,
     widget_id: str,
     text: str = "",
@@ -981,7 +1217,7 @@ def add_colored_text(
 
         color_tuple = tuple(color) if color else (1.0, 1.0, 1.0, 1.0)
         widget = TextColoredWidget(widget_id, text=text, color=color_tuple)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -990,7 +1226,7 @@ def add_colored_text(
 
 
 @mcp.tool()
-def add_bullet_text(
+async def add_bullet_text(
     canvas_id: str,
     widget_id: str,
     text: str = "",
@@ -1012,7 +1248,7 @@ def add_bullet_text(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = BulletTextWidget(widget_id, text=text)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -1021,7 +1257,7 @@ def add_bullet_text(
 
 
 @mcp.tool()
-def add_help_marker(
+async def add_help_marker(
     canvas_id: str,
     widget_id: str,
     text: str = "",
@@ -1045,7 +1281,7 @@ def add_help_marker(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = HelpMarkerWidget(widget_id, text=text, marker=marker)
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -1053,11 +1289,93 @@ def add_help_marker(
         return {"success": False, "error": str(e)}
 
 
+@mcp.tool()
+async def add_virtual_list(
+    canvas_id: str,
+    widget_id: str,
+    items: list[str] | None = None,
+    height: float = 300.0,
+    selectable: bool = False,
+    auto_scroll: bool = False,
+) -> dict[str, Any]:
+    """
+    Add a virtualized list for large item collections such as logs.
+
+    Only the rows inside the visible region are rendered each frame.
+
+    Args:
+        canvas_id: Canvas identifier
+        widget_id: Unique widget identifier
+        items: Initial list items
+        height: List height in pixels
+        selectable: Allow selecting rows
+        auto_scroll: Follow new items while scrolled to the bottom
+
+    Returns:
+        Widget ID and item count
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        widget = VirtualListWidget(
+            widget_id,
+            items=items or [],
+            height=height,
+            selectable=selectable,
+            auto_scroll=auto_scroll,
+        )
+        await canvas.add_widget_async(widget)
+
+        return {
+            "success": True,
+            "data": {"widget_id": widget_id, "item_count": len(items or [])},
+        }
+    except Exception as e:
+        logger.error(f"Error adding virtual list: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+async def append_list_items(
+    canvas_id: str, widget_id: str, items: list[str]
+) -> dict[str, Any]:
+    """
+    Append items to a virtual list widget.
+
+    Args:
+        canvas_id: Canvas identifier
+        widget_id: Virtual list widget identifier
+        items: Items to append
+
+    Returns:
+        New item count
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        widget = canvas.get_widget(widget_id)
+        if not isinstance(widget, VirtualListWidget):
+            return {"success": False, "error": f"Virtual list {widget_id} not found"}
+
+        await canvas.execute_command_async(lambda: widget.append_items(items))
+        return {
+            "success": True,
+            "data": {"item_count": len(widget.state.properties["items"])},
+        }
+    except Exception as e:
+        logger.error(f"Error appending list items: {e}")
+        return {"success": False, "error": str(e)}
+
+
 # Extension Tools - File Dialogs
 
 
 @mcp.tool()
-def add_file_dialog(
+async def add_file_dialog(
     canvas_id: str,
     widget_id: str,
     button_label: str = "Browse...",
@@ -1091,7 +1409,7 @@ def add_file_dialog(
             title=title,
             filters=filters or [],
         )
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -1307,6 +1625,41 @@ def set_data(path: str, value: Any) -> dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+@mcp.tool()
+def set_data_batch(updates: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Apply many data store writes as one transaction.
+
+    Each update is {"path": "user.name", "value": "Ada"}, or
+    {"path": "user.email", "delete": true} to remove a value. Listeners and
+    computed properties are notified once per affected path after all
+    updates are applied; if any update fails, none are kept.
+
+    Args:
+        updates: List of updates, applied in order
+
+    Returns:
+        Number of updates applied
+    """
+    try:
+        for index, update in enumerate(updates):
+            if not isinstance(update.get("path"), str) or not update["path"]:
+                raise ValueError(f"update {index}: missing path")
+            if not update.get("delete") and "value" not in update:
+                raise ValueError(f"update {index}: missing value")
+
+        with data_store.transaction():
+            for update in updates:
+                if update.get("delete"):
+                    data_store.delete(update["path"])
+                else:
+                    data_store.set(update["path"], update["value"])
+        return {"success": True, "data": {"count": len(updates)}}
+    except Exception as e:
+        logger.error(f"Error applying data batch: {e}")
+        return {"success": False, "error": str(e)}
+
+
 @mcp.tool()
 def get_data(path: str, default: Any = None) -> dict[str, Any]:
     """
@@ -1381,11 +1734,186 @@ def unbind_data(source_path: str, target_widget: str | None = None) -> dict[str,
         return {"success": False, "error": str(e)}
 
 
+# Event Subscription Tools
+
+# Longest a poll_canvas_events call may wait for events, in seconds
+_MAX_EVENT_WAIT = 60.0
+
+
+def _events_uri(subscription_id: str) -> str:
+    """Get the resource URI of a subscription's event queue."""
+    return f"champi://events/{subscription_id}"
+
+
+def _resource_notifier(
+    session: ServerSession, loop: asyncio.AbstractEventLoop, subscription_id: str
+) -> Callable[[], None]:
+    """Build a callback that tells a client session its events were updated.
+
+    The callback may run on any thread (usually a canvas render thread). If
+    the session can no longer be reached, the subscription is dropped.
+    """
+    uri = _events_uri(subscription_id)
+
+    def report(future: Future) -> None:
+        if future.exception() is not None:
+            logger.warning(f"Could not notify client of {uri}: {future.exception()}")
+            event_hub.unsubscribe(subscription_id)
+
+    def notify() -> None:
+        if loop.is_closed():
+            event_hub.unsubscribe(subscription_id)
+            return
+        asyncio.run_coroutine_threadsafe(
+            session.send_resource_updated(AnyUrl(uri)), loop
+        ).add_done_callback(report)
+
+    return notify
+
+
+@mcp.tool()
+async def subscribe_canvas_events(
+    canvas_id: str,
+    ctx: Context,
+    widget_ids: list[str] | None = None,
+    event_types: list[str] | None = None,
+    max_pending: int = 256,
+) -> dict[str, Any]:
+    """
+    Subscribe to widget interaction events on a canvas.
+
+    Button clicks (``click``) and values changed by user input in sliders,
+    inputs, checkboxes and the like (``change``) are queued per
+    subscription. Repeated clicks on a widget collapse into one event with a
+    ``count``, and repeated changes of a property into one event with the
+    latest ``value``. When ``max_pending`` events are queued, further events
+    are dropped and counted until the queue is drained.
+
+    When the queue goes from empty to non-empty, the server sends a
+    ``notifications/resources/updated`` for the returned ``uri``. Read that
+    resource, or call ``poll_canvas_events``, to take the events; either
+    one drains the queue. At most one notification is sent per drain.
+
+    The subscription ends when the canvas is removed or a notification can
+    no longer be delivered to this session.
+
+    Args:
+        canvas_id: Canvas identifier
+        ctx: MCP request context (provided by the server)
+        widget_ids: Only report these widgets (all if omitted)
+        event_types: Only report these event types ("click", "change")
+        max_pending: Maximum number of queued events
+
+    Returns:
+        Subscription ID and event resource URI
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        subscription = event_hub.subscribe(
+            canvas,
+            widget_ids,
+            event_types,
+            max_pending,
+            notify_factory=partial(
+                _resource_notifier, ctx.session, asyncio.get_running_loop()
+            ),
+        )
+        uri = _events_uri(subscription.subscription_id)
+        return {
+            "success": True,
+            "data": {
+                "subscription_id": subscription.subscription_id,
+                "uri": uri,
+                "event_types": sorted(subscription.event_types),
+            },
+        }
+    except Exception as e:
+        logger.error(f"Error subscribing to canvas events: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+async def poll_canvas_events(
+    subscription_id: str, max_events: int = 100, timeout: float = 0.0
+) -> dict[str, Any]:
+    """
+    Take queued events from a subscription.
+
+    With a ``timeout``, waits (up to 60 seconds) for the first event instead
+    of returning an empty list, so clients without resource notifications
+    can long-poll.
+
+    Args:
+        subscription_id: Subscription identifier
+        max_events: Maximum number of events to take
+        timeout: Seconds to wait for an event if none are queued
+
+    Returns:
+        Events (oldest first), number of events dropped since the last drain
+        and number still pending
+    """
+    try:
+        subscription = event_hub.get(subscription_id)
+        if not subscription:
+            return {
+                "success": False,
+                "error": f"Subscription {subscription_id} not found",
+            }
+        if timeout > 0:
+            await subscription.wait(min(timeout, _MAX_EVENT_WAIT))
+        return {"success": True, "data": subscription.drain(max_events)}
+    except Exception as e:
+        logger.error(f"Error polling canvas events: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+def unsubscribe_canvas_events(subscription_id: str) -> dict[str, Any]:
+    """
+    Remove an event subscription.
+
+    Args:
+        subscription_id: Subscription identifier
+
+    Returns:
+        Success status
+    """
+    try:
+        if not event_hub.unsubscribe(subscription_id):
+            return {
+                "success": False,
+                "error": f"Subscription {subscription_id} not found",
+            }
+        return {
+            "success": True,
+            "data": {"message": f"Removed subscription {subscription_id}"},
+        }
+    except Exception as e:
+        logger.error(f"Error removing event subscription: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.resource("champi://events/{subscription_id}", mime_type="application/json")
+def canvas_events(subscription_id: str) -> dict[str, Any]:
+    """Take all queued events from a subscription (as poll_canvas_events).
+
+    Reading this resource drains the queue: the events returned are not
+    returned again.
+    """
+    subscription = event_hub.get(subscription_id)
+    if not subscription:
+        raise ValueError(f"Subscription {subscription_id} not found")
+    return subscription.drain()
+
+
 # Plotting Tools
 
 
 @mcp.tool()
-def add_line_chart(
+async def add_line_chart(
     canvas_id: str,
     widget_id: str,
     title: str = "Line Chart",
@@ -1413,7 +1941,7 @@ def add_line_chart(
         widget = LineChartWidget(
             widget_id, title=title, x_data=x_data or [], y_data=y_data or []
         )
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -1422,7 +1950,7 @@ def add_line_chart(
 
 
 @mcp.tool()
-def add_bar_chart(
+async def add_bar_chart(
     canvas_id: str,
     widget_id: str,
     title: str = "Bar Chart",
@@ -1450,7 +1978,7 @@ def add_bar_chart(
         widget = BarChartWidget(
             widget_id, title=title, values=values or [], labels=labels or []
         )
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -1459,7 +1987,7 @@ def add_bar_chart(
 
 
 @mcp.tool()
-def add_scatter_plot(
+async def add_scatter_plot(
     canvas_id: str,
     widget_id: str,
     title: str = "Scatter Plot",
@@ -1487,7 +2015,7 @@ def add_scatter_plot(
         widget = ScatterPlotWidget(
             widget_id, title=title, x_data=x_data or [], y_data=y_data or []
         )
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -1496,7 +2024,7 @@ def add_scatter_plot(
 
 
 @mcp.tool()
-def add_pie_chart(
+async def add_pie_chart(
     canvas_id: str,
     widget_id: str,
     values: list[float] | None = None,
@@ -1520,7 +2048,7 @@ def add_pie_chart(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = PieChartWidget(widget_id, values=values or [], labels=labels or [])
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -1529,7 +2057,7 @@ def add_pie_chart(
 
 
 @mcp.tool()
-def add_heatmap(
+async def add_heatmap(
     canvas_id: str,
     widget_id: str,
     title: str = "Heatmap",
@@ -1553,7 +2081,7 @@ def add_heatmap(
             return {"success": False, "error": f"Canvas {canvas_id} not found"}
 
         widget = HeatmapWidget(widget_id, title=title, values=values or [])
-        canvas.add_widget(widget)
+        await canvas.add_widget_async(widget)
 
         return {"success": True, "data": widget.serialize()}
     except Exception as e:
@@ -1561,6 +2089,148 @@ def add_heatmap(
         return {"success": False, "error": str(e)}
 
 
+# Accepted packed array types for streamed plot data (little-endian)
+_PACKED_DTYPES: dict[str, np.dtype] = {
+    "float32": np.dtype("<f4"),
+    "float64": np.dtype("<f8"),
+}
+
+
+def _decode_plot_values(
+    values: Sequence[float] | str, encoding: str, dtype: str
+) -> np.ndarray:
+    """Decode plot values sent as a JSON list or a base64 packed array."""
+    if encoding == "json":
+        if isinstance(values, str):
+            raise ValueError("json values must be a list of numbers")
+        return as_plot_array(values)
+    if encoding != "base64":
+        raise ValueError(f"Unknown encoding: {encoding}")
+    if dtype not in _PACKED_DTYPES:
+        raise ValueError(f"Unknown dtype: {dtype}")
+    if not isinstance(values, str):
+        raise ValueError("base64 values must be a string")
+    # Reject malformed payloads instead of skipping invalid characters
+    packed = base64.b64decode(values, validate=True)
+    return np.frombuffer(packed, dtype=_PACKED_DTYPES[dtype])
+
+
+def _plot_widget(canvas: Canvas, widget_id: str) -> PlotWidget:
+    """Look up a plot widget, raising ValueError if it does not exist."""
+    widget = canvas.get_widget(widget_id)
+    if not isinstance(widget, PlotWidget):
+        raise ValueError(f"Plot {widget_id} not found")
+    return widget
+
+
+@mcp.tool()
+async def append_plot_data(
+    canvas_id: str,
+    widget_id: str,
+    y: list[float] | str,
+    x: list[float] | str | None = None,
+    encoding: str = "json",
+    dtype: str = "float64",
+) -> dict[str, Any]:
+    """
+    Append points to a plot's series without resending existing data.
+
+    Each plot widget holds one series, addressed by its widget ID. Line
+    charts and scatter plots take x and y; bar charts, histograms and
+    realtime plots take y only.
+
+    Args:
+        canvas_id: Canvas identifier
+        widget_id: Plot widget identifier
+        y: Y values to append
+        x: X values to append (line and scatter plots)
+        encoding: "json" for number lists, or "base64" for packed
+            little-endian arrays
+        dtype: Packed array type for base64 ("float32" or "float64")
+
+    Returns:
+        Number of points in the series
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        widget = _plot_widget(canvas, widget_id)
+        x_values, y_values = widget.coerce_append(
+            None if x is None else _decode_plot_values(x, encoding, dtype),
+            _decode_plot_values(y, encoding, dtype),
+        )
+        count = await canvas.execute_command_async(
+            lambda: widget.append_data(x_values, y_values)
+        )
+        return {"success": True, "data": {"point_count": count}}
+    except Exception as e:
+        logger.error(f"Error appending plot data: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+async def append_plot_data_batch(
+    canvas_id: str,
+    series: list[dict[str, Any]],
+    encoding: str = "json",
+    dtype: str = "float64",
+) -> dict[str, Any]:
+    """
+    Append points to several plot series in one call.
+
+    All entries are validated first and then applied together in a single
+    frame; if any entry is invalid nothing is appended.
+
+    Args:
+        canvas_id: Canvas identifier
+        series: Entries of the form {"widget_id": str, "y": values,
+            "x": values (optional)}
+        encoding: "json" for number lists, or "base64" for packed
+            little-endian arrays
+        dtype: Packed array type for base64 ("float32" or "float64")
+
+    Returns:
+        Number of points in each series, by widget ID
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        appends = []
+        for entry in series:
+            widget_id = entry.get("widget_id")
+            if not isinstance(widget_id, str) or "y" not in entry:
+                raise ValueError("Each series needs a widget_id and y values")
+            widget = _plot_widget(canvas, widget_id)
+            x = entry.get("x")
+            appends.append(
+                (
+                    widget,
+                    *widget.coerce_append(
+                        None if x is None else _decode_plot_values(x, encoding, dtype),
+                        _decode_plot_values(entry["y"], encoding, dtype),
+                    ),
+                )
+            )
+
+        def apply() -> dict[str, int]:
+            return {
+                widget.widget_id: widget.append_data(x_values, y_values)
+                for widget, x_values, y_values in appends
+            }
+
+        return {
+            "success": True,
+            "data": {"point_counts": await canvas.execute_command_async(apply)},
+        }
+    except Exception as e:
+        logger.error(f"Error appending plot data: {e}")
+        return {"success": False, "error": str(e)}
+
+
 # Serialization and Export Tools
 
 
@@ -1617,7 +2287,7 @@ def export_canvas_python(canvas_id: str, filepath: str) -> dict[str, Any]:
 
 
 @mcp.tool()
-def import_canvas_json(filepath: str) -> dict[str, Any]:
+async def import_canvas_json(filepath: str) -> dict[str, Any]:
     """
     Import canvas from JSON file.
 
@@ -1628,8 +2298,11 @@ def import_canvas_json(filepath: str) -> dict[str, Any]:
         Canvas data
     """
     try:
-        canvas = UIImporter.import_from_json(filepath, canvas_manager)
+        canvas = await asyncio.to_thread(
+            UIImporter.import_from_json, filepath, canvas_manager, auto_start=False
+        )
         if canvas:
+            await canvas_manager.start_canvas_async(canvas)
             return {"success": True, "data": canvas.serialize()}
         return {"success": False, "error": "Import failed"}
     except Exception as e:
@@ -1637,6 +2310,66 @@ def import_canvas_json(filepath: str) -> dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+@mcp.tool()
+def export_canvas_snapshot(canvas_id: str, filepath: str) -> dict[str, Any]:
+    """
+    Export canvas to a binary snapshot file.
+
+    Smaller and much faster than JSON for canvases with large plot data;
+    array properties are stored as raw little-endian blocks.
+
+    Args:
+        canvas_id: Canvas identifier
+        filepath: Output file path
+
+    Returns:
+        Success status
+    """
+    try:
+        canvas = canvas_manager.get_canvas(canvas_id)
+        if not canvas:
+            return {"success": False, "error": f"Canvas {canvas_id} not found"}
+
+        success = UIExporter.export_to_snapshot(canvas, filepath)
+        if success:
+            return {"success": True, "data": {"message": f"Exported to {filepath}"}}
+        return {"success": False, "error": "Export failed"}
+    except Exception as e:
+        logger.error(f"Error exporting canvas snapshot: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@mcp.tool()
+async def import_canvas_snapshot(filepath: str) -> dict[str, Any]:
+    """
+    Import canvas from a binary snapshot file.
+
+    Array data is copied rather than memory-mapped, so the file may be
+    changed or removed afterwards.
+
+    Args:
+        filepath: Input file path
+
+    Returns:
+        Canvas data
+    """
+    try:
+        canvas = await asyncio.to_thread(
+            UIImporter.import_from_snapshot,
+            filepath,
+            canvas_manager,
+            memory_map=False,
+            auto_start=False,
+        )
+        if canvas:
+            await canvas_manager.start_canvas_async(canvas)
+            return {"success": True, "data": canvas.serialize()}
+        return {"success": False, "error": "Import failed"}
+    except Exception as e:
+        logger.error(f"Error importing canvas snapshot: {e}")
+        return {"success": False, "error": str(e)}
+
+
 @mcp.tool()
 def get_canvas_json(canvas_id: str) -> dict[str, Any]:
     """
@@ -1762,7 +2495,7 @@ def save_template(name: str, canvas_id: str, description: str = "") -> dict[str,
 
 
 @mcp.tool()
-def load_template(name: str) -> dict[str, Any]:
+async def load_template(name: str) -> dict[str, Any]:
     """
     Load a template.
 
@@ -1773,8 +2506,11 @@ def load_template(name: str) -> dict[str, Any]:
         Canvas data
     """
     try:
-        canvas = template_manager.load_template(name, canvas_manager)
+        canvas = await asyncio.to_thread(
+            template_manager.load_template, name, canvas_manager, auto_start=False
+        )
         if canvas:
+            await canvas_manager.start_canvas_async(canvas)
             return {"success": True, "data": canvas.serialize()}
         return {"success": False, "error": f"Template not found: {name}"}
     except Exception as e:
@@ -10,6 +10,7 @@ from champi_gen_ui.widgets.basic import (
     ListBoxWidget,
     RadioButtonWidget,
     TextWidget,
+    VirtualListWidget,
 )
 
 # Container widgets
@@ -136,5 +137,6 @@ __all__ = [
     "TextWrappedWidget",
     "TooltipWidget",
     "TreeNodeWidget",
+    "VirtualListWidget",
     "WindowWidget",
 ]
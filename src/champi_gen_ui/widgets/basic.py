@@ -1,5 +1,7 @@
 """Basic widgets: buttons, text, inputs, checkboxes."""
 
+from typing import Any
+
 from imgui_bundle import imgui
 
 from champi_gen_ui.core.widget import Widget
@@ -57,6 +59,8 @@ class TextWidget(Widget):
 class InputTextWidget(Widget):
     """Text input widget."""
 
+    _mirrored_properties = {"value": "_value"}
+
     def __init__(self, widget_id: str, label: str = "Input", value: str = "", **props):
         """Initialize input text widget."""
         props["label"] = label
@@ -81,7 +85,7 @@ class InputTextWidget(Widget):
             changed, self._value = imgui.input_text(label, self._value)
 
         if changed:
-            self.state.properties["value"] = self._value
+            self._set_edited("value", self._value)
             self.trigger_callback("on_change", self._value)
 
         return self._value
@@ -99,6 +103,8 @@ class InputTextWidget(Widget):
 class CheckboxWidget(Widget):
     """Checkbox widget."""
 
+    _mirrored_properties = {"checked": "_checked"}
+
     def __init__(
         self, widget_id: str, label: str = "Checkbox", checked: bool = False, **props
     ):
@@ -114,7 +120,7 @@ class CheckboxWidget(Widget):
         changed, self._checked = imgui.checkbox(label, self._checked)
 
         if changed:
-            self.state.properties["checked"] = self._checked
+            self._set_edited("checked", self._checked)
             self.trigger_callback("on_change", self._checked)
 
         return self._checked
@@ -132,6 +138,8 @@ class CheckboxWidget(Widget):
 class RadioButtonWidget(Widget):
     """Radio button widget."""
 
+    _mirrored_properties = {"active": "_active"}
+
     def __init__(
         self, widget_id: str, label: str = "Radio", active: bool = False, **props
     ):
@@ -148,7 +156,7 @@ class RadioButtonWidget(Widget):
 
         if clicked:
             self._active = not self._active
-            self.state.properties["active"] = self._active
+            self._set_edited("active", self._active)
             self.trigger_callback("on_click", self._active)
 
         return clicked
@@ -157,6 +165,8 @@ class RadioButtonWidget(Widget):
 class ComboWidget(Widget):
     """Combo box (dropdown) widget."""
 
+    _mirrored_properties = {"current_item": "_current_item"}
+
     def __init__(
         self,
         widget_id: str,
@@ -183,7 +193,7 @@ class ComboWidget(Widget):
         changed, self._current_item = imgui.combo(label, self._current_item, items)
 
         if changed:
-            self.state.properties["current_item"] = self._current_item
+            self._set_edited("current_item", self._current_item)
             self.trigger_callback(
                 "on_change", self._current_item, items[self._current_item]
             )
@@ -205,6 +215,8 @@ class ComboWidget(Widget):
 class ListBoxWidget(Widget):
     """List box widget."""
 
+    _mirrored_properties = {"current_item": "_current_item"}
+
     def __init__(
         self,
         widget_id: str,
@@ -221,7 +233,7 @@ class ListBoxWidget(Widget):
         self._current_item = current_item
 
     def render(self) -> int:
-        """Render the list box."""
+        """Render the list box, issuing ImGui calls only for visible rows."""
         label = self.state.properties.get("label", "ListBox")
         items = self.state.properties.get("items", [])
         height_in_items = self.state.properties.get("height_in_items", -1)
@@ -229,12 +241,107 @@ class ListBoxWidget(Widget):
         if not items:
             return self._current_item
 
-        changed, self._current_item = imgui.list_box(
-            label, self._current_item, items, height_in_items
+        if height_in_items < 0:
+            height_in_items = min(len(items), 7) + 0.25
+        height = (
+            imgui.get_text_line_height_with_spacing() * height_in_items
+            + imgui.get_style().frame_padding.y * 2
         )
 
+        changed = False
+        if imgui.begin_list_box(label, imgui.ImVec2(0, height)):
+            clipper = imgui.ListClipper()
+            clipper.begin(len(items))
+            while clipper.step():
+                for i in range(clipper.display_start, clipper.display_end):
+                    imgui.push_id(i)
+                    if imgui.selectable(str(items[i]), i == self._current_item)[0]:
+                        self._current_item = i
+                        changed = True
+                    imgui.pop_id()
+            clipper.end()
+            imgui.end_list_box()
+
         if changed:
-            self.state.properties["current_item"] = self._current_item
+            self._set_edited("current_item", self._current_item)
+            self.trigger_callback(
+                "on_change", self._current_item, items[self._current_item]
+            )
+
+        return self._current_item
+
+
+class VirtualListWidget(Widget):
+    """Scrolling list for very large item collections (logs, tables).
+
+    Only rows inside the visible scroll region issue ImGui calls, so the
+    per-frame cost depends on the region height rather than the item count.
+    """
+
+    _mirrored_properties = {"current_item": "_current_item"}
+
+    def __init__(
+        self,
+        widget_id: str,
+        items: list[str] | None = None,
+        height: float = 300.0,
+        selectable: bool = False,
+        auto_scroll: bool = False,
+        **props,
+    ):
+        """Initialize virtual list."""
+        props["items"] = items or []
+        props["height"] = height
+        props["selectable"] = selectable
+        props["auto_scroll"] = auto_scroll
+        props["current_item"] = props.get("current_item", -1)
+        super().__init__(widget_id, **props)
+        self._current_item: int = props["current_item"]
+        self._own_items: list[str] | None = None
+
+    def append_items(self, items: list[str]) -> None:
+        """Append items to the end of the list."""
+        current = self.state.properties["items"]
+        # The list may be shared with the caller or held by the change log
+        # since update(); copy it once before extending it in place
+        if current is not self._own_items:
+            current = self.state.properties["items"] = list(current)
+            self._own_items = current
+        current.extend(items)
+        self._record_change("extend", ("properties", "items"), list(items))
+
+    def render(self) -> int:
+        """Render the visible rows of the list."""
+        items = self.state.properties.get("items", [])
+        height = self.state.properties.get("height", 300.0)
+        selectable = self.state.properties.get("selectable", False)
+        auto_scroll = self.state.properties.get("auto_scroll", False)
+
+        changed = False
+        if imgui.begin_child(
+            self.widget_id, imgui.ImVec2(0, height), imgui.ChildFlags_.borders.value
+        ):
+            clipper = imgui.ListClipper()
+            clipper.begin(len(items))
+            while clipper.step():
+                for i in range(clipper.display_start, clipper.display_end):
+                    if not selectable:
+                        imgui.text_unformatted(str(items[i]))
+                        continue
+                    imgui.push_id(i)
+                    if imgui.selectable(str(items[i]), i == self._current_item)[0]:
+                        self._current_item = i
+                        changed = True
+                    imgui.pop_id()
+            clipper.end()
+
+            # Keep following new items while scrolled to the bottom
+            if auto_scroll and imgui.get_scroll_y() >= imgui.get_scroll_max_y():
+                imgui.set_scroll_here_y(1.0)
+        imgui.end_child()
+
+        if changed:
+            self._set_edited("current_item", self._current_item)
             self.trigger_callback(
                 "on_change", self._current_item, items[self._current_item]
             )
@@ -271,7 +378,7 @@ class ColorPickerWidget(Widget):
                 self._color = [*list(color3), self._color[3]]
 
         if changed:
-            self.state.properties["color"] = tuple(self._color)
+            self._set_edited("color", tuple(self._color))
             self.trigger_callback("on_change", tuple(self._color))
 
         return tuple(self._color)
@@ -279,3 +386,15 @@ class ColorPickerWidget(Widget):
     def get_color(self) -> tuple:
         """Get current color."""
         return tuple(self._color)
+
+    def coerce_update(self, props: dict[str, Any]) -> dict[str, Any]:
+        """Validate and convert properties for ``update`` (``color`` to a tuple)."""
+        if "color" in props:
+            props = {**props, "color": tuple(props["color"])}
+        return props
+
+    def update(self, **props) -> None:
+        """Update widget properties."""
+        super().update(**props)
+        if "color" in props:
+            self._color = list(props["color"])
@@ -22,7 +22,7 @@ class WindowWidget(Widget):
         super().__init__(widget_id, **props)
 
     def render(self) -> bool:
-        """Render the window."""
+        """Render the window and, while expanded, its children."""
         title = self.state.properties.get("title", "Window")
         closable = self.state.properties.get("closable", True)
         flags = self.state.properties.get("flags", 0)
@@ -38,9 +38,7 @@ class WindowWidget(Widget):
             expanded, _ = imgui.begin(title, None, flags)
 
         if expanded:
-            # Render children widgets here
-            # This would be handled by the canvas
-            pass
+            self.render_children()
 
         imgui.end()
         return is_open
@@ -62,7 +60,7 @@ class ChildWindowWidget(Widget):
         super().__init__(widget_id, **props)
 
     def render(self) -> bool:
-        """Render the child window."""
+        """Render the child window and its children."""
         size = self.state.properties.get("size", (0, 0))
         border = self.state.properties.get("border", False)
         flags = self.state.properties.get("flags", 0)
@@ -70,8 +68,7 @@ class ChildWindowWidget(Widget):
         result = imgui.begin_child(self.widget_id, imgui.ImVec2(*size), border, flags)
 
         if result:
-            # Render children widgets here
-            pass
+            self.render_children()
 
         imgui.end_child()
         return result
@@ -85,10 +82,9 @@ class GroupWidget(Widget):
         super().__init__(widget_id, **props)
 
     def render(self) -> None:
-        """Render the group."""
+        """Render the group and its children."""
         imgui.begin_group()
-        # Children would be rendered here by canvas
-        # The canvas will handle rendering child widgets
+        self.render_children()
         imgui.end_group()
 
 
@@ -105,18 +101,22 @@ class CollapsingHeaderWidget(Widget):
         """Initialize collapsing header."""
         props["label"] = label
         props["is_open"] = default_open
+        props["default_open"] = default_open
         super().__init__(widget_id, **props)
 
     def render(self) -> bool:
-        """Render the collapsing header."""
+        """Render the collapsing header and, while open, its children."""
         label = self.state.properties.get("label", "Header")
         flags = self.state.properties.get("flags", 0)
+        if self.state.properties.get("default_open", False):
+            flags |= imgui.TreeNodeFlags_.default_open.value
 
         is_open = imgui.collapsing_header(label, flags)
         self.state.properties["is_open"] = is_open
 
         if is_open:
             self.trigger_callback("on_open")
+            self.render_children()
 
         return is_open
 
@@ -134,7 +134,7 @@ class TabBarWidget(Widget):
         flags = self.state.properties.get("flags", 0)
 
         if imgui.begin_tab_bar(self.widget_id, flags):
-            # Tab items would be rendered here
+            self.render_children()
             active_tab = self.state.properties.get("active_tab")
             imgui.end_tab_bar()
             return active_tab
@@ -174,7 +174,7 @@ class TabItemWidget(Widget):
             selected, _ = imgui.begin_tab_item(label, None, flags)
 
         if selected:
-            # Tab content would be rendered here
+            self.render_children()
             imgui.end_tab_item()
             self.trigger_callback("on_select")
 
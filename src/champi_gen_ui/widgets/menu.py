@@ -13,8 +13,12 @@ class MenuBarWidget(Widget):
         super().__init__(widget_id, **props)
 
     def render(self) -> bool:
-        """Render the menu bar."""
-        return imgui.begin_main_menu_bar()
+        """Render the menu bar and its menus."""
+        is_open = imgui.begin_main_menu_bar()
+        if is_open:
+            self.render_children()
+            self.end_render()
+        return is_open
 
     def end_render(self) -> None:
         """End menu bar rendering."""
@@ -37,11 +41,15 @@ class MenuWidget(Widget):
         super().__init__(widget_id, **props)
 
     def render(self) -> bool:
-        """Render the menu."""
+        """Render the menu and, while open, its items."""
         label = self.state.properties.get("label", "Menu")
         enabled = self.state.properties.get("enabled", True)
 
-        return imgui.begin_menu(label, enabled)
+        is_open = imgui.begin_menu(label, enabled)
+        if is_open:
+            self.render_children()
+            self.end_render()
+        return is_open
 
     def end_render(self) -> None:
         """End menu rendering."""
@@ -96,18 +104,23 @@ class TreeNodeWidget(Widget):
         """Initialize tree node."""
         props["label"] = label
         props["is_open"] = default_open
+        props["default_open"] = default_open
         super().__init__(widget_id, **props)
 
     def render(self) -> bool:
-        """Render the tree node."""
+        """Render the tree node and, while open, its children."""
         label = self.state.properties.get("label", "Node")
         flags = self.state.properties.get("flags", 0)
+        if self.state.properties.get("default_open", False):
+            flags |= imgui.TreeNodeFlags_.default_open.value
 
         is_open = imgui.tree_node_ex(label, flags)
         self.state.properties["is_open"] = is_open
 
         if is_open:
             self.trigger_callback("on_open")
+            self.render_children()
+            self.end_render()
 
         return is_open
 
@@ -186,7 +199,7 @@ class PopupWidget(Widget):
         imgui.open_popup(self.widget_id)
 
     def render(self) -> bool:
-        """Render the popup."""
+        """Render the popup and, while open, its content."""
         title = self.state.properties.get("title", "Popup")
         modal = self.state.properties.get("modal", False)
         flags = self.state.properties.get("flags", 0)
@@ -198,7 +211,7 @@ class PopupWidget(Widget):
             is_open = imgui.begin_popup(self.widget_id, flags)
 
         if is_open:
-            # Popup content would be rendered here
+            self.render_children()
             imgui.end_popup()
 
         return is_open
@@ -217,9 +230,13 @@ class ContextMenuWidget(Widget):
         super().__init__(widget_id, **props)
 
     def render(self) -> bool:
-        """Render the context menu."""
+        """Render the context menu and, while open, its items."""
         popup_flags = self.state.properties.get("popup_flags", 1)
-        return imgui.begin_popup_context_item(self.widget_id, popup_flags)
+        is_open = imgui.begin_popup_context_item(self.widget_id, popup_flags)
+        if is_open:
+            self.render_children()
+            self.end_render()
+        return is_open
 
     def end_render(self) -> None:
         """End context menu rendering."""
@@ -1,12 +1,156 @@
 """Advanced plotting widgets using ImPlot."""
 
-from imgui_bundle import imgui, implot
+from typing import Any, ClassVar
 
+import numpy as np
+from imgui_bundle import imgui, implot
+from numpy.typing import ArrayLike
+
+from champi_gen_ui.core.lod import (
+    LOD_MIN_POINTS,
+    MinMaxPyramid,
+    data_bounds,
+    decimate_scatter,
+    is_sorted,
+)
 from champi_gen_ui.core.widget import Widget
 
 
+def as_plot_array(values: ArrayLike | None, ndim: int = 1) -> np.ndarray:
+    """Convert plot data to a C-contiguous float32/float64 array.
+
+    Float arrays that are already contiguous are used as is (no copy); other
+    inputs are converted to float64.
+
+    Args:
+        values: Sequence or array of numbers (None for empty)
+        ndim: Required number of dimensions
+
+    Returns:
+        Array ImPlot can read directly
+
+    Raises:
+        ValueError: If the data has the wrong number of dimensions
+    """
+    if values is None:
+        return np.empty((0,) * ndim, dtype=np.float64)
+    array = np.asarray(values)
+    if array.dtype not in (np.float32, np.float64):
+        array = array.astype(np.float64)
+    if array.size == 0:
+        array = array.reshape((0,) * ndim)
+    if array.ndim != ndim:
+        raise ValueError(f"Expected {ndim}D plot data, got {array.ndim}D")
+    return np.ascontiguousarray(array)
+
+
+def _matching(*arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Give arrays one dtype, as ImPlot requires (copies only on mismatch)."""
+    if all(array.dtype == arrays[0].dtype for array in arrays):
+        return arrays
+    return tuple(array.astype(np.float64, copy=False) for array in arrays)
+
+
+def _visible_area() -> tuple[tuple[float, float, float, float], tuple[int, int]]:
+    """Get the current plot's visible (x_min, x_max, y_min, y_max) and size."""
+    limits = implot.get_plot_limits()
+    size = implot.get_plot_size()
+    return (
+        (limits.x.min, limits.x.max, limits.y.min, limits.y.max),
+        (int(size.x), int(size.y)),
+    )
+
+
+class _SeriesLod:
+    """Level-of-detail state for one x/y series.
+
+    Decimated points are recomputed only when the visible range or plot size
+    changes. On frames where ImPlot fits the axes, the whole series is
+    selected so the fit covers all of the data.
+    """
+
+    __slots__ = ("bounds", "key", "pyramid", "sorted", "view", "xs", "ys")
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray):
+        """Initialize for a series."""
+        self.xs, self.ys = _matching(xs, ys)
+        self.sorted = is_sorted(self.xs)
+        self.bounds = data_bounds(self.xs, self.ys)
+        self.pyramid: MinMaxPyramid | None = None
+        self.key: Any = None
+        self.view = (self.xs, self.ys)
+
+    def extend(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Update for points appended to the series."""
+        previous = self.xs.size
+        self.xs, self.ys = _matching(xs, ys)
+        if previous == self.xs.size:
+            return
+        new_bounds = data_bounds(self.xs[previous:], self.ys[previous:])
+        self.bounds = (
+            min(self.bounds[0], new_bounds[0]),
+            max(self.bounds[1], new_bounds[1]),
+            min(self.bounds[2], new_bounds[2]),
+            max(self.bounds[3], new_bounds[3]),
+        )
+        self.sorted = self.sorted and is_sorted(self.xs[max(previous - 1, 0) :])
+        if self.pyramid is not None:
+            if self.sorted:
+                self.pyramid.extend(self.xs, self.ys)
+            else:
+                self.pyramid = None
+        self.key = None
+
+    def _area(self) -> tuple[tuple[float, float, float, float], tuple[int, int]]:
+        """Get the area to decimate for (the data bounds when fitting)."""
+        bounds, size = _visible_area()
+        if implot.internal.fit_this_frame():
+            bounds = self.bounds
+        return bounds, size
+
+    def line(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get min/max decimated points for a line (needs sorted x)."""
+        if not self.sorted:
+            return self.xs, self.ys
+        (x_min, x_max, _, _), (width, _) = self._area()
+        key = (x_min, x_max, width)
+        if key != self.key:
+            if self.pyramid is None:
+                self.pyramid = MinMaxPyramid(self.xs, self.ys)
+            self.view = self.pyramid.select(x_min, x_max, width)
+            self.key = key
+        return self.view
+
+    def scatter(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get one point per occupied pixel for a scatter plot."""
+        key = self._area()
+        if key != self.key:
+            self.view = decimate_scatter(self.xs, self.ys, *key, self.sorted)
+            self.key = key
+        return self.view
+
+
+def _convert_array_properties(props: dict[str, Any], names: dict[str, int]) -> None:
+    """Convert the named properties in place (name -> ndim)."""
+    for name, ndim in names.items():
+        if name in props:
+            props[name] = as_plot_array(props[name], ndim)
+
+
 class PlotWidget(Widget):
-    """Base plot widget using ImPlot."""
+    """Base plot widget using ImPlot.
+
+    Numeric series listed in ``_array_properties`` are converted once, when
+    set, to contiguous float arrays that are handed to ImPlot without copying.
+    Widgets that name an x/y pair in ``_append_properties`` also accept
+    incremental appends through ``append_data``.
+    """
+
+    # Property name -> number of dimensions of its array
+    _array_properties: ClassVar[dict[str, int]] = {}
+
+    # (x property or None for y-only series, y property) extended by appends
+    _append_properties: ClassVar[tuple[str | None, str] | None] = None
 
     def __init__(
         self,
@@ -21,8 +165,109 @@ class PlotWidget(Widget):
         props["x_label"] = props.get("x_label", "X")
         props["y_label"] = props.get("y_label", "Y")
         props["legend"] = props.get("legend", True)
+        _convert_array_properties(props, self._array_properties)
+        self._append_buffers: dict[str, np.ndarray] = {}
         super().__init__(widget_id, **props)
 
+    def coerce_update(self, props: dict[str, Any]) -> dict[str, Any]:
+        """Validate and convert properties for ``update`` (arrays to plot arrays)."""
+        props = dict(props)
+        _convert_array_properties(props, self._array_properties)
+        return props
+
+    def update(self, **props) -> None:
+        """Update widget properties."""
+        super().update(**props)
+        if not props.keys().isdisjoint(self._array_properties) or "lod" in props:
+            self._data_changed()
+
+    def _data_changed(self) -> None:
+        """Drop anything derived from the array properties."""
+
+    def _data_appended(self) -> None:
+        """Bring anything derived from the array properties up to date."""
+        self._data_changed()
+
+    def coerce_append(
+        self, x: ArrayLike | None, y: ArrayLike
+    ) -> tuple[np.ndarray | None, np.ndarray]:
+        """Validate and convert points for ``append_data``.
+
+        Args:
+            x: X values (None for y-only series)
+            y: Y values
+
+        Returns:
+            (x, y) as plot arrays
+
+        Raises:
+            ValueError: If the widget takes no appends or the points do not fit
+        """
+        x_name, _ = self._append_names()
+        y = as_plot_array(y)
+        if x_name is None:
+            if x is not None:
+                raise ValueError(f"{type(self).__name__} takes y values only")
+            return None, y
+        if x is None:
+            raise ValueError("x values are required")
+        x = as_plot_array(x)
+        if x.size != y.size:
+            raise ValueError(f"Got {x.size} x values and {y.size} y values")
+        return x, y
+
+    def _append_names(self) -> tuple[str | None, str]:
+        """Return the (x, y) property names appends extend.
+
+        Raises:
+            ValueError: If the widget takes no appends
+        """
+        if self._append_properties is None:
+            raise ValueError(f"{type(self).__name__} does not support appending")
+        return self._append_properties
+
+    def append_data(self, x: ArrayLike | None = None, y: ArrayLike = ()) -> int:
+        """Append points to the end of the plotted series.
+
+        The series properties become views of buffers that grow
+        geometrically, so an append costs O(new points), amortized.
+
+        Args:
+            x: X values (None for y-only series)
+            y: Y values
+
+        Returns:
+            Number of points in the series
+
+        Raises:
+            ValueError: If the widget takes no appends or the points do not fit
+        """
+        x, y = self.coerce_append(x, y)
+        x_name, y_name = self._append_names()
+        if x_name is not None and x is not None:
+            self._extend_property(x_name, x)
+        count = self._extend_property(y_name, y)
+        self._data_appended()
+        return count
+
+    def _extend_property(self, name: str, values: np.ndarray) -> int:
+        """Append values to an array property, growing its buffer as needed."""
+        current: np.ndarray = self.state.properties[name]
+        buffer = self._append_buffers.get(name)
+        size = current.size + values.size
+        # The property may have been replaced by update() since the last append
+        if buffer is None or current.base is not buffer or size > buffer.size:
+            buffer = np.empty(max(2 * size, 1024), dtype=current.dtype)
+            buffer[: current.size] = current
+            self._append_buffers[name] = buffer
+        buffer[current.size : size] = values
+        self.state.properties[name] = buffer[:size]
+        # Copied so the log does not keep the whole append buffer alive
+        self._record_change(
+            "extend", ("properties", name), buffer[current.size : size].copy()
+        )
+        return size
+
     def begin_plot(self) -> bool:
         """Begin plot rendering."""
         title = self.state.properties.get("title", "Plot")
@@ -46,33 +291,60 @@ class PlotWidget(Widget):
 
 
 class LineChartWidget(PlotWidget):
-    """Line chart widget."""
+    """Line chart widget.
+
+    With ``lod`` enabled (the default), series longer than ``LOD_MIN_POINTS``
+    and sorted x are drawn from a min/max pyramid, at a few points per pixel
+    column.
+    """
+
+    _array_properties = {"x_data": 1, "y_data": 1}
+    _append_properties = ("x_data", "y_data")
 
     def __init__(
         self,
         widget_id: str,
         title: str = "Line Chart",
-        x_data: list[float] | None = None,
-        y_data: list[float] | None = None,
+        x_data: ArrayLike | None = None,
+        y_data: ArrayLike | None = None,
         **props,
     ):
         """Initialize line chart."""
-        props["x_data"] = x_data or []
-        props["y_data"] = y_data or []
+        props["x_data"] = x_data
+        props["y_data"] = y_data
         props["line_label"] = props.get("line_label", "Line")
+        props["lod"] = props.get("lod", True)
+        self._lod: _SeriesLod | None = None
         super().__init__(widget_id, title, **props)
 
+    def _data_changed(self) -> None:
+        """Drop the LOD pyramid."""
+        self._lod = None
+
+    def _data_appended(self) -> None:
+        """Extend the LOD pyramid with the appended points."""
+        if self._lod is not None:
+            props = self.state.properties
+            self._lod.extend(props["x_data"], props["y_data"])
+
     def render(self) -> None:
         """Render line chart."""
         if self.begin_plot():
             self.setup_axes()
 
-            x_data = self.state.properties.get("x_data", [])
-            y_data = self.state.properties.get("y_data", [])
+            x_data = self.state.properties["x_data"]
+            y_data = self.state.properties["y_data"]
             line_label = self.state.properties.get("line_label", "Line")
 
-            if x_data and y_data and len(x_data) == len(y_data):
-                implot.plot_line(line_label, x_data, y_data)
+            if x_data.size and x_data.size == y_data.size:
+                if self.state.properties.get("lod") and x_data.size > LOD_MIN_POINTS:
+                    if self._lod is None:
+                        self._lod = _SeriesLod(x_data, y_data)
+                    xs, ys = self._lod.line()
+                    implot.plot_line(line_label, xs, ys)
+                else:
+                    xs, ys = _matching(x_data, y_data)
+                    implot.plot_line(line_label, xs, ys)
 
             self.end_plot()
 
@@ -80,16 +352,19 @@ class LineChartWidget(PlotWidget):
 class BarChartWidget(PlotWidget):
     """Bar chart widget."""
 
+    _array_properties = {"values": 1}
+    _append_properties = (None, "values")
+
     def __init__(
         self,
         widget_id: str,
         title: str = "Bar Chart",
-        values: list[float] | None = None,
+        values: ArrayLike | None = None,
         labels: list[str] | None = None,
         **props,
     ):
         """Initialize bar chart."""
-        props["values"] = values or []
+        props["values"] = values
         props["labels"] = labels or []
         props["bar_label"] = props.get("bar_label", "Bars")
         props["bar_width"] = props.get("bar_width", 0.67)
@@ -100,44 +375,70 @@ class BarChartWidget(PlotWidget):
         if self.begin_plot():
             self.setup_axes()
 
-            values = self.state.properties.get("values", [])
+            values = self.state.properties["values"]
             bar_label = self.state.properties.get("bar_label", "Bars")
             bar_width = self.state.properties.get("bar_width", 0.67)
 
-            if values:
+            if values.size:
                 implot.plot_bars(bar_label, values, bar_width)
 
             self.end_plot()
 
 
 class ScatterPlotWidget(PlotWidget):
-    """Scatter plot widget."""
+    """Scatter plot widget.
+
+    With ``lod`` enabled (the default), series longer than ``LOD_MIN_POINTS``
+    are reduced to one point per occupied pixel of the visible area.
+    """
+
+    _array_properties = {"x_data": 1, "y_data": 1}
+    _append_properties = ("x_data", "y_data")
 
     def __init__(
         self,
         widget_id: str,
         title: str = "Scatter Plot",
-        x_data: list[float] | None = None,
-        y_data: list[float] | None = None,
+        x_data: ArrayLike | None = None,
+        y_data: ArrayLike | None = None,
         **props,
     ):
         """Initialize scatter plot."""
-        props["x_data"] = x_data or []
-        props["y_data"] = y_data or []
+        props["x_data"] = x_data
+        props["y_data"] = y_data
         props["scatter_label"] = props.get("scatter_label", "Points")
+        props["lod"] = props.get("lod", True)
+        self._lod: _SeriesLod | None = None
         super().__init__(widget_id, title, **props)
 
+    def _data_changed(self) -> None:
+        """Drop the cached decimation."""
+        self._lod = None
+
+    def _data_appended(self) -> None:
+        """Extend the decimation state with the appended points."""
+        if self._lod is not None:
+            props = self.state.properties
+            self._lod.extend(props["x_data"], props["y_data"])
+
     def render(self) -> None:
         """Render scatter plot."""
         if self.begin_plot():
             self.setup_axes()
 
-            x_data = self.state.properties.get("x_data", [])
-            y_data = self.state.properties.get("y_data", [])
+            x_data = self.state.properties["x_data"]
+            y_data = self.state.properties["y_data"]
             scatter_label = self.state.properties.get("scatter_label", "Points")
 
-            if x_data and y_data and len(x_data) == len(y_data):
-                implot.plot_scatter(scatter_label, x_data, y_data)
+            if x_data.size and x_data.size == y_data.size:
+                if self.state.properties.get("lod") and x_data.size > LOD_MIN_POINTS:
+                    if self._lod is None:
+                        self._lod = _SeriesLod(x_data, y_data)
+                    xs, ys = self._lod.scatter()
+                    implot.plot_scatter(scatter_label, xs, ys)
+                else:
+                    xs, ys = _matching(x_data, y_data)
+                    implot.plot_scatter(scatter_label, xs, ys)
 
             self.end_plot()
 
@@ -145,16 +446,19 @@ class ScatterPlotWidget(PlotWidget):
 class HistogramWidget(PlotWidget):
     """Histogram widget."""
 
+    _array_properties = {"values": 1}
+    _append_properties = (None, "values")
+
     def __init__(
         self,
         widget_id: str,
         title: str = "Histogram",
-        values: list[float] | None = None,
+        values: ArrayLike | None = None,
         bins: int = 10,
         **props,
     ):
         """Initialize histogram."""
-        props["values"] = values or []
+        props["values"] = values
         props["bins"] = bins
         props["histogram_label"] = props.get("histogram_label", "Distribution")
         super().__init__(widget_id, title, **props)
@@ -164,30 +468,32 @@ class HistogramWidget(PlotWidget):
         if self.begin_plot():
             self.setup_axes()
 
-            values = self.state.properties.get("values", [])
+            values = self.state.properties["values"]
             bins = self.state.properties.get("bins", 10)
             histogram_label = self.state.properties.get(
                 "histogram_label", "Distribution"
             )
 
-            if values:
+            if values.size:
                 implot.plot_histogram(histogram_label, values, bins)
 
             self.end_plot()
 
 
 class HeatmapWidget(PlotWidget):
-    """Heatmap widget."""
+    """Heatmap widget (values is a rows x cols matrix)."""
+
+    _array_properties = {"values": 2}
 
     def __init__(
         self,
         widget_id: str,
         title: str = "Heatmap",
-        values: list[list[float]] | None = None,
+        values: ArrayLike | None = None,
         **props,
     ):
         """Initialize heatmap."""
-        props["values"] = values or []
+        props["values"] = values
         props["heatmap_label"] = props.get("heatmap_label", "Heatmap")
         props["scale_min"] = props.get("scale_min", 0.0)
         props["scale_max"] = props.get("scale_max", 1.0)
@@ -198,26 +504,13 @@ class HeatmapWidget(PlotWidget):
         if self.begin_plot():
             self.setup_axes()
 
-            values = self.state.properties.get("values", [])
+            values = self.state.properties["values"]
             heatmap_label = self.state.properties.get("heatmap_label", "Heatmap")
             scale_min = self.state.properties.get("scale_min", 0.0)
             scale_max = self.state.properties.get("scale_max", 1.0)
 
-            if values and len(values) > 0:
-                rows = len(values)
-                cols = len(values[0]) if values else 0
-
-                if rows > 0 and cols > 0:
-                    # Flatten 2D array for ImPlot
-                    flat_values = [val for row in values for val in row]
-                    implot.plot_heatmap(
-                        heatmap_label,
-                        flat_values,
-                        rows,
-                        cols,
-                        scale_min,
-                        scale_max,
-                    )
+            if values.size:
+                implot.plot_heatmap(heatmap_label, values, scale_min, scale_max)
 
             self.end_plot()
 
@@ -225,32 +518,40 @@ class HeatmapWidget(PlotWidget):
 class PieChartWidget(Widget):
     """Pie chart widget."""
 
+    _array_properties: ClassVar[dict[str, int]] = {"values": 1}
+
     def __init__(
         self,
         widget_id: str,
-        values: list[float] | None = None,
+        values: ArrayLike | None = None,
         labels: list[str] | None = None,
         center: tuple[float, float] = (0.5, 0.5),
         radius: float = 0.4,
         **props,
     ):
         """Initialize pie chart."""
-        props["values"] = values or []
+        props["values"] = values
         props["labels"] = labels or []
         props["center"] = center
         props["radius"] = radius
+        _convert_array_properties(props, self._array_properties)
         super().__init__(widget_id, **props)
 
+    def coerce_update(self, props: dict[str, Any]) -> dict[str, Any]:
+        """Validate and convert properties for ``update`` (arrays to plot arrays)."""
+        props = dict(props)
+        _convert_array_properties(props, self._array_properties)
+        return props
+
     def render(self) -> None:
         """Render pie chart."""
-        values = self.state.properties.get("values", [])
+        values = self.state.properties["values"]
         labels = self.state.properties.get("labels", [])
         center = self.state.properties.get("center", (0.5, 0.5))
         radius = self.state.properties.get("radius", 0.4)
 
         if (
-            values
-            and labels
+            values.size
             and len(values) == len(labels)
             and implot.begin_plot("##pie", imgui.ImVec2(-1, -1))
         ):
@@ -260,7 +561,14 @@ class PieChartWidget(Widget):
 
 
 class RealtimePlotWidget(PlotWidget):
-    """Realtime scrolling plot widget."""
+    """Realtime scrolling plot widget.
+
+    Points are kept in a fixed-capacity NumPy ring buffer. Rendering hands
+    ImPlot the buffer itself plus the offset of the oldest point, so frames
+    build no lists, copies or x arrays. The points are not stored in
+    ``state.properties``; ``serialize()`` adds them as ``data``, and every
+    change to them is recorded in the change log as a ``replace`` of it.
+    """
 
     def __init__(
         self,
@@ -270,62 +578,168 @@ class RealtimePlotWidget(PlotWidget):
         **props,
     ):
         """Initialize realtime plot."""
-        props["data"] = []
+        if max_points < 1:
+            raise ValueError("max_points must be at least 1")
+        data = props.pop("data", None)
         props["max_points"] = max_points
         props["line_label"] = props.get("line_label", "Signal")
         super().__init__(widget_id, title, **props)
+        self._buffer = np.zeros(max_points, dtype=np.float64)
+        self._head = 0  # Index the next point is written to
+        self._count = 0
+        self._spec = implot.Spec()
+        if data is not None:
+            self._write_points(data)
 
     def add_point(self, value: float) -> None:
         """Add a data point."""
-        data = self.state.properties.get("data", [])
-        max_points = self.state.properties.get("max_points", 1000)
-
-        data.append(value)
-
-        # Keep only recent points
-        if len(data) > max_points:
-            data.pop(0)
-
-        self.state.properties["data"] = data
+        self._buffer[self._head] = value
+        self._head = (self._head + 1) % len(self._buffer)
+        if self._count < len(self._buffer):
+            self._count += 1
+        self._record_points()
+
+    def add_points(self, values: ArrayLike) -> None:
+        """Add many data points at once (oldest first)."""
+        self._write_points(values)
+        self._record_points()
+
+    def _write_points(self, values: ArrayLike) -> None:
+        """Write points into the ring buffer without recording the change."""
+        values = np.asarray(values, dtype=self._buffer.dtype).ravel()
+        capacity = len(self._buffer)
+        if len(values) >= capacity:
+            self._buffer[:] = values[-capacity:]
+            self._head = 0
+            self._count = capacity
+            return
+
+        end = self._head + len(values)
+        if end <= capacity:
+            self._buffer[self._head : end] = values
+        else:
+            split = capacity - self._head
+            self._buffer[self._head :] = values[:split]
+            self._buffer[: end - capacity] = values[split:]
+        self._head = end % capacity
+        self._count = min(self._count + len(values), capacity)
+
+    def _record_points(self) -> None:
+        """Record the points as the serialized ``data`` property."""
+        registry = self._registry
+        if registry is not None and registry.changes is not None:
+            self._record_change("replace", ("properties", "data"), self.get_data())
+
+    def coerce_append(
+        self, x: ArrayLike | None, y: ArrayLike
+    ) -> tuple[np.ndarray | None, np.ndarray]:
+        """Validate and convert points for ``append_data`` (y values only)."""
+        if x is not None:
+            raise ValueError(f"{type(self).__name__} takes y values only")
+        return None, as_plot_array(y)
+
+    def append_data(self, x: ArrayLike | None = None, y: ArrayLike = ()) -> int:
+        """Append values to the ring buffer; returns the number of points kept."""
+        _, y = self.coerce_append(x, y)
+        self.add_points(y)
+        return self._count
+
+    def clear_points(self) -> None:
+        """Remove all data points."""
+        self._head = 0
+        self._count = 0
+        self._record_points()
+
+    def get_data(self) -> np.ndarray:
+        """Get a copy of the data points, oldest first."""
+        if self._count < len(self._buffer):
+            return self._buffer[: self._count].copy()
+        return np.concatenate((self._buffer[self._head :], self._buffer[: self._head]))
+
+    def coerce_update(self, props: dict[str, Any]) -> dict[str, Any]:
+        """Validate and convert properties for ``update``."""
+        props = super().coerce_update(props)
+        if "max_points" in props and props["max_points"] < 1:
+            raise ValueError("max_points must be at least 1")
+        if props.get("data") is not None:
+            props["data"] = np.asarray(props["data"], dtype=np.float64).ravel()
+        return props
+
+    def update(self, **props) -> None:
+        """Update widget properties (``data`` replaces the points)."""
+        props = self.coerce_update(props)
+        data = props.pop("data", None)
+        super().update(**props)
+        resized = "max_points" in props and props["max_points"] != len(self._buffer)
+        if resized:
+            points = self.get_data()
+            self._buffer = np.zeros(props["max_points"], dtype=self._buffer.dtype)
+            self._head = self._count = 0
+            self._write_points(points)
+        if data is not None:
+            self._head = self._count = 0
+            self._write_points(data)
+        if resized or data is not None:
+            self._record_points()
+
+    def serialize(self, arrays: bool = False) -> dict[str, Any]:
+        """Serialize widget state, including the data points."""
+        data = super().serialize(arrays)
+        points = self.get_data()
+        data["properties"]["data"] = points if arrays else points.tolist()
+        return data
 
     def render(self) -> None:
         """Render realtime plot."""
         if self.begin_plot():
             # Setup auto-scrolling axes
-            implot.setup_axes_limits(
-                0, self.state.properties.get("max_points", 1000), -1, 1
-            )
+            implot.setup_axes_limits(0, len(self._buffer), -1, 1)
 
-            data = self.state.properties.get("data", [])
             line_label = self.state.properties.get("line_label", "Signal")
 
-            if data:
-                x_data = list(range(len(data)))
-                implot.plot_line(line_label, x_data, data)
+            if self._count == len(self._buffer):
+                # Full: ImPlot reads from the oldest point and wraps around
+                self._spec.offset = self._head
+                implot.plot_line(line_label, self._buffer, spec=self._spec)
+            elif self._count:
+                self._spec.offset = 0
+                implot.plot_line(
+                    line_label, self._buffer[: self._count], spec=self._spec
+                )
 
             self.end_plot()
 
 
 class CandlestickChartWidget(PlotWidget):
-    """Candlestick chart widget for financial data."""
+    """Candlestick chart widget for financial data.
+
+    ImPlot has no candlestick item, so wicks and bodies are drawn into the
+    plot's draw list. Plot-to-pixel mapping is done for all candles at once
+    with NumPy; only the draw calls loop in Python.
+    """
+
+    _array_properties = {"dates": 1, "opens": 1, "highs": 1, "lows": 1, "closes": 1}
 
     def __init__(
         self,
         widget_id: str,
         title: str = "Candlestick Chart",
-        dates: list[float] | None = None,
-        opens: list[float] | None = None,
-        highs: list[float] | None = None,
-        lows: list[float] | None = None,
-        closes: list[float] | None = None,
+        dates: ArrayLike | None = None,
+        opens: ArrayLike | None = None,
+        highs: ArrayLike | None = None,
+        lows: ArrayLike | None = None,
+        closes: ArrayLike | None = None,
         **props,
     ):
         """Initialize candlestick chart."""
-        props["dates"] = dates or []
-        props["opens"] = opens or []
-        props["highs"] = highs or []
-        props["lows"] = lows or []
-        props["closes"] = closes or []
+        props["dates"] = dates
+        props["opens"] = opens
+        props["highs"] = highs
+        props["lows"] = lows
+        props["closes"] = closes
+        props["width_percent"] = props.get("width_percent", 0.25)
+        props["bull_color"] = props.get("bull_color", (0.0, 1.0, 0.44, 1.0))
+        props["bear_color"] = props.get("bear_color", (0.86, 0.08, 0.24, 1.0))
         super().__init__(widget_id, title, **props)
 
     def render(self) -> None:
@@ -333,50 +747,82 @@ class CandlestickChartWidget(PlotWidget):
         if self.begin_plot():
             self.setup_axes()
 
-            dates = self.state.properties.get("dates", [])
-            opens = self.state.properties.get("opens", [])
-            highs = self.state.properties.get("highs", [])
-            lows = self.state.properties.get("lows", [])
-            closes = self.state.properties.get("closes", [])
-
-            if (
-                dates
-                and opens
-                and highs
-                and lows
-                and closes
-                and len(dates) == len(opens) == len(highs) == len(lows) == len(closes)
+            props = self.state.properties
+            dates, opens, highs, lows, closes = (
+                props[name] for name in ("dates", "opens", "highs", "lows", "closes")
+            )
+            if dates.size and (
+                dates.size == opens.size == highs.size == lows.size == closes.size
             ):
-                implot.plot_candlestick(
-                    "OHLC",
-                    dates,
-                    opens,
-                    closes,
-                    lows,
-                    highs,
-                    bull_col=None,
-                    bear_col=None,
-                )
+                self._draw_candles(dates, opens, highs, lows, closes)
 
             self.end_plot()
 
+    def _draw_candles(
+        self,
+        dates: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+    ) -> None:
+        """Draw the candles as a single legend item."""
+        bull = imgui.get_color_u32(imgui.ImVec4(*self.state.properties["bull_color"]))
+        bear = imgui.get_color_u32(imgui.ImVec4(*self.state.properties["bear_color"]))
+        if not implot.internal.begin_item("OHLC"):
+            return
+
+        if implot.internal.fit_this_frame():
+            implot.internal.fit_point(implot.Point(dates.min(), lows.min()))
+            implot.internal.fit_point(implot.Point(dates.max(), highs.max()))
+
+        # Axes are linear, so two reference points give the whole mapping
+        origin = implot.plot_to_pixels(implot.Point(0.0, 0.0))
+        unit = implot.plot_to_pixels(implot.Point(1.0, 1.0))
+        x_scale, y_scale = unit.x - origin.x, unit.y - origin.y
+        spacing = np.diff(dates).min() if dates.size > 1 else 1.0
+        half_width = self.state.properties["width_percent"] * spacing / 2
+
+        xs = origin.x + dates * x_scale
+        left = origin.x + (dates - half_width) * x_scale
+        right = origin.x + (dates + half_width) * x_scale
+        open_y = origin.y + opens * y_scale
+        close_y = origin.y + closes * y_scale
+        high_y = origin.y + highs * y_scale
+        low_y = origin.y + lows * y_scale
+
+        draw_list = implot.get_plot_draw_list()
+        for i in range(dates.size):
+            color = bull if closes[i] >= opens[i] else bear
+            draw_list.add_line(
+                imgui.ImVec2(xs[i], low_y[i]), imgui.ImVec2(xs[i], high_y[i]), color
+            )
+            draw_list.add_rect_filled(
+                imgui.ImVec2(left[i], min(open_y[i], close_y[i])),
+                imgui.ImVec2(right[i], max(open_y[i], close_y[i])),
+                color,
+            )
+        implot.internal.end_item()
+
 
 class ErrorBarsWidget(PlotWidget):
     """Plot with error bars."""
 
+    _array_properties = {"x_data": 1, "y_data": 1, "y_errors": 1}
+
     def __init__(
         self,
         widget_id: str,
         title: str = "Error Bars",
-        x_data: list[float] | None = None,
-        y_data: list[float] | None = None,
-        y_errors: list[float] | None = None,
+        x_data: ArrayLike | None = None,
+        y_data: ArrayLike | None = None,
+        y_errors: ArrayLike | None = None,
         **props,
     ):
         """Initialize error bars plot."""
-        props["x_data"] = x_data or []
-        props["y_data"] = y_data or []
-        props["y_errors"] = y_errors or []
+        props["x_data"] = x_data
+        props["y_data"] = y_data
+        props["y_errors"] = y_errors
         props["error_label"] = props.get("error_label", "Data")
         super().__init__(widget_id, title, **props)
 
@@ -385,17 +831,13 @@ class ErrorBarsWidget(PlotWidget):
         if self.begin_plot():
             self.setup_axes()
 
-            x_data = self.state.properties.get("x_data", [])
-            y_data = self.state.properties.get("y_data", [])
-            y_errors = self.state.properties.get("y_errors", [])
+            x_data = self.state.properties["x_data"]
+            y_data = self.state.properties["y_data"]
+            y_errors = self.state.properties["y_errors"]
             error_label = self.state.properties.get("error_label", "Data")
 
-            if (
-                x_data
-                and y_data
-                and y_errors
-                and len(x_data) == len(y_data) == len(y_errors)
-            ):
+            if x_data.size and x_data.size == y_data.size == y_errors.size:
+                x_data, y_data, y_errors = _matching(x_data, y_data, y_errors)
                 implot.plot_error_bars(error_label, x_data, y_data, y_errors)
                 implot.plot_line(error_label, x_data, y_data)
 
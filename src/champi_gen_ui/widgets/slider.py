@@ -8,6 +8,8 @@ from champi_gen_ui.core.widget import Widget
 class SliderIntWidget(Widget):
     """Integer slider widget."""
 
+    _mirrored_properties = {"value": "_value"}
+
     def __init__(
         self,
         widget_id: str,
@@ -37,7 +39,7 @@ class SliderIntWidget(Widget):
         )
 
         if changed:
-            self.state.properties["value"] = self._value
+            self._set_edited("value", self._value)
             self.trigger_callback("on_change", self._value)
 
         return self._value
@@ -55,6 +57,8 @@ class SliderIntWidget(Widget):
 class SliderFloatWidget(Widget):
     """Float slider widget."""
 
+    _mirrored_properties = {"value": "_value"}
+
     def __init__(
         self,
         widget_id: str,
@@ -84,7 +88,7 @@ class SliderFloatWidget(Widget):
         )
 
         if changed:
-            self.state.properties["value"] = self._value
+            self._set_edited("value", self._value)
             self.trigger_callback("on_change", self._value)
 
         return self._value
@@ -102,6 +106,8 @@ class SliderFloatWidget(Widget):
 class DragIntWidget(Widget):
     """Integer drag control widget."""
 
+    _mirrored_properties = {"value": "_value"}
+
     def __init__(
         self,
         widget_id: str,
@@ -134,7 +140,7 @@ class DragIntWidget(Widget):
         )
 
         if changed:
-            self.state.properties["value"] = self._value
+            self._set_edited("value", self._value)
             self.trigger_callback("on_change", self._value)
 
         return self._value
@@ -143,6 +149,8 @@ class DragIntWidget(Widget):
 class DragFloatWidget(Widget):
     """Float drag control widget."""
 
+    _mirrored_properties = {"value": "_value"}
+
     def __init__(
         self,
         widget_id: str,
@@ -175,7 +183,7 @@ class DragFloatWidget(Widget):
         )
 
         if changed:
-            self.state.properties["value"] = self._value
+            self._set_edited("value", self._value)
             self.trigger_callback("on_change", self._value)
 
         return self._value
@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures."""
 
 import pytest
+from imgui_bundle import imgui, implot
 
 from champi_gen_ui.core.canvas import Canvas, CanvasManager
 from champi_gen_ui.core.state import CanvasMode
@@ -55,3 +56,24 @@ def button_widget():
 def text_widget():
     """Create a test text widget."""
     return TextWidget(widget_id="test_text", text="Test Text")
+
+
+@pytest.fixture
+def imgui_context():
+    """Create a windowless ImGui context for rendering frames in tests."""
+    ctx = imgui.create_context()
+    io = imgui.get_io()
+    io.display_size = imgui.ImVec2(800, 600)
+    io.delta_time = 1 / 60
+    io.set_ini_filename("")
+    io.backend_flags |= imgui.BackendFlags_.renderer_has_textures.value
+    yield ctx
+    imgui.destroy_context(ctx)
+
+
+@pytest.fixture
+def implot_context(imgui_context):
+    """Create an ImPlot context on top of the windowless ImGui context."""
+    ctx = implot.create_context()
+    yield ctx
+    implot.destroy_context(ctx)
@@ -0,0 +1,434 @@
+"""Unit tests for the data store and bindings."""
+
+import threading
+
+import pytest
+
+from champi_gen_ui.core.binding import (
+    PATH_CACHE_SIZE,
+    BindingManager,
+    ComputedProperty,
+    DataStore,
+)
+from champi_gen_ui.widgets.basic import InputTextWidget, TextWidget
+
+
+class TestDataStorePaths:
+    """Tests for DataStore path resolution and its leaf index."""
+
+    def test_set_and_get_nested(self):
+        """Test that nested paths create and read intermediate dicts."""
+        store = DataStore()
+        store.set("user.profile.name", "Ada")
+
+        assert store.get("user.profile.name") == "Ada"
+        assert store.get("user.profile") == {"name": "Ada"}
+        assert store.get("user.missing", "default") == "default"
+        assert store.get("user.profile.name.first") is None
+
+    def test_replacing_parent_invalidates_index(self):
+        """Test that cached leaves never point at a detached dict."""
+        store = DataStore()
+        store.set("a.b.c", 1)
+        assert store.get("a.b.c") == 1
+
+        store.set("a.b", {"c": 2})
+        assert store.get("a.b.c") == 2
+
+        store.set("a.b.c", 3)
+        assert store.to_dict() == {"a": {"b": {"c": 3}}}
+
+    def test_delete_and_import_invalidate_index(self):
+        """Test that delete, clear and from_dict drop cached leaves."""
+        store = DataStore()
+        store.set("a.b", 1)
+        assert store.get("a.b") == 1
+
+        assert store.delete("a")
+        assert store.get("a.b") is None
+        store.set("a.b", 2)
+        assert store.get("a") == {"b": 2}
+
+        store.from_dict({"a": {"b": 5}})
+        assert store.get("a.b") == 5
+        store.clear()
+        assert store.get("a.b") is None
+
+    def test_index_is_bounded(self):
+        """Test that the leaf index does not grow without limit."""
+        store = DataStore()
+        for i in range(PATH_CACHE_SIZE + 10):
+            store.set(f"series.s{i}", i)
+
+        assert len(store._leaf_index) <= PATH_CACHE_SIZE
+        assert store.get("series.s0") == 0
+        assert store.get(f"series.s{PATH_CACHE_SIZE + 9}") == PATH_CACHE_SIZE + 9
+
+    def test_set_only_signals_subscribed_paths(self):
+        """Test that writes do not create signals for unwatched paths."""
+        store = DataStore()
+        received = []
+
+        def on_change(sender, **kwargs):
+            received.append(kwargs)
+
+        store.subscribe("watched", on_change)
+
+        store.set("unwatched", 1)
+        store.set("watched", 2)
+
+        assert list(store._subscriptions.children) == ["watched"]
+        assert received == [{"path": "watched", "value": 2, "source": "watched"}]
+
+
+class TestDataStorePropagation:
+    """Tests for change propagation through the subscription trie."""
+
+    @staticmethod
+    def _recorder(store, *paths):
+        """Subscribe a recording receiver to each path."""
+        received = []
+
+        def on_change(sender, **kwargs):
+            received.append((kwargs["path"], kwargs["value"], kwargs["source"]))
+
+        for path in paths:
+            store.subscribe(path, on_change)
+        return received, on_change
+
+    def test_parent_notified_of_child_write(self):
+        """Test that ancestors see writes below them."""
+        store = DataStore()
+        received, _on_change = self._recorder(store, "user", "user.profile")
+
+        store.set("user.profile.name", "Ada")
+
+        assert received == [
+            ("user.profile", {"name": "Ada"}, "user.profile.name"),
+            ("user", {"profile": {"name": "Ada"}}, "user.profile.name"),
+        ]
+
+        received.clear()
+        store.set("user.profile.name", "Ada")
+        assert received == []
+
+    def test_replaced_subtree_notifies_changed_leaves(self):
+        """Test that replacing a dict fires only descendants that changed."""
+        store = DataStore()
+        store.set("user", {"name": "Ada", "age": 36, "tags": {"a": 1}})
+        received, _on_change = self._recorder(
+            store, "user.name", "user.age", "user.tags.a", "user.email"
+        )
+
+        store.set("user", {"name": "Ada", "age": 37, "tags": {"a": 1}})
+        assert received == [("user.age", 37, "user")]
+
+        received.clear()
+        store.delete("user")
+        assert sorted(received) == [
+            ("user.age", None, "user"),
+            ("user.name", None, "user"),
+            ("user.tags.a", None, "user"),
+        ]
+
+    def test_unsubscribe_prunes_trie(self):
+        """Test that empty trie branches are removed."""
+        store = DataStore()
+        received, on_change = self._recorder(store, "a.b.c", "a")
+
+        store.unsubscribe("a.b.c", on_change)
+        assert list(store._subscriptions.children["a"].children) == []
+
+        store.unsubscribe("a", on_change)
+        assert store._subscriptions.children == {}
+        store.set("a.b.c", 1)
+        assert received == []
+
+
+class TestDataStoreTransactions:
+    """Tests for transactional batch writes."""
+
+    def test_notifications_coalesced_at_commit(self):
+        """Test that each affected path is notified once, after the block."""
+        store = DataStore()
+        received = []
+
+        def on_change(sender, **kwargs):
+            received.append((kwargs["path"], kwargs["value"]))
+
+        store.subscribe("point", on_change)
+        store.subscribe("point.x", on_change)
+
+        with store.transaction():
+            store.set("point.x", 1)
+            store.set("point.y", 2)
+            store.set("point.x", 3)
+            assert store.get("point") == {"x": 3, "y": 2}
+            assert received == []
+
+        assert received == [("point.x", 3), ("point", {"x": 3, "y": 2})]
+
+    def test_rollback_on_error(self):
+        """Test that a failed transaction restores values and stays silent."""
+        store = DataStore()
+        store.set("a", {"b": 1})
+        received = []
+
+        def on_change(sender, **kwargs):
+            received.append(kwargs["path"])
+
+        store.subscribe("a", on_change)
+
+        with pytest.raises(RuntimeError), store.transaction():
+            store.set("a.b", 2)
+            store.set("a.c", 3)
+            store.set("d", 4)
+            with store.transaction():
+                store.delete("a.b")
+            raise RuntimeError("boom")
+
+        assert store.to_dict() == {"a": {"b": 1}}
+        assert store.get("a.b") == 1
+        assert received == []
+        assert not store.in_transaction
+
+    def test_transactions_isolated_between_threads(self):
+        """Test that another thread's writes never join a transaction."""
+        store = DataStore()
+        opened = threading.Event()
+        writer_started = threading.Event()
+
+        def write_from_other_thread():
+            opened.wait()
+            writer_started.set()
+            store.set("b", 1)
+
+        writer = threading.Thread(target=write_from_other_thread)
+        writer.start()
+        with pytest.raises(RuntimeError), store.transaction():
+            store.set("a", 1)
+            opened.set()
+            writer_started.wait()
+            writer.join(0.05)
+            assert writer.is_alive()
+            raise RuntimeError("boom")
+        writer.join()
+
+        assert store.to_dict() == {"b": 1}
+
+    def test_computed_evaluated_once_in_dependency_order(self):
+        """Test that dependent computed values recompute once per commit."""
+        store = DataStore()
+        store.set("a", 1)
+        store.set("b", 2)
+        calls = []
+
+        def total(a, b):
+            calls.append("total")
+            return a + b
+
+        def doubled(total):
+            calls.append("doubled")
+            return total * 2
+
+        # Registered out of dependency order on purpose
+        doubled_prop = ComputedProperty("doubled", ["total"], doubled, store)
+        ComputedProperty("total", ["a", "b"], total, store)
+        assert doubled_prop.value == 6
+        calls.clear()
+
+        with store.transaction():
+            store.set("a", 10)
+            store.set("b", 20)
+
+        assert store.get("doubled") == 60
+        assert calls == ["total", "doubled"]
+
+        calls.clear()
+        store.set("a", 10)
+        assert store.get("doubled") == 60
+        assert calls == []
+
+        doubled_prop.dispose()
+        store.set("b", 1)
+        assert store.to_dict()["doubled"] == 60
+        assert calls == ["total"]
+
+
+class TestComputedGraph:
+    """Tests for the reactive graph behind computed properties."""
+
+    def test_lazy_and_memoized(self):
+        """Test that a chain is evaluated on read, once per change."""
+        store = DataStore()
+        store.set("x", 1)
+        calls = []
+
+        def track(name, fn):
+            def compute(**values):
+                calls.append(name)
+                return fn(*values.values())
+
+            return compute
+
+        ComputedProperty("sign", ["x"], track("sign", lambda x: x > 0), store)
+        ComputedProperty("label", ["sign"], track("label", str), store)
+        calls.clear()
+
+        for value in range(2, 10):
+            store.set("x", value)
+        assert calls == []
+
+        assert store.get("label") == "True"
+        assert calls == ["sign"]
+
+        calls.clear()
+        store.set("x", -1)
+        assert store.get("label") == "False"
+        assert calls == ["sign", "label"]
+
+    def test_observed_evaluated_at_commit(self):
+        """Test that subscribed computed values update eagerly."""
+        store = DataStore()
+        store.set("x", 1)
+        ComputedProperty("double", ["x"], lambda x: x * 2, store)
+        received = []
+
+        def on_change(sender, **kwargs):
+            received.append(kwargs["value"])
+
+        store.subscribe("double", on_change)
+        store.set("x", 5)
+
+        assert received == [10]
+
+    def test_cycles_rejected(self):
+        """Test that a property closing a cycle cannot be registered."""
+        store = DataStore()
+        ComputedProperty("b", ["a"], lambda a: a, store)
+        ComputedProperty("c", ["b"], lambda b: b, store)
+
+        with pytest.raises(ValueError, match="a -> b -> c -> a"):
+            ComputedProperty("a", ["c"], lambda c: c, store)
+        with pytest.raises(ValueError, match="depends on itself"):
+            ComputedProperty("d", ["d.total"], lambda **values: 0, store)
+
+        assert list(store._graph.nodes) == ["b", "c"]
+
+
+class TestBindingManager:
+    """Tests for bindings wired to canvas widgets."""
+
+    def test_updates_reach_widgets_on_every_canvas(self, canvas_manager):
+        """Test that bound values are applied through the global index."""
+        first = canvas_manager.create_canvas("first", auto_start=False)
+        second = canvas_manager.create_canvas("second", auto_start=False)
+        first.add_widget(TextWidget("status", text=""))
+        second.add_widget(TextWidget("status", text=""))
+        assert len(canvas_manager.find_widgets("status")) == 2
+
+        store = DataStore()
+        manager = BindingManager(store, canvas_manager)
+        store.set("status", 1)
+        manager.bind("status", "status", "text", transform=lambda v: f"#{v}")
+        assert first.get_widget("status").state.properties["text"] == "#1"
+
+        store.set("status", 2)
+        assert second.get_widget("status").state.properties["text"] == "#2"
+
+        first.remove_widget("status")
+        canvas_manager.remove_canvas("second")
+        assert canvas_manager.find_widgets("status") == []
+
+    def test_updates_marshalled_to_render_thread(self, canvas_manager):
+        """Test that a running canvas applies bound values when it drains."""
+        canvas = canvas_manager.create_canvas("live", auto_start=False)
+        widget = TextWidget("label", text="")
+        canvas.add_widget(widget)
+        canvas._render_thread = threading.Thread(target=lambda: None)
+        canvas._running = True
+
+        store = DataStore()
+        manager = BindingManager(store, canvas_manager)
+        manager.bind("label", "label", "text")
+        store.set("label", "queued")
+        assert widget.state.properties["text"] == ""
+
+        canvas.process_commands()
+        canvas._running = False
+        assert widget.state.properties["text"] == "queued"
+
+    def test_writes_coalesced_per_frame(self, canvas_manager):
+        """Test that only the latest value per property is applied."""
+        canvas = canvas_manager.create_canvas("telemetry", auto_start=False)
+        widget = TextWidget("rate", text="")
+        canvas.add_widget(widget)
+        canvas._render_thread = threading.Thread(target=lambda: None)
+        canvas._running = True
+
+        applied = []
+        original_update = widget.update
+
+        def tracking_update(**props):
+            applied.append(props)
+            original_update(**props)
+
+        widget.update = tracking_update
+        store = DataStore()
+        manager = BindingManager(store, canvas_manager)
+        manager.bind("rate", "rate", "text", transform=str)
+        manager.bind("rate", "rate", "tooltip", transform=lambda v: f"{v} Hz")
+        for value in range(1000):
+            store.set("rate", value)
+
+        canvas.process_commands()
+        canvas._running = False
+        assert applied == [{"text": "999"}, {"tooltip": "999 Hz"}]
+
+    def test_bidirectional(self, canvas_manager):
+        """Test that edits flow back to the store and values to the widget."""
+        canvas = canvas_manager.create_canvas("form", auto_start=False)
+        field = InputTextWidget("name_field", value="")
+        canvas.add_widget(field)
+
+        store = DataStore()
+        manager = BindingManager(store, canvas_manager)
+        manager.bind("user.name", "name_field", "value", bidirectional=True)
+
+        store.set("user.name", "Ada")
+        assert field.get_value() == "Ada"
+
+        field._set_edited("value", "Grace")
+        assert store.get("user.name") == "Grace"
+
+        manager.unbind("user.name")
+        field._set_edited("value", "Linus")
+        assert store.get("user.name") == "Grace"
+
+    def test_edit_during_other_thread_transaction(self, canvas_manager, monkeypatch):
+        """Test that an edit is not rolled back or echoed by another batch."""
+        canvas = canvas_manager.create_canvas("form", auto_start=False)
+        field = InputTextWidget("name_field", value="")
+        canvas.add_widget(field)
+        store = DataStore()
+        manager = BindingManager(store, canvas_manager)
+        manager.bind("user.name", "name_field", "value", bidirectional=True)
+        echoed = []
+        monkeypatch.setattr(
+            canvas, "write_property", lambda w, name, value: echoed.append(value)
+        )
+
+        opened = threading.Event()
+        editor = threading.Thread(
+            target=lambda: (opened.wait(), field._set_edited("value", "Grace"))
+        )
+        editor.start()
+        with pytest.raises(RuntimeError), store.transaction():
+            store.set("user.age", 36)
+            opened.set()
+            editor.join(0.05)
+            raise RuntimeError("batch failed")
+        editor.join()
+
+        assert store.to_dict() == {"user": {"name": "Grace"}}
+        assert echoed == []
@@ -0,0 +1,389 @@
+"""Unit tests for canvas management."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from imgui_bundle import imgui
+
+from champi_gen_ui.core.canvas import Canvas
+from champi_gen_ui.widgets.basic import TextWidget
+from champi_gen_ui.widgets.container import CollapsingHeaderWidget, WindowWidget
+from champi_gen_ui.widgets.menu import TreeNodeWidget
+from champi_gen_ui.widgets.plotting import RealtimePlotWidget
+
+
+class TestWidgetBatch:
+    """Tests for Canvas.apply_widget_batch."""
+
+    def test_create_update_delete(self, canvas, widget_factory):
+        """Test applying a mixed batch of operations."""
+        canvas.widget_registry._factory = widget_factory
+        result = canvas.apply_widget_batch(
+            [
+                {
+                    "op": "create",
+                    "widget_type": "button",
+                    "widget_id": "btn1",
+                    "properties": {"label": "OK"},
+                    "position": [10, 20],
+                },
+                {"op": "create", "widget_type": "text", "widget_id": "txt1"},
+                {"op": "update", "widget_id": "btn1", "properties": {"label": "Go"}},
+                {"op": "delete", "widget_id": "txt1"},
+            ]
+        )
+
+        assert result["created"] == ["btn1", "txt1"]
+        assert result["updated"] == ["btn1"]
+        assert result["deleted"] == ["txt1"]
+        assert result["widget_count"] == 1
+
+        button = canvas.get_widget("btn1")
+        assert button.state.properties["label"] == "Go"
+        assert button.state.position == (10, 20)
+        assert canvas.get_widget("txt1") is None
+
+    def test_invalid_batch_applies_nothing(self, canvas, widget_factory):
+        """Test that an invalid op rejects the whole batch."""
+        canvas.widget_registry._factory = widget_factory
+        with pytest.raises(ValueError, match="not found"):
+            canvas.apply_widget_batch(
+                [
+                    {"op": "create", "widget_type": "button", "widget_id": "btn1"},
+                    {"op": "update", "widget_id": "missing"},
+                ]
+            )
+
+        assert canvas.get_widget("btn1") is None
+        assert canvas.state.widgets == {}
+
+    def test_batch_validated_before_applying(self, canvas, widget_factory):
+        """Test that bad values and stale targets reject the whole batch."""
+        canvas.widget_registry._factory = widget_factory
+        canvas.widget_registry._factory.register("realtime", RealtimePlotWidget)
+        canvas.add_widget(WindowWidget("win"))
+        canvas.add_widget(TreeNodeWidget("node"), parent_id="win")
+        create = {"op": "create", "widget_type": "button", "widget_id": "btn1"}
+
+        bad_batches = [
+            [
+                create,
+                {"op": "update", "widget_id": "win", "visible": False},
+                {"op": "update", "widget_id": "win", "position": [1]},
+            ],
+            [
+                {"op": "create", "widget_type": "realtime", "widget_id": "rt"},
+                create,
+                {"op": "update", "widget_id": "rt", "properties": {"max_points": 0}},
+            ],
+            [
+                create,
+                {"op": "delete", "widget_id": "win"},
+                {
+                    "op": "create",
+                    "widget_type": "text",
+                    "widget_id": "t",
+                    "parent": "node",
+                },
+            ],
+        ]
+        for ops in bad_batches:
+            with pytest.raises(ValueError, match="op 2"):
+                canvas.apply_widget_batch(ops)
+        assert canvas.widget_registry.list() == ["win", "node"]
+        assert canvas.get_widget("win").state.visible
+
+        # Widgets removed after validation are caught on the render thread
+        apply = canvas._prepare_widget_batch(
+            [create, {"op": "update", "widget_id": "node", "visible": False}]
+        )
+        canvas.remove_widget("node")
+        with pytest.raises(ValueError, match="node not found"):
+            apply()
+        assert canvas.get_widget("btn1") is None
+
+    def test_unknown_widget_type(self, canvas, widget_factory):
+        """Test creating an unregistered widget type."""
+        canvas.widget_registry._factory = widget_factory
+        with pytest.raises(ValueError, match="Unknown widget type"):
+            canvas.apply_widget_batch(
+                [{"op": "create", "widget_type": "nope", "widget_id": "w1"}]
+            )
+
+
+class TestRenderList:
+    """Tests for the retained render list."""
+
+    def test_retained_between_frames(self, canvas, button_widget, text_widget):
+        """Test that the render list is reused until invalidated."""
+        canvas.add_widget(button_widget)
+        canvas.add_widget(text_widget)
+
+        first = canvas.widget_registry.render_list()
+        assert first == [button_widget, text_widget]
+        assert canvas.widget_registry.render_list() is first
+
+    def test_visibility_change_rebuilds(self, canvas, button_widget, text_widget):
+        """Test that hiding a widget drops it from the render list."""
+        canvas.add_widget(button_widget)
+        canvas.add_widget(text_widget)
+        canvas.widget_registry.render_list()
+
+        button_widget.set_visible(False)
+        assert canvas.widget_registry.render_list() == [text_widget]
+
+        button_widget.set_visible(True)
+        assert canvas.widget_registry.render_list() == [button_widget, text_widget]
+
+    def test_remove_and_move(self, canvas, button_widget, text_widget):
+        """Test that removing and reordering widgets rebuilds the list."""
+        canvas.add_widget(button_widget)
+        canvas.add_widget(text_widget)
+
+        assert canvas.move_widget("test_text", 0)
+        assert canvas.widget_registry.render_list() == [text_widget, button_widget]
+
+        canvas.remove_widget("test_text")
+        assert canvas.widget_registry.render_list() == [button_widget]
+        assert text_widget._registry is None
+
+
+class TestWidgetTree:
+    """Tests for parent/child widget hierarchies."""
+
+    def test_children_indexed_by_parent(self, canvas, button_widget, text_widget):
+        """Test that child widgets leave the top-level render list."""
+        header = CollapsingHeaderWidget("header", label="Section")
+        canvas.add_widget(header)
+        canvas.add_widget(button_widget, parent_id="header")
+        canvas.add_widget(text_widget)
+
+        registry = canvas.widget_registry
+        assert registry.render_list() == [header, text_widget]
+        assert registry.children("header") == [button_widget]
+        assert list(header.state.children) == ["test_button"]
+        assert button_widget.state.parent == "header"
+
+    def test_set_parent_rejects_cycles(self, canvas):
+        """Test that a widget cannot be parented under its own subtree."""
+        canvas.add_widget(WindowWidget("outer"))
+        canvas.add_widget(WindowWidget("inner"), parent_id="outer")
+
+        with pytest.raises(ValueError, match="own subtree"):
+            canvas.set_widget_parent("outer", "inner")
+
+        with pytest.raises(ValueError, match="not found"):
+            canvas.set_widget_parent("missing", "outer")
+
+        moved = canvas.set_widget_parent("inner", None)
+        assert moved is canvas.get_widget("inner")
+        assert not canvas.get_widget("outer").state.children
+        assert canvas.widget_registry.render_list()[-1].widget_id == "inner"
+
+    def test_remove_container_removes_subtree(self, canvas, button_widget):
+        """Test that removing a container removes its descendants."""
+        canvas.add_widget(WindowWidget("win"))
+        canvas.add_widget(TreeNodeWidget("node"), parent_id="win")
+        canvas.add_widget(button_widget, parent_id="node")
+        canvas.add_widget(TextWidget("note", text="last"), parent_id="win")
+
+        descendants = canvas.widget_registry.descendants("win")
+        assert descendants == ["node", "test_button", "note"]
+        assert canvas.remove_widget("win")
+        assert canvas.widget_registry.list() == []
+        assert canvas.state.widgets == {}
+
+    def test_collapsed_container_skips_subtree(
+        self, canvas, button_widget, imgui_context
+    ):
+        """Test that closed containers do not render their children."""
+        rendered = []
+        button_widget.render = lambda: rendered.append("closed")
+        canvas.add_widget(CollapsingHeaderWidget("closed", label="Closed"))
+        canvas.add_widget(button_widget, parent_id="closed")
+
+        open_text = TextWidget("open_text", text="Visible")
+        open_text.render = lambda: rendered.append("open")
+        canvas.add_widget(
+            CollapsingHeaderWidget("open", label="Open", default_open=True)
+        )
+        canvas.add_widget(open_text, parent_id="open")
+
+        imgui.new_frame()
+        canvas.render()
+        imgui.render()
+
+        assert rendered == ["open"]
+
+
+class TestClipping:
+    """Tests for canvas-level clipping."""
+
+    def test_only_visible_rows_render(self, imgui_context):
+        """Test that a clipping canvas skips rows outside the window."""
+        canvas = Canvas("clip_canvas", clipping=True)
+        rendered = []
+        for i in range(5000):
+            widget = TextWidget(f"line{i}", text=f"Line {i}")
+            original = widget.render
+            widget.render = lambda w=widget, r=original: (rendered.append(w), r())
+            canvas.add_widget(widget)
+
+        for _ in range(2):
+            rendered.clear()
+            imgui.new_frame()
+            canvas.render()
+            imgui.render()
+
+        assert 0 < len(rendered) < 200
+        assert canvas.serialize()["clipping"] is True
+
+
+class TestCommandModel:
+    """Tests for the single-writer command model."""
+
+    def test_concurrent_mutations_applied_on_render_thread(self, canvas):
+        """Test that mutations from many threads are applied by the renderer."""
+        stop = threading.Event()
+        writer_threads = set()
+
+        def render_loop():
+            while not stop.is_set():
+                canvas.process_commands()
+                for widget in canvas.widget_registry.render_list():
+                    assert widget.state.visible
+                time.sleep(0.001)
+            canvas.process_commands()
+
+        original_add = canvas._add_widget
+
+        def tracking_add(widget, parent_id):
+            writer_threads.add(threading.current_thread().name)
+            original_add(widget, parent_id)
+
+        canvas._add_widget = tracking_add
+        renderer = threading.Thread(target=render_loop, name="renderer")
+        canvas._render_thread = renderer
+        canvas._running = True
+        renderer.start()
+
+        def agent(n):
+            for i in range(50):
+                canvas.add_widget(TextWidget(f"w{n}_{i}", text="x"))
+                canvas.serialize()
+
+        agents = [threading.Thread(target=agent, args=(n,)) for n in range(4)]
+        for thread in agents:
+            thread.start()
+        for thread in agents:
+            thread.join()
+
+        stop.set()
+        renderer.join()
+        canvas._running = False
+
+        assert len(canvas.state.widgets) == 200
+        assert len(canvas.snapshot_widgets()) == 200
+        assert writer_threads == {"renderer"}
+
+    def test_timed_out_command_never_runs(self, canvas, button_widget):
+        """Test that a command withdrawn after a timeout is skipped later."""
+        canvas._render_thread = threading.Thread(target=lambda: None)
+        canvas._running = True
+
+        with pytest.raises(TimeoutError):
+            canvas.execute_command(
+                lambda: canvas._add_widget(button_widget, None), timeout=0.01
+            )
+        with pytest.raises(TimeoutError):
+            asyncio.run(canvas.execute_command_async(canvas.clear, timeout=0.01))
+        canvas.process_commands()
+        canvas._running = False
+
+        assert canvas.get_widget("test_button") is None
+        assert canvas.changes.revision == 0
+
+    def test_inline_when_not_running(self, canvas, button_widget):
+        """Test that mutations apply immediately on a stopped canvas."""
+        canvas.add_widget(button_widget)
+        assert canvas.get_widget("test_button") is button_widget
+        assert canvas.execute_command(lambda: 42) == 42
+
+
+class TestAsyncCanvas:
+    """Tests for async canvas startup and commands."""
+
+    @staticmethod
+    def _fake_render_thread(canvas, stop, startup_delay=0.0):
+        """Start a thread that processes commands like the render loop."""
+
+        def render_loop():
+            time.sleep(startup_delay)
+            while not stop.is_set():
+                canvas._frame()
+                time.sleep(0.005)
+
+        thread = threading.Thread(target=render_loop, name="renderer")
+        canvas._render_thread = thread
+        canvas._running = True
+        canvas.render = lambda: None
+        thread.start()
+        return thread
+
+    async def test_wait_until_ready_does_not_block_loop(self, canvas):
+        """Test that awaiting readiness lets other coroutines run."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not canvas._ready.is_set():
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        stop = threading.Event()
+        tick_task = asyncio.create_task(ticker())
+        thread = self._fake_render_thread(canvas, stop, startup_delay=0.05)
+
+        assert await canvas.wait_until_ready_async(timeout=2.0)
+        await tick_task
+        stop.set()
+        thread.join()
+
+        assert ticks > 0
+
+    async def test_execute_command_async(self, canvas, button_widget):
+        """Test that async commands run on the render thread."""
+        stop = threading.Event()
+        thread = self._fake_render_thread(canvas, stop)
+
+        await canvas.add_widget_async(button_widget)
+        name = await canvas.execute_command_async(
+            lambda: threading.current_thread().name
+        )
+        with pytest.raises(ZeroDivisionError):
+            await canvas.execute_command_async(lambda: 1 / 0)
+
+        stop.set()
+        thread.join()
+
+        assert name == "renderer"
+        assert canvas.get_widget("test_button") is button_widget
+
+    async def test_create_canvas_async_without_start(self, canvas_manager):
+        """Test async canvas creation without auto-start."""
+        canvas = await canvas_manager.create_canvas_async("c1", auto_start=False)
+        assert canvas_manager.get_canvas("c1") is canvas
+        assert not canvas._running
+
+    async def test_create_canvas_async_start_failure(self, canvas_manager, monkeypatch):
+        """Test that a canvas that fails to start is reported and removed."""
+
+        async def failed_start(self, timeout=5.0):
+            return False
+
+        monkeypatch.setattr(Canvas, "start_async", failed_start)
+        with pytest.raises(RuntimeError, match="failed to start"):
+            await canvas_manager.create_canvas_async("c1", auto_start=True)
+        assert canvas_manager.get_canvas("c1") is None
@@ -0,0 +1,171 @@
+"""Unit tests for canvas revisions and change sync."""
+
+import copy
+
+import numpy as np
+
+from champi_gen_ui.core.changes import ChangeLog
+from champi_gen_ui.widgets.basic import TextWidget, VirtualListWidget
+from champi_gen_ui.widgets.container import WindowWidget
+from champi_gen_ui.widgets.plotting import LineChartWidget, RealtimePlotWidget
+
+
+def apply_patch(state, patch):
+    """Apply change log operations to a copy of a serialized canvas state."""
+    state = copy.deepcopy(state)
+    for operation in patch:
+        *parents, last = [
+            part.replace("~1", "/").replace("~0", "~")
+            for part in operation["path"].split("/")[1:]
+        ]
+        target = state
+        for part in parents:
+            target = target[part]
+        if operation["op"] == "remove":
+            del target[last]
+        elif operation["op"] == "extend":
+            target[last].extend(operation["value"])
+        else:
+            target[last] = operation["value"]
+    return state
+
+
+class TestCanvasChanges:
+    """Tests for the revisioned change log of a canvas."""
+
+    def test_patch_reproduces_state(self, canvas, button_widget):
+        """Test that applying the patch turns the old state into the new one."""
+        canvas.add_widget(button_widget)
+        canvas.add_widget(TextWidget("a/b~c", text="odd id"))
+        chart = LineChartWidget("chart", x_data=[0.0, 1.0], y_data=[5.0, 6.0])
+        canvas.add_widget(chart)
+        before = canvas.serialize()
+
+        button_widget.update(label="Go")
+        button_widget.set_visible(False)
+        canvas.get_widget("a/b~c").update(text="renamed")
+        chart.append_data([2.0, 3.0], [7.0, 8.0])
+        canvas.add_widget(WindowWidget("win"))
+        canvas.set_widget_parent("test_button", "win")
+        canvas.add_widget(TextWidget("note", text="inside"), parent_id="win")
+        canvas.add_widget(TextWidget("temp", text="gone soon"))
+        canvas.remove_widget("temp")
+        canvas.update_properties(title="Synced", size=(800, 600))
+
+        result = canvas.get_changes(before["revision"])
+        after = canvas.serialize()
+
+        assert not result["full"]
+        assert result["revision"] == after["revision"]
+        applied = apply_patch(before, result["patch"])
+        applied["revision"] = result["revision"]
+        assert applied == after
+        assert {
+            "op": "extend",
+            "path": "/widgets/chart/properties/y_data",
+            "value": [7.0, 8.0],
+        } in result["patch"]
+        assert not any("temp" in op["path"] for op in result["patch"])
+
+    def test_repeated_writes_coalesce(self, canvas, button_widget):
+        """Test that only the last write to a property is sent."""
+        canvas.add_widget(button_widget)
+        revision = canvas.serialize()["revision"]
+        for i in range(100):
+            button_widget.update(label=f"Label {i}")
+
+        result = canvas.get_changes(revision)
+
+        assert result["revision"] == revision + 100
+        assert result["patch"] == [
+            {
+                "op": "add",
+                "path": "/widgets/test_button/properties/label",
+                "value": "Label 99",
+            }
+        ]
+        assert canvas.get_changes(result["revision"])["patch"] == []
+
+    def test_new_widget_sent_whole(self, canvas):
+        """Test that a widget added since the revision is not patched twice."""
+        revision = canvas.serialize()["revision"]
+        chart = LineChartWidget("chart", x_data=[0.0], y_data=[1.0])
+        canvas.add_widget(chart)
+        chart.append_data([1.0], [2.0])
+
+        patch = canvas.get_changes(revision)["patch"]
+
+        assert [op["op"] for op in patch] == ["add"]
+        assert patch[0]["value"]["properties"]["y_data"] == [1.0, 2.0]
+
+    def test_list_and_realtime_mutations_recorded(self, canvas):
+        """Test that appended list items and realtime points reach the patch."""
+        items = ["a"]
+        rows = VirtualListWidget("rows", items=items)
+        plot = RealtimePlotWidget("rt", max_points=3, data=[1.0])
+        canvas.add_widget(rows)
+        canvas.add_widget(plot)
+        before = canvas.serialize()
+        assert before["widgets"]["rt"]["properties"]["data"] == [1.0]
+
+        rows.append_items(["b", "c"])
+        plot.append_data(y=[2.0, 3.0, 4.0])
+        middle = canvas.serialize()
+        plot.add_point(5.0)
+        plot.update(max_points=2)
+
+        for revision, state in (
+            (before["revision"], before),
+            (middle["revision"], middle),
+        ):
+            result = canvas.get_changes(revision)
+            applied = apply_patch(state, result["patch"])
+            applied["revision"] = result["revision"]
+            assert applied == canvas.serialize()
+        assert items == ["a"]
+        assert {
+            "op": "extend",
+            "path": "/widgets/rows/properties/items",
+            "value": ["b", "c"],
+        } in canvas.get_changes(before["revision"])["patch"]
+
+        plot.clear_points()
+        assert canvas.get_changes(middle["revision"])["patch"][-1] == {
+            "op": "replace",
+            "path": "/widgets/rt/properties/data",
+            "value": [],
+        }
+
+    def test_falls_back_to_full_state(self, canvas, button_widget):
+        """Test full snapshots for truncated logs and unknown revisions."""
+        canvas.changes = canvas.widget_registry.changes = ChangeLog(capacity=4)
+        canvas.add_widget(button_widget)
+        for i in range(10):
+            button_widget.update(label=f"Label {i}")
+
+        truncated = canvas.get_changes(1)
+        assert truncated["full"]
+        assert truncated["revision"] == 11
+        assert truncated["state"] == canvas.serialize()
+
+        assert not canvas.get_changes(7)["full"]
+        assert canvas.get_changes(12)["full"]
+
+    def test_retained_values_bounded(self, canvas):
+        """Test that replaced arrays are released and the log is byte-bounded."""
+        canvas.changes = canvas.widget_registry.changes = ChangeLog(max_bytes=100_000)
+        chart = LineChartWidget("chart", x_data=[0.0], y_data=[0.0])
+        canvas.add_widget(chart)
+        start = canvas.serialize()["revision"]
+
+        for i in range(50):
+            chart.update(y_data=np.full(1000, float(i)))
+        assert canvas.changes.retained_bytes == 8000
+        patch = canvas.get_changes(start)["patch"]
+        assert [op["value"][0] for op in patch] == [49.0]
+
+        for _ in range(20):
+            chart.append_data(np.zeros(1000), np.ones(1000))
+        assert canvas.changes.retained_bytes <= 100_000
+        assert canvas.get_changes(start)["full"]
+        assert not canvas.get_changes(canvas.changes.revision - 1)["full"]
@@ -0,0 +1,134 @@
+"""Unit tests for widget interaction event subscriptions."""
+
+import asyncio
+import threading
+
+import pytest
+
+from champi_gen_ui.core.canvas import Canvas
+from champi_gen_ui.core.events import EventHub
+from champi_gen_ui.widgets.basic import ButtonWidget
+from champi_gen_ui.widgets.slider import SliderFloatWidget
+
+
+@pytest.fixture
+def hub():
+    """Create an event hub connected to the widget signals."""
+    return EventHub()
+
+
+class TestEventSubscriptions:
+    """Tests for coalescing, filtering and backpressure."""
+
+    def test_events_coalesce(self, hub, canvas, button_widget):
+        """Test that clicks are counted and changes keep the latest value."""
+        slider = SliderFloatWidget("slider")
+        canvas.add_widget(button_widget)
+        canvas.add_widget(slider)
+        subscription = hub.subscribe(canvas)
+
+        for _ in range(3):
+            button_widget.trigger_callback("on_click")
+        for value in (0.25, 0.5, 0.75):
+            slider._set_edited("value", value)
+
+        drained = subscription.drain()
+        events = [
+            {k: v for k, v in e.items() if k != "timestamp"} for e in drained["events"]
+        ]
+        assert events == [
+            {"type": "click", "widget_id": "test_button", "count": 3},
+            {
+                "type": "change",
+                "widget_id": "slider",
+                "property": "value",
+                "value": 0.75,
+                "count": 3,
+            },
+        ]
+        assert subscription.drain() == {"events": [], "dropped": 0, "pending": 0}
+
+    def test_filters(self, hub, canvas, button_widget):
+        """Test filtering by canvas, widget and event type."""
+        other_canvas = Canvas("other")
+        other_button = ButtonWidget("test_button")
+        other_canvas.add_widget(other_button)
+        canvas.add_widget(button_widget)
+        canvas.add_widget(ButtonWidget("ignored"))
+        subscription = hub.subscribe(canvas, widget_ids=["test_button"])
+        changes_only = hub.subscribe(canvas, event_types=["change"])
+
+        other_button.trigger_callback("on_click")
+        canvas.get_widget("ignored").trigger_callback("on_click")
+        button_widget.trigger_callback("on_click")
+        button_widget.trigger_callback("on_hover")
+
+        assert [e["widget_id"] for e in subscription.drain()["events"]] == [
+            "test_button"
+        ]
+        assert changes_only.drain()["events"] == []
+        with pytest.raises(ValueError, match="Unknown event types"):
+            hub.subscribe(canvas, event_types=["scroll"])
+
+    def test_backpressure(self, hub, canvas):
+        """Test that a full queue drops events and notifies once per drain."""
+        notified = []
+        subscription = hub.subscribe(
+            canvas, max_pending=2, notify=lambda: notified.append(True)
+        )
+        for i in range(5):
+            button = ButtonWidget(f"b{i}")
+            canvas.add_widget(button)
+            button.trigger_callback("on_click")
+            button.trigger_callback("on_click")
+
+        assert len(notified) == 1
+        first = subscription.drain(max_events=1)
+        assert [e["widget_id"] for e in first["events"]] == ["b0"]
+        assert (first["dropped"], first["pending"]) == (6, 1)
+        subscription.drain()
+
+        canvas.get_widget("b4").trigger_callback("on_click")
+        assert len(notified) == 2
+
+    def test_notify_built_from_subscription_id(self, hub, canvas, button_widget):
+        """Test that a notify factory gets the ID before any event can arrive."""
+        canvas.add_widget(button_widget)
+        built = []
+        notified = []
+
+        def factory(subscription_id):
+            built.append(subscription_id)
+            assert hub.get(subscription_id) is None
+            return lambda: notified.append(subscription_id)
+
+        subscription = hub.subscribe(canvas, notify_factory=factory)
+        button_widget.trigger_callback("on_click")
+
+        assert built == notified == [subscription.subscription_id]
+
+    async def test_wait_wakes_on_event(self, hub, canvas, button_widget):
+        """Test that a waiting consumer wakes when another thread publishes."""
+        canvas.add_widget(button_widget)
+        subscription = hub.subscribe(canvas)
+
+        assert not await subscription.wait(0.01)
+        timer = threading.Timer(
+            0.05, lambda: button_widget.trigger_callback("on_click")
+        )
+        timer.start()
+        assert await asyncio.wait_for(subscription.wait(5.0), 1.0)
+        timer.join()
+        assert subscription.drain()["events"][0]["type"] == "click"
+
+    def test_removed_canvas_drops_subscriptions(self, hub, canvas_manager):
+        """Test that removing a canvas ends the subscriptions to it."""
+        canvas = canvas_manager.create_canvas("watched", auto_start=False)
+        other = canvas_manager.create_canvas("other", auto_start=False)
+        watched = hub.subscribe(canvas)
+        kept = hub.subscribe(other)
+
+        canvas_manager.remove_canvas("watched")
+
+        assert hub.list() == [kept.subscription_id]
+        assert hub.get(watched.subscription_id) is None
@@ -0,0 +1,111 @@
+"""Unit tests for the headless rendering backend."""
+
+import zlib
+
+import numpy as np
+import pytest
+from imgui_bundle import imgui
+
+from champi_gen_ui.core.canvas import Canvas
+from champi_gen_ui.core.headless import HeadlessBackend, encode_png
+from champi_gen_ui.widgets.basic import ButtonWidget
+
+
+class TestHeadlessBackend:
+    """Tests for offscreen frames and software rasterization."""
+
+    def test_capture_rasterizes_window(self):
+        """Test that a captured frame contains the drawn window."""
+        backend = HeadlessBackend((320, 240))
+        backend.start()
+        try:
+            for _ in range(2):
+                with backend.frame(1 / 60):
+                    imgui.set_next_window_pos(imgui.ImVec2(10, 10))
+                    imgui.set_next_window_size(imgui.ImVec2(200, 100))
+                    imgui.begin("Window")
+                    imgui.text("Hello")
+                    imgui.end()
+
+            future = backend.request_capture()
+            with backend.frame(1 / 60):
+                imgui.set_next_window_pos(imgui.ImVec2(10, 10))
+                imgui.set_next_window_size(imgui.ImVec2(200, 100))
+                imgui.begin("Window")
+                imgui.text("Hello")
+                imgui.end()
+            rgba = future.result(timeout=1.0)
+        finally:
+            backend.shutdown()
+
+        assert rgba.shape == (240, 320, 4)
+        assert rgba.dtype == np.uint8
+        # Window background is drawn, the area outside it stays clear
+        assert rgba[20:100, 20:200, :3].any()
+        assert not rgba[150:, 250:, :3].any()
+
+    def test_shutdown_fails_pending_captures(self):
+        """Test that stopping the backend releases waiting captures."""
+        backend = HeadlessBackend((64, 64))
+        backend.start()
+        future = backend.request_capture()
+        backend.shutdown()
+
+        with pytest.raises(RuntimeError, match="stopped"):
+            future.result(timeout=1.0)
+
+    def test_encode_png(self):
+        """Test PNG framing and pixel payload."""
+        rgba = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+        png = encode_png(rgba)
+
+        assert png.startswith(b"\x89PNG\r\n\x1a\n")
+        assert png[12:16] == b"IHDR"
+        idat = png.index(b"IDAT")
+        length = int.from_bytes(png[idat - 4 : idat], "big")
+        rows = zlib.decompress(png[idat + 4 : idat + 4 + length])
+        assert rows == b"\x00" + rgba[0].tobytes() + b"\x00" + rgba[1].tobytes()
+
+
+class TestHeadlessCanvas:
+    """Tests for running canvases offscreen."""
+
+    def test_run_and_capture(self):
+        """Test capturing frames from a running headless canvas."""
+        canvas = Canvas("headless", width=320, height=240, headless=True)
+        assert canvas.run_async(timeout=5.0)
+        try:
+            canvas.add_widget(ButtonWidget("btn", label="Press"))
+            png = canvas.capture_frame("png")
+            raw = canvas.capture_frame("rgba")
+        finally:
+            canvas.stop()
+            canvas._render_thread.join(timeout=5.0)
+
+        assert png.startswith(b"\x89PNG")
+        assert len(raw) == 320 * 240 * 4
+        assert not canvas._running
+        assert canvas.serialize()["headless"] is True
+
+    async def test_capture_async(self):
+        """Test async capture from a headless canvas."""
+        canvas = Canvas("headless_async", width=160, height=120, headless=True)
+        assert await canvas.start_async(timeout=5.0)
+        try:
+            raw = await canvas.capture_frame_async("rgba")
+        finally:
+            canvas.stop()
+            canvas._render_thread.join(timeout=5.0)
+
+        assert len(raw) == 160 * 120 * 4
+
+    def test_capture_requires_headless(self, canvas):
+        """Test that windowed or stopped canvases reject captures."""
+        with pytest.raises(RuntimeError, match="not headless"):
+            canvas.capture_frame()
+
+        headless = Canvas("stopped", headless=True)
+        with pytest.raises(RuntimeError, match="not running"):
+            headless.capture_frame()
+        with pytest.raises(ValueError, match="format"):
+            headless.capture_frame("jpeg")
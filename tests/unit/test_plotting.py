@@ -0,0 +1,238 @@
+"""Unit tests for plotting widgets."""
+
+import numpy as np
+import pytest
+from imgui_bundle import imgui, implot
+
+from champi_gen_ui.core.lod import MinMaxPyramid, decimate_scatter
+from champi_gen_ui.widgets.plotting import (
+    BarChartWidget,
+    CandlestickChartWidget,
+    ErrorBarsWidget,
+    HeatmapWidget,
+    LineChartWidget,
+    RealtimePlotWidget,
+    ScatterPlotWidget,
+)
+
+
+def render_frame(widget):
+    """Render one widget inside a window for a single frame."""
+    imgui.new_frame()
+    imgui.begin("plots")
+    widget.render()
+    imgui.end()
+    imgui.render()
+
+
+class TestRealtimePlotWidget:
+    """Tests for the ring-buffer backed realtime plot."""
+
+    def test_ring_buffer_keeps_latest_points(self):
+        """Test that single and bulk appends wrap around in order."""
+        plot = RealtimePlotWidget("rt", max_points=5)
+        for value in range(3):
+            plot.add_point(value)
+        np.testing.assert_array_equal(plot.get_data(), [0, 1, 2])
+
+        plot.add_points(np.arange(3, 7))
+        np.testing.assert_array_equal(plot.get_data(), [2, 3, 4, 5, 6])
+
+        plot.add_points(range(100))
+        np.testing.assert_array_equal(plot.get_data(), [95, 96, 97, 98, 99])
+
+    def test_update_and_serialize(self):
+        """Test replacing data and resizing through update."""
+        plot = RealtimePlotWidget("rt", max_points=4, data=[1, 2, 3])
+        plot.update(max_points=2)
+        np.testing.assert_array_equal(plot.get_data(), [2, 3])
+
+        plot.update(data=[7, 8, 9])
+        assert plot.serialize()["properties"]["data"] == [8.0, 9.0]
+        assert "data" not in plot.state.properties
+
+        with pytest.raises(ValueError, match="max_points"):
+            plot.update(max_points=0)
+
+    def test_render_passes_buffer_with_offset(self, implot_context, monkeypatch):
+        """Test that rendering hands ImPlot the ring buffer without copying."""
+        plot = RealtimePlotWidget("rt", max_points=8)
+        calls = []
+        original = implot.plot_line
+
+        def recording_plot_line(label, values, spec=None):
+            calls.append((values, spec.offset))
+            original(label, values, spec=spec)
+
+        monkeypatch.setattr(implot, "plot_line", recording_plot_line)
+
+        plot.add_points(range(5))
+        render_frame(plot)
+        plot.add_points(range(5, 11))
+        render_frame(plot)
+
+        partial, full = calls
+        assert np.shares_memory(partial[0], plot._buffer)
+        assert len(partial[0]) == 5 and partial[1] == 0
+        assert full[0] is plot._buffer and full[1] == 3
+
+
+class TestPlotArrays:
+    """Tests for array-backed plot data."""
+
+    def test_data_converted_once_on_set(self):
+        """Test that lists become contiguous arrays and floats pass through."""
+        chart = LineChartWidget("line", x_data=[0, 1, 2], y_data=[1, 4, 9])
+        x_data = chart.state.properties["x_data"]
+        assert x_data.dtype == np.float64 and x_data.flags.c_contiguous
+
+        ys = np.linspace(0, 1, 3, dtype=np.float32)
+        chart.update(y_data=ys)
+        assert chart.state.properties["y_data"] is ys
+
+        strided = np.arange(6, dtype=np.float64)[::2]
+        chart.update(x_data=strided)
+        assert chart.state.properties["x_data"].flags.c_contiguous
+        assert chart.serialize()["properties"]["x_data"] == [0.0, 2.0, 4.0]
+
+    def test_heatmap_renders_matrix(self, implot_context, monkeypatch):
+        """Test that the heatmap hands ImPlot its 2D array unchanged."""
+        heatmap = HeatmapWidget("heat", values=[[0, 1], [2, 3], [4, 5]])
+        values = heatmap.state.properties["values"]
+        assert values.shape == (3, 2)
+        with pytest.raises(ValueError, match="2D"):
+            heatmap.update(values=[1, 2, 3])
+
+        calls = []
+        monkeypatch.setattr(
+            implot, "plot_heatmap", lambda label, data, *args: calls.append(data)
+        )
+        render_frame(heatmap)
+        assert len(calls) == 1 and calls[0] is values
+
+    def test_candlestick_renders(self, implot_context):
+        """Test that candlesticks draw into the plot without error."""
+        chart = CandlestickChartWidget(
+            "ohlc",
+            dates=[1, 2, 3],
+            opens=[10, 12, 11],
+            highs=[13, 14, 12],
+            lows=[9, 11, 10],
+            closes=[12, 11, 11.5],
+        )
+        render_frame(chart)
+        render_frame(chart)
+
+
+class TestLevelOfDetail:
+    """Tests for LOD decimation of large series."""
+
+    def test_pyramid_bounds_points_and_keeps_extremes(self):
+        """Test that a selection is bounded by pixels and keeps the envelope."""
+        xs = np.arange(1_000_000, dtype=np.float64)
+        ys = np.cumsum(np.random.default_rng(0).standard_normal(xs.size))
+        pyramid = MinMaxPyramid(xs, ys)
+
+        for x_min, x_max in [(0, 1e6), (2e5, 3e5), (-50, 5e6)]:
+            sel_x, sel_y = pyramid.select(x_min, x_max, 800)
+            visible = ys[(xs >= x_min) & (xs <= x_max)]
+            assert len(sel_x) <= 8 * 800 + 4
+            assert sel_y.max() == visible.max() and sel_y.min() == visible.min()
+            assert (np.diff(sel_x) >= 0).all()
+
+        sel_x, _ = pyramid.select(100, 900, 800)
+        assert np.shares_memory(sel_x, xs) and sel_x[0] == 99 and sel_x[-1] == 901
+
+    def test_scatter_one_point_per_pixel(self):
+        """Test that scatter decimation keeps one point per occupied cell."""
+        rng = np.random.default_rng(0)
+        xs, ys = rng.random(200_000), rng.random(200_000)
+        sel_x, sel_y = decimate_scatter(xs, ys, (0, 1, 0, 1), (100, 50))
+        assert 4000 < len(sel_x) <= 101 * 51
+        cells = np.floor(sel_x * 100) * 51 + np.floor(sel_y * 50)
+        assert len(np.unique(cells)) == len(cells)
+
+    def test_widgets_decimate_once_per_view(self, implot_context, monkeypatch):
+        """Test that decimation is cached until the data or view changes."""
+        xs = np.arange(100_000, dtype=np.float64)
+        line = LineChartWidget("line", x_data=xs, y_data=np.sin(xs / 100))
+        scatter = ScatterPlotWidget("scatter", x_data=xs, y_data=np.cos(xs / 20_000))
+        calls = []
+        for name in ("plot_line", "plot_scatter"):
+            original = getattr(implot, name)
+            monkeypatch.setattr(
+                implot,
+                name,
+                lambda label, x, y, f=original: (calls.append(x), f(label, x, y)),
+            )
+
+        for _ in range(3):
+            render_frame(line)
+            render_frame(scatter)
+        line_calls, scatter_calls = calls[0::2], calls[1::2]
+        assert all(len(x) < 2000 for x in calls)
+        assert line_calls[1] is line_calls[2]
+        assert scatter_calls[1] is scatter_calls[2]
+
+        line.update(lod=False)
+        calls.clear()
+        render_frame(line)
+        assert len(calls[0]) == xs.size
+
+
+class TestAppendData:
+    """Tests for incremental appends to plot series."""
+
+    def test_append_grows_views_in_place(self):
+        """Test that appends reuse one growing buffer per property."""
+        chart = LineChartWidget("line", x_data=[0, 1], y_data=[5, 6])
+        assert chart.append_data([2, 3], [7, 8]) == 4
+        buffer = chart.state.properties["x_data"].base
+        assert chart.append_data(np.arange(4, 10), np.arange(4, 10)) == 10
+        assert chart.state.properties["x_data"].base is buffer
+        np.testing.assert_array_equal(chart.state.properties["x_data"], range(10))
+        assert chart.serialize()["properties"]["y_data"][:4] == [5, 6, 7, 8]
+
+        chart.update(x_data=[1], y_data=[2])
+        assert chart.append_data([3], [4]) == 2
+        np.testing.assert_array_equal(chart.state.properties["y_data"], [2, 4])
+
+    def test_append_validation(self):
+        """Test that appends check the series shape for the widget type."""
+        bars = BarChartWidget("bars", values=[1])
+        assert bars.append_data(y=[2, 3]) == 3
+        with pytest.raises(ValueError, match="y values only"):
+            bars.append_data([0], [1])
+
+        chart = LineChartWidget("line")
+        with pytest.raises(ValueError, match="2 x values and 1 y values"):
+            chart.append_data([0, 1], [1])
+        with pytest.raises(ValueError, match="does not support"):
+            ErrorBarsWidget("err").append_data([0], [1])
+
+        realtime = RealtimePlotWidget("rt", max_points=3)
+        assert realtime.append_data(y=[1, 2, 3, 4]) == 3
+        np.testing.assert_array_equal(realtime.get_data(), [2, 3, 4])
+
+    def test_pyramid_extends_like_rebuild(self, implot_context):
+        """Test that appended points extend the LOD pyramid incrementally."""
+        rng = np.random.default_rng(0)
+        xs = np.arange(300_000, dtype=np.float64)
+        ys = rng.standard_normal(xs.size)
+        chart = LineChartWidget("line", x_data=xs[:100_000], y_data=ys[:100_000])
+        render_frame(chart)
+        pyramid = chart._lod.pyramid
+
+        start = 100_000
+        for stop in (100_017, 150_000, 300_000):
+            chart.append_data(xs[start:stop], ys[start:stop])
+            render_frame(chart)
+            start = stop
+        assert chart._lod.pyramid is pyramid
+
+        rebuilt = MinMaxPyramid(xs, ys)
+        assert len(pyramid.levels) == len(rebuilt.levels)
+        for level, expected in zip(pyramid.levels, rebuilt.levels, strict=True):
+            np.testing.assert_array_equal(
+                level.ys[: level.count], expected.ys[: expected.count]
+            )
@@ -0,0 +1,93 @@
+"""Unit tests for the frame profiler."""
+
+import time
+
+from imgui_bundle import imgui
+
+from champi_gen_ui.core.profiler import WIDGETS_PER_SAMPLE, FrameProfiler
+from champi_gen_ui.widgets.basic import TextWidget
+from champi_gen_ui.widgets.container import WindowWidget
+
+
+def run_frames(canvas, count=1):
+    """Run canvas frames against the test ImGui context."""
+    canvas._running = True
+    try:
+        for _ in range(count):
+            imgui.new_frame()
+            canvas._frame()
+            imgui.render()
+    finally:
+        canvas._running = False
+
+
+class TestFrameProfiler:
+    """Tests for canvas frame profiling."""
+
+    def test_disabled_by_default(self, canvas):
+        """Test that metrics report profiling as off."""
+        assert canvas.profiler is None
+        assert canvas.get_metrics() == {"enabled": False}
+
+    def test_widget_times_are_exclusive(self, canvas, imgui_context):
+        """Test that a slow child is charged to itself, not its container."""
+        slow = TextWidget("slow", text="Slow")
+        original = slow.render
+        slow.render = lambda: (time.sleep(0.005), original())
+        canvas.add_widget(WindowWidget("win", title="Win"))
+        canvas.add_widget(slow, parent_id="win")
+        canvas.enable_profiling()
+
+        run_frames(canvas, 3)
+        metrics = canvas.get_metrics()
+
+        assert metrics["enabled"] is True
+        assert metrics["frames"] == 3
+        assert metrics["widget_count"] == 2
+        assert metrics["widgets_rendered"] == 2
+        types = {entry["name"]: entry["mean_ms"] for entry in metrics["widget_types"]}
+        assert types["TextWidget"] >= 4.0
+        assert types["WindowWidget"] < types["TextWidget"]
+        assert metrics["widgets"][0]["name"] == "slow"
+        assert metrics["frame_ms"]["max"] >= types["TextWidget"]
+
+    def test_ring_buffer_and_commands(self, canvas, imgui_context):
+        """Test that only the last frames are kept and drains are recorded."""
+        canvas.enable_profiling(capacity=4)
+        for _ in range(3):
+            canvas.queue_command(lambda: None)
+
+        run_frames(canvas, 10)
+
+        samples = canvas.profiler.samples()
+        assert len(samples) == 4
+        assert canvas.get_metrics(frames=2)["frames"] == 2
+        assert sum(s.commands for s in samples) == 0
+
+        canvas.profiler.reset()
+        canvas.queue_command(lambda: None)
+        run_frames(canvas)
+        assert canvas.get_metrics()["commands"] == 1
+
+    def test_overlay_and_disable(self, canvas, text_widget, imgui_context):
+        """Test drawing the overlay and turning profiling off."""
+        canvas.add_widget(text_widget)
+        canvas.enable_profiling(overlay=True)
+        run_frames(canvas, 3)
+
+        canvas.disable_profiling()
+        assert canvas.widget_registry.profiler is None
+        run_frames(canvas)
+        assert canvas.get_metrics() == {"enabled": False}
+
+    def test_keeps_slowest_widgets_per_frame(self):
+        """Test that per-widget detail is trimmed to the slowest widgets."""
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        for i in range(WIDGETS_PER_SAMPLE * 2):
+            profiler._current.widget_ms[f"w{i}"] = float(i)
+        profiler.end_frame(widget_count=WIDGETS_PER_SAMPLE * 2)
+
+        (sample,) = profiler.samples()
+        assert len(sample.widget_ms) == WIDGETS_PER_SAMPLE
+        assert min(sample.widget_ms.values()) == WIDGETS_PER_SAMPLE
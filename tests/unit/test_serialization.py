@@ -0,0 +1,244 @@
+"""Unit tests for UI serialization."""
+
+import io
+import json
+import math
+
+import pytest
+
+from champi_gen_ui.core.canvas import Canvas
+from champi_gen_ui.core.codegen import CodeGenerator, MarkupGenerator
+from champi_gen_ui.core.serialization import (
+    TemplateManager,
+    UISerializer,
+    _JsonStream,
+)
+from champi_gen_ui.widgets import SliderProgressBarWidget, WindowWidget
+from champi_gen_ui.widgets.basic import ButtonWidget, TextWidget
+
+
+class TrickleReader(io.StringIO):
+    """Text stream that returns only a few characters per read."""
+
+    def read(self, size=-1):
+        return super().read(7)
+
+
+def expected_document(canvas):
+    """Build the document the streaming writer should produce."""
+    return {
+        "type": "canvas",
+        "id": canvas.state.canvas_id,
+        "state": {
+            "title": canvas.state.title,
+            "width": canvas.state.size[0],
+            "height": canvas.state.size[1],
+            "mode": canvas.state.mode.value,
+        },
+        "widgets": [
+            UISerializer.serialize_widget(w) for w in canvas.snapshot_widgets()
+        ],
+        "metadata": {"version": "1.0.0", "created_with": "champi-gen-ui"},
+    }
+
+
+class TestStreamingJson:
+    """Tests for the streaming JSON writer and reader."""
+
+    def test_writer_matches_json_dumps(self, canvas):
+        """Test that streamed output is byte-identical to json.dumps."""
+        assert "".join(UISerializer.iter_canvas_json(canvas, indent=2)) == (
+            json.dumps(expected_document(canvas), indent=2)
+        )
+
+        canvas.add_widget(ButtonWidget("ok", label="OK\nnow"))
+        canvas.add_widget(TextWidget("text", text="Hello"))
+        document = expected_document(canvas)
+        for indent in (None, 2, 4):
+            text = "".join(UISerializer.iter_canvas_json(canvas, indent))
+            assert text == json.dumps(document, indent=indent)
+
+    def test_reader_creates_widgets_while_parsing(self, canvas, canvas_manager):
+        """Test a round trip through a stream delivering a few bytes per read."""
+        canvas.add_widget(ButtonWidget("ok", label="OK"))
+        canvas.add_widget(TextWidget("text", text="x" * 1000))
+        output = io.StringIO()
+        UISerializer.dump_canvas(canvas, output, indent=2)
+
+        canvas_manager._auto_start = False
+        loaded = UISerializer.load_canvas(
+            TrickleReader(output.getvalue()), canvas_manager
+        )
+
+        assert loaded.state.size == canvas.state.size
+        assert [w.serialize() for w in loaded.snapshot_widgets()] == [
+            w.serialize() for w in canvas.snapshot_widgets()
+        ]
+
+    def test_canvas_started_after_widgets_added(
+        self, canvas, canvas_manager, monkeypatch
+    ):
+        """Test that loading fills the canvas before starting its render thread."""
+        for i in range(20):
+            canvas.add_widget(ButtonWidget(f"b{i}", label=str(i)))
+        document = UISerializer.serialize_canvas(canvas)
+        output = io.StringIO()
+        UISerializer.dump_canvas(canvas, output)
+
+        started = []
+        monkeypatch.setattr(
+            Canvas,
+            "run_async",
+            lambda self: started.append(len(self.widget_registry.list())),
+        )
+        UISerializer.load_canvas(io.StringIO(output.getvalue()), canvas_manager)
+        canvas_manager.remove_canvas(canvas.state.canvas_id)
+        UISerializer.deserialize_canvas(document, canvas_manager)
+
+        assert started == [20, 20]
+
+    def test_reader_buffers_one_item_at_a_time(self):
+        """Test that the reader's buffer stays bounded by the largest item."""
+        items = [{"id": i, "values": list(range(i % 50))} for i in range(2000)]
+        stream = _JsonStream(io.StringIO(json.dumps(items, indent=2)), chunk_size=64)
+
+        largest = max(len(json.dumps(item, indent=2)) for item in items)
+        peak = 0
+        decoded = []
+        for item in stream.array_items():
+            decoded.append(item)
+            peak = max(peak, len(stream.buffer))
+
+        assert decoded == items
+        assert peak <= 4 * largest + 64
+
+    def test_reader_rejects_widgets_before_state(self, canvas_manager):
+        """Test that a canvas is needed before widgets can be created."""
+        canvas_manager._auto_start = False
+        document = '{"widgets": [], "id": "c", "state": {}}'
+        with pytest.raises(ValueError, match="must precede"):
+            UISerializer.load_canvas(io.StringIO(document), canvas_manager)
+
+        document = (
+            '{"id": "c", "state": {"title": "C", "width": 10, "height": 10,'
+            ' "mode": "standard"}, "widgets": [{"truncated": '
+        )
+        with pytest.raises(json.JSONDecodeError):
+            UISerializer.load_canvas(io.StringIO(document), canvas_manager)
+        assert canvas_manager.get_canvas("c") is None
+
+
+class TestExporters:
+    """Tests for the exporters sharing the canvas and widget descriptions."""
+
+    @pytest.fixture
+    def populated(self, canvas):
+        """Add widgets with non-default state to the canvas."""
+        canvas.add_widget(WindowWidget("main-window", title="Main"))
+        canvas.add_widget(ButtonWidget("ok", label="OK"), "main-window")
+        canvas.add_widget(TextWidget("class", text='Say "hi"\n'))
+        canvas.add_widget(SliderProgressBarWidget("2nd", value=0.5))
+        canvas.get_widget("ok").set_position(10, 20)
+        canvas.get_widget("class").set_visible(False)
+        return canvas
+
+    def test_serialize_canvas(self, populated):
+        """Test that the canvas is serialized from its actual state."""
+        data = UISerializer.serialize_canvas(populated)
+
+        assert data == expected_document(populated)
+        assert data["widgets"][1]["state"]["parent"] == "main-window"
+        assert data["widgets"][3]["widget_type"] == "SliderProgressBarWidget"
+
+    def test_generated_code_rebuilds_canvas(self, populated):
+        """Test that generated Python code recreates the canvas and widgets."""
+        code = CodeGenerator.generate_canvas_code(populated)
+        assert "label='Button'" not in code
+
+        namespace = {}
+        exec(compile(code, "<generated>", "exec"), namespace)
+        rebuilt = namespace["create_ui"]()
+
+        assert rebuilt.state.size == populated.state.size
+        assert [
+            {k: v for k, v in w.items() if k != "callbacks"}
+            for w in UISerializer.serialize_canvas(rebuilt)["widgets"]
+        ] == [
+            {k: v for k, v in w.items() if k != "callbacks"}
+            for w in UISerializer.serialize_canvas(populated)["widgets"]
+        ]
+
+    def test_generated_code_with_non_finite_floats(self, canvas):
+        """Test that NaN and infinity are written as float() calls."""
+        slider = SliderProgressBarWidget("bar", value=float("inf"))
+        slider.set_position(float("nan"), 5.0)
+        canvas.add_widget(slider)
+
+        code = CodeGenerator.generate_canvas_code(canvas)
+        namespace = {}
+        exec(compile(code, "<generated>", "exec"), namespace)
+        rebuilt = namespace["create_ui"]().get_widget("bar")
+
+        assert rebuilt.state.properties["value"] == float("inf")
+        assert math.isnan(rebuilt.state.position[0])
+
+    def test_yaml(self, populated):
+        """Test the YAML specification."""
+        yaml = pytest.importorskip("yaml")
+
+        data = yaml.safe_load(MarkupGenerator.generate_yaml(populated))
+
+        assert data["canvas"]["width"] == populated.state.size[0]
+        assert data["widgets"][1] == {
+            "type": "ButtonWidget",
+            "id": "ok",
+            "position": [10, 20],
+            "parent": "main-window",
+            "properties": {"label": "OK"},
+        }
+
+    def test_toml(self, populated):
+        """Test the TOML specification."""
+        toml = pytest.importorskip("toml")
+
+        data = toml.loads(MarkupGenerator.generate_toml(populated))
+
+        assert data["canvas"]["id"] == populated.state.canvas_id
+        assert data["widgets"]["class"]["visible"] is False
+
+    def test_template_round_trip(self, populated, canvas_manager, tmp_path):
+        """Test saving a canvas as a template and loading it back."""
+        templates = TemplateManager(str(tmp_path))
+        assert templates.save_template("form", populated, "A form")
+
+        canvas_manager._auto_start = False
+        canvas_manager.remove_canvas(populated.state.canvas_id)
+        loaded = templates.load_template("form", canvas_manager)
+
+        assert [w.widget_id for w in loaded.snapshot_widgets()] == [
+            "main-window",
+            "ok",
+            "class",
+            "2nd",
+        ]
+        assert isinstance(loaded.get_widget("2nd"), SliderProgressBarWidget)
+        assert loaded.get_widget("ok").state.parent == "main-window"
+
+    async def test_template_loaded_then_started(
+        self, populated, canvas_manager, tmp_path, monkeypatch
+    ):
+        """Test loading a template unstarted and starting it without blocking."""
+        templates = TemplateManager(str(tmp_path))
+        assert templates.save_template("form", populated, "A form")
+        canvas_manager.remove_canvas(populated.state.canvas_id)
+
+        loaded = templates.load_template("form", canvas_manager, auto_start=False)
+        assert not loaded._running
+
+        async def failed_start(self, timeout=5.0):
+            return False
+
+        monkeypatch.setattr(Canvas, "start_async", failed_start)
+        with pytest.raises(RuntimeError, match="failed to start"):
+            await canvas_manager.start_canvas_async(loaded)
+        assert canvas_manager.get_canvas(populated.state.canvas_id) is None
@@ -0,0 +1,93 @@
+"""Unit tests for the binary snapshot format."""
+
+import numpy as np
+import pytest
+
+from champi_gen_ui.core import snapshot
+from champi_gen_ui.core.serialization import UISerializer
+from champi_gen_ui.widgets.basic import ButtonWidget
+from champi_gen_ui.widgets.plotting import HeatmapWidget, LineChartWidget
+
+
+def canvas_data(widgets, arrays=True):
+    """Build serialized canvas data around some widgets."""
+    return {
+        "type": "canvas",
+        "id": "snap",
+        "state": {"title": "Snap", "width": 640, "height": 480, "mode": "standard"},
+        "widgets": [UISerializer.serialize_widget(w, arrays) for w in widgets],
+    }
+
+
+class TestSnapshot:
+    """Tests for snapshot encoding and canvas round trips."""
+
+    def test_round_trip_preserves_types(self):
+        """Test that scalars, containers and arrays come back unchanged."""
+        data = {
+            "ints": [0, 127, 128, -32, -33, 2**40, -(2**63), 2**64 - 1],
+            "floats": [0.5, -1e300],
+            "flags": [None, True, False],
+            "text": ["", "x" * 40, "é" * 200],
+            "raw": b"\x00" * 300,
+            "tuples": (1, (2.0, "three"), [4]),
+            "matrix": np.arange(12, dtype=np.float32).reshape(3, 4),
+            "empty": np.array([], dtype=np.int16),
+            "big": {str(i): i for i in range(70_000)},
+        }
+
+        restored = snapshot.loads(snapshot.dumps(data))
+
+        matrix = restored.pop("matrix")
+        assert matrix.dtype == np.float32 and matrix.shape == (3, 4)
+        np.testing.assert_array_equal(matrix, data.pop("matrix"))
+        assert restored.pop("empty").dtype == np.int16
+        data.pop("empty")
+        assert restored == data
+        assert isinstance(restored["tuples"][1], tuple)
+
+    def test_rejects_bad_input(self):
+        """Test that invalid values and buffers raise errors."""
+        with pytest.raises(TypeError, match="object"):
+            snapshot.dumps({"x": object()})
+        with pytest.raises(ValueError, match="bad magic"):
+            snapshot.loads(b"NOTASNAPSHOT" + bytes(16))
+        with pytest.raises(ValueError, match="Truncated"):
+            snapshot.loads(snapshot.dumps({"a": np.zeros(100)})[:-64])
+
+    def test_canvas_round_trip_memory_mapped(self, tmp_path, canvas_manager):
+        """Test that a canvas round-trips with arrays mapped from the file."""
+        widgets = [
+            ButtonWidget("ok", label="OK"),
+            LineChartWidget("line", x_data=np.arange(10_000.0), y_data=np.ones(10_000)),
+            HeatmapWidget("heat", values=np.eye(8, dtype=np.float32)),
+        ]
+        widgets[0].set_position(10, 20)
+        path = tmp_path / "canvas.snap"
+        snapshot.save(canvas_data(widgets), path)
+
+        data = snapshot.load(path)
+        canvas_manager._auto_start = False
+        canvas = UISerializer.deserialize_canvas(data, canvas_manager)
+
+        line = canvas.get_widget("line").state.properties
+        assert not line["x_data"].flags.writeable
+        np.testing.assert_array_equal(line["x_data"], np.arange(10_000.0))
+        heat = canvas.get_widget("heat").state.properties["values"]
+        assert heat.dtype == np.float32 and heat.shape == (8, 8)
+        assert canvas.get_widget("ok").state.position == (10, 20)
+        assert [w.serialize() for w in canvas.snapshot_widgets()] == [
+            w.serialize() for w in widgets
+        ]
+
+    def test_save_keeps_mapped_snapshot_readable(self, tmp_path):
+        """Test that overwriting a mapped snapshot does not truncate it."""
+        path = tmp_path / "canvas.snap"
+        snapshot.save({"a": np.arange(100_000.0)}, path)
+        mapped = snapshot.load(path)
+
+        snapshot.save({"a": np.zeros(1)}, path)
+
+        assert mapped["a"][-1] == 99_999.0
+        np.testing.assert_array_equal(snapshot.load(path)["a"], np.zeros(1))
+        assert [p.name for p in tmp_path.iterdir()] == ["canvas.snap"]
@@ -1,10 +1,14 @@
 """Unit tests for widget implementations."""
 
+from imgui_bundle import imgui
+
 from champi_gen_ui.widgets.basic import (
     ButtonWidget,
     CheckboxWidget,
     InputTextWidget,
+    ListBoxWidget,
     TextWidget,
+    VirtualListWidget,
 )
 from champi_gen_ui.widgets.slider import SliderFloatWidget, SliderIntWidget
 
@@ -152,6 +156,62 @@ class TestSliderFloatWidget:
         assert slider.get_value() == 0.75
 
 
+class TestVirtualListWidget:
+    """Tests for VirtualListWidget and clipped list rendering."""
+
+    def test_append_items(self):
+        """Test appending items."""
+        log = VirtualListWidget(widget_id="log1", items=["a"])
+        log.append_items(["b", "c"])
+        assert log.state.properties["items"] == ["a", "b", "c"]
+
+    def test_renders_only_visible_rows(self, imgui_context, monkeypatch):
+        """Test that only rows in the scroll region issue ImGui calls."""
+        calls = []
+        original = imgui.text_unformatted
+
+        def counting_text(text, *args):
+            calls.append(text)
+            return original(text, *args)
+
+        monkeypatch.setattr(imgui, "text_unformatted", counting_text)
+        log = VirtualListWidget(
+            widget_id="log1", items=[f"row {i}" for i in range(50_000)], height=200
+        )
+
+        for _ in range(2):
+            calls.clear()
+            imgui.new_frame()
+            imgui.begin("Test")
+            log.render()
+            imgui.end()
+            imgui.render()
+
+        assert 0 < len(calls) < 100
+
+    def test_list_box_renders_only_visible_rows(self, imgui_context, monkeypatch):
+        """Test that ListBoxWidget clips its rows."""
+        calls = []
+        original = imgui.selectable
+
+        def counting_selectable(label, *args):
+            calls.append(label)
+            return original(label, *args)
+
+        monkeypatch.setattr(imgui, "selectable", counting_selectable)
+        list_box = ListBoxWidget(
+            widget_id="list1", items=[f"item {i}" for i in range(10_000)]
+        )
+
+        imgui.new_frame()
+        imgui.begin("Test")
+        list_box.render()
+        imgui.end()
+        imgui.render()
+
+        assert 0 < len(calls) < 50
+
+
 class TestWidgetVisibility:
     """Tests for widget visibility and enabled state."""
 
@@ -184,3 +244,52 @@ class TestWidgetPosition:
         button = ButtonWidget(widget_id="btn1", label="Test")
         button.set_size(150, 40)
         assert button.state.size == (150, 40)
+
+
+class TestWidgetState:
+    """Tests for the compact widget state."""
+
+    def test_slotted_with_shared_empty_containers(self):
+        """Test that untouched containers are shared and read-only."""
+        first = ButtonWidget(widget_id="btn1", label="One")
+        second = TextWidget(widget_id="txt1", text="Two")
+
+        assert not hasattr(first.state, "__dict__")
+        assert first.state.callbacks is second.state.callbacks
+        assert first.state.data_bindings is second.state.data_bindings
+        assert first.state.children is second.state.children
+        assert not first.state.children
+        assert first._callbacks is None
+
+    def test_writes_do_not_leak_between_widgets(self):
+        """Test that the first write allocates a per-widget container."""
+        first = ButtonWidget(widget_id="btn1", label="One")
+        second = ButtonWidget(widget_id="btn2", label="Two")
+
+        first.register_callback("on_click", print)
+        first.state.set_binding("label", "user.name")
+        first.state.add_child("child")
+        first.state.add_child("child")
+
+        assert first.state.callbacks == {"on_click": "print"}
+        assert first.state.data_bindings == {"label": "user.name"}
+        assert list(first.state.children) == ["child"]
+        assert second.state.callbacks == {}
+        assert second.state.data_bindings == {}
+        assert second.trigger_callback("on_click") is None
+
+        first.state.remove_binding("label")
+        first.state.remove_child("child")
+        assert first.state.data_bindings is second.state.data_bindings
+        assert first.state.children is second.state.children
+
+    def test_to_dict_returns_plain_containers(self):
+        """Test that serialized state is JSON-ready and detached."""
+        button = ButtonWidget(widget_id="btn1", label="Test")
+        button.state.add_child("child")
+        data = button.serialize()
+
+        assert data["children"] == ["child"]
+        assert type(data["callbacks"]) is dict
+        data["properties"]["label"] = "Changed"
+        assert button.state.properties["label"] == "Test"